@@ -0,0 +1,52 @@
+"""
+The main classes of all sub-projects are available directly from this package,
+e.g. 'from unittest_training import TextfileWriter'.
+
+The sub-modules are only imported when one of their classes is accessed for
+the first time, so that importing the package itself is (almost) free and
+has no side effects.
+"""
+
+import importlib
+from typing import Any, List
+
+# The lazily loaded attributes: name -> module defining it
+_LAZY_ATTRIBUTES = {
+    "Calculator": "unittest_training.basics.calculator_basics",
+    "CalculatorMocking": "unittest_training.mocking.calculator_mocking",
+    "UserManager": "unittest_training.fixtures.user_manager_fixtures",
+    "ConcurrentUserManager": "unittest_training.fixtures.concurrent_user_manager",
+    "CompactUserManager": "unittest_training.fixtures.compact_user_manager",
+    "SQLiteUserStorage": "unittest_training.fixtures.user_storage",
+    "BloomFilter": "unittest_training.fixtures.bloom_filter",
+    "write_snapshot": "unittest_training.fixtures.user_snapshot",
+    "restore_snapshot": "unittest_training.fixtures.user_snapshot",
+    "UsernameSearchIndex": "unittest_training.fixtures.username_search_index",
+    "TextfileWriter": "unittest_training.projects.textfile_writer.textfile_writer",
+    "Durability": "unittest_training.projects.textfile_writer.textfile_writer",
+    "AsyncTextfileWriter": (
+        "unittest_training.projects.textfile_writer.async_textfile_writer"
+    ),
+    "TextfileAppender": "unittest_training.projects.textfile_writer.textfile_appender",
+    "compile_expression": (
+        "unittest_training.projects.calculator_engine.expression_evaluator"
+    ),
+    "CachedCalculator": "unittest_training.projects.calculator_engine.calculator_cache",
+    "BatchExecutor": "unittest_training.projects.calculator_engine.batch_executor",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    # cached, so that '__getattr__' is only called with the first access
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,4 +1,11 @@
-from typing import Union
+import array
+import decimal
+import math
+import operator
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from typing import List, Optional, Sequence, Union
 
 
 class DivisionByZeroError(Exception):
@@ -10,6 +17,22 @@ class DivisionByZeroError(Exception):
     pass
 
 
+class BatchDivisionByZeroError(DivisionByZeroError):
+    """
+    A custom domain-specific Exception
+    for dividing by zero in a batch division.
+    It holds the indices of all zero denominators.
+    """
+
+    def __init__(self, message: str, indices: List[int]):
+        super().__init__(message)
+        self.indices = indices
+
+    def __reduce__(self):
+        # keeps the indices when the exception is pickled (e.g. between processes)
+        return (type(self), (self.args[0], self.indices))
+
+
 class InvalidInputError(Exception):
     """
     A custom domain-specific Exception
@@ -19,23 +42,64 @@ class InvalidInputError(Exception):
     pass
 
 
+class DivisionMode(Enum):
+    """
+    The type of the result of 'Calculator.divide'.
+    """
+
+    FLOAT = "float"  # a float (the default)
+    FLOOR_INT = "floor-int"  # an int, rounded towards negative infinity
+    DECIMAL = "decimal"  # a 'decimal.Decimal', rounded according to a context
+    FRACTION = "fraction"  # an exact 'fractions.Fraction'
+
+
+# The operand types accepted by the modes other than FLOAT
+_EXACT_OPERAND_TYPES = (int, float, Decimal, Fraction)
+
+
 class Calculator:
     @staticmethod
-    def divide(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    def divide(
+        a: Union[int, float, Decimal, Fraction],
+        b: Union[int, float, Decimal, Fraction],
+        mode: DivisionMode = DivisionMode.FLOAT,
+        context: Optional[decimal.Context] = None,
+    ) -> Union[int, float, Decimal, Fraction]:
         """
         Divide 'a' by 'b'.
 
+        By default (FLOAT), only int/float operands are accepted and the
+        result is a float. The other modes also accept 'Decimal' and
+        'Fraction' operands, which (like floats) are converted exactly:
+         - FLOOR_INT: the exact quotient, rounded down to an int.
+         - DECIMAL: a 'Decimal', rounded according to 'context'.
+         - FRACTION: the exact quotient as a 'Fraction'.
+
         Args:
-            a (int | float): Numerator.
-            b (int | float): Denominator.
+            a (int | float | Decimal | Fraction): Numerator.
+            b (int | float | Decimal | Fraction): Denominator.
+            mode (DivisionMode): The type of the result.
+            context (Optional[decimal.Context]): The context for the DECIMAL
+                                                 mode (default: the current
+                                                 context of the thread).
 
         Returns:
-            float: The result of the division.
+            float | int | Decimal | Fraction: The result of the division
+                                              (the type depends on 'mode').
 
         Raises:
             DivisionByZeroError: If denominator is zero.
-            InvalidInputError: If a and/or b are not int/float.
+            InvalidInputError: If a and/or b are not int/float (resp. not
+                               int/float/Decimal/Fraction in the other modes),
+                               if an operand is not finite in the FLOOR_INT or
+                               FRACTION mode, or if 'mode' or 'context' is invalid.
         """
+        if mode is not DivisionMode.FLOAT:
+            return _divide_exact(a=a, b=b, mode=mode, context=context)
+
+        if context is not None:
+            raise InvalidInputError("A context is only used in the DECIMAL mode.")
+
         if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
             raise InvalidInputError("Operands must be int or float.")
 
@@ -48,6 +112,187 @@ class Calculator:
 
         return a / b
 
+    @staticmethod
+    def divide_many(
+        a: Union[Sequence[Union[int, float]], array.array, "numpy.ndarray"],
+        b: Union[int, float, Sequence[Union[int, float]], array.array, "numpy.ndarray"],
+        return_mask: bool = False,
+    ):
+        """
+        Divide every element of 'a' by the corresponding element of 'b'
+        (or by 'b' itself, if 'b' is a single number) in one pass.
+
+        Lists, tuples and 'array.array's are divided in pure Python and a list
+        is returned. If 'a' or 'b' is a NumPy array, the division is conducted
+        by NumPy and a NumPy array is returned.
+
+        Unlike calling 'divide' per element, a zero denominator does not stop
+        the division at the first occurrence: either all zero positions are
+        reported together, or (with 'return_mask') they are masked.
+
+        Args:
+            a (Sequence | array.array | numpy.ndarray): Numerators.
+            b (int | float | Sequence | array.array | numpy.ndarray): Denominators.
+            return_mask (bool): If True, zero denominators do not raise; instead
+                                NaN is returned at those positions, together with
+                                a mask which is True at those positions.
+
+        Returns:
+            The results of the divisions (list of floats resp. NumPy array),
+            or, with 'return_mask', a tuple of the results and the zero-mask.
+
+        Raises:
+            BatchDivisionByZeroError: If at least one denominator is zero (and
+                                      'return_mask' is False); its 'indices'
+                                      hold the positions of all zero denominators.
+            InvalidInputError: If an element is not int/float, or if 'a' and 'b'
+                               differ in length.
+        """
+        if _is_numpy_value(a) or _is_numpy_value(b):
+            return _divide_many_numpy(a=a, b=b, return_mask=return_mask)
+
+        _validate_numeric_sequence(a)
+        if isinstance(b, (int, float)):
+            zero_indices = list(range(len(a))) if b == 0 else []
+            if not zero_indices:
+                results = [numerator / b for numerator in a]
+        else:
+            _validate_numeric_sequence(b)
+            if len(a) != len(b):
+                raise InvalidInputError("Operands must be of the same length.")
+
+            zero_indices = [index for index, value in enumerate(b) if value == 0]
+            if not zero_indices:
+                results = list(map(operator.truediv, a, b))
+
+        if zero_indices and not return_mask:
+            raise BatchDivisionByZeroError(
+                "Denominator cannot be zero.", indices=zero_indices
+            )
+
+        if not return_mask:
+            return results
+
+        zero_mask = [False] * len(a)
+        for index in zero_indices:
+            zero_mask[index] = True
+
+        if zero_indices:
+            denominators = [b] * len(a) if isinstance(b, (int, float)) else b
+            results = [
+                math.nan if is_zero else numerator / denominator
+                for numerator, denominator, is_zero in zip(a, denominators, zero_mask)
+            ]
+
+        return results, zero_mask
+
+
+def _divide_exact(a, b, mode: DivisionMode, context: Optional[decimal.Context]):
+    """
+    The implementation of 'Calculator.divide' for all modes except FLOAT.
+    """
+    if not isinstance(mode, DivisionMode):
+        raise InvalidInputError(f"Invalid division mode: {mode!r}.")
+    if not isinstance(a, _EXACT_OPERAND_TYPES) or not isinstance(
+        b, _EXACT_OPERAND_TYPES
+    ):
+        raise InvalidInputError("Operands must be int, float, Decimal or Fraction.")
+    if mode is not DivisionMode.DECIMAL and context is not None:
+        raise InvalidInputError("A context is only used in the DECIMAL mode.")
+
+    if b == 0:
+        raise DivisionByZeroError("Denominator cannot be zero.")
+
+    if mode is DivisionMode.DECIMAL:
+        if context is None:
+            context = decimal.getcontext()
+        elif not isinstance(context, decimal.Context):
+            raise InvalidInputError("'context' needs to be a 'decimal.Context'.")
+        return context.divide(_to_decimal(a, context), _to_decimal(b, context))
+
+    if mode is DivisionMode.FLOOR_INT and type(a) is int and type(b) is int:
+        # the common case needs no conversion
+        return a // b
+
+    try:
+        quotient = Fraction(a) / Fraction(b)
+    except (ValueError, OverflowError):
+        # infinities and NaNs have no exact (rational) value
+        raise InvalidInputError("Operands must be finite.")
+
+    if mode is DivisionMode.FLOOR_INT:
+        return math.floor(quotient)
+
+    return quotient
+
+
+def _to_decimal(value, context: decimal.Context) -> Decimal:
+    """
+    Converts 'value' exactly to a 'Decimal' (a 'Fraction', which may have
+    no finite decimal representation, is rounded according to 'context').
+    """
+    if isinstance(value, Fraction):
+        return context.divide(Decimal(value.numerator), Decimal(value.denominator))
+
+    return Decimal(value)
+
+
+def _is_numpy_value(value) -> bool:
+    # NumPy arrays and scalars are detected via the module of their type,
+    # so that NumPy is only imported (and required) when it is actually used
+    return type(value).__module__ == "numpy"
+
+
+def _validate_numeric_sequence(values: Union[Sequence, array.array]):
+    """
+    Checks that every element of 'values' is an int or a float.
+
+    Raises:
+        InvalidInputError: If 'values' is not a sequence of ints/floats.
+    """
+    if isinstance(values, array.array):
+        # all typecodes except the (unicode) character ones are numeric
+        if values.typecode in ("u", "w"):
+            raise InvalidInputError("Operands must be int or float.")
+        return
+
+    if isinstance(values, (str, bytes)) or not hasattr(values, "__len__"):
+        raise InvalidInputError("Operands must be sequences of int or float.")
+
+    # checking every distinct type once is much cheaper than every element
+    for value_type in set(map(type, values)):
+        if not issubclass(value_type, (int, float)):
+            raise InvalidInputError("Operands must be int or float.")
+
+
+def _divide_many_numpy(a, b, return_mask: bool):
+    """
+    The NumPy-implementation of 'Calculator.divide_many'.
+    """
+    import numpy as np
+
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if a.dtype.kind not in "biuf" or b.dtype.kind not in "biuf":
+        raise InvalidInputError("Operands must be int or float.")
+    if b.ndim and a.shape != b.shape:
+        raise InvalidInputError("Operands must be of the same length.")
+
+    zero_mask = np.broadcast_to(b == 0, a.shape)
+    if zero_mask.any() and not return_mask:
+        raise BatchDivisionByZeroError(
+            "Denominator cannot be zero.", indices=np.flatnonzero(zero_mask).tolist()
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        results = np.true_divide(a, b, dtype=np.float64)
+
+    if not return_mask:
+        return results
+
+    results[zero_mask] = np.nan
+    return results, zero_mask.copy()
+
 
 # print(Calculator.divide(4,2))
 # print(type(Calculator.divide(4,2)))
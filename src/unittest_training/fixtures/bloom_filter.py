@@ -0,0 +1,152 @@
+import math
+import threading
+from collections import namedtuple
+from typing import Iterable, List, Tuple
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+# The counters of the lookups through a Bloom filter (see 'UserManager')
+BloomFilterInfo = namedtuple(
+    "BloomFilterInfo", ["hits", "misses", "false_positives", "size", "nbytes"]
+)
+
+_MASK_32 = (1 << 32) - 1
+_MASK_64 = (1 << 64) - 1
+
+
+def _hash_pair(value: str) -> Tuple[int, int]:
+    """
+    Returns two 32-bit hashes of 'value', from which the bit positions are
+    derived ("double hashing"): the two halves of its 64-bit 'hash'.
+
+    'hash' differs between processes (hash randomization), which does not
+    matter since a 'BloomFilter' is never persisted; in exchange, it is
+    computed only once per str-object and cached.
+    """
+    value_hash = hash(value) & _MASK_64
+    # the second hash is odd, so that the positions never all coincide
+    return value_hash & _MASK_32, (value_hash >> 32) | 1
+
+
+class _Stage:
+    """
+    A classic Bloom filter of fixed size, i.e. one stage of 'BloomFilter'.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        # the optimal number of bits and of hash functions for 'capacity' values
+        self.bit_count = max(
+            8,
+            math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2),
+        )
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.count = 0
+
+    def add(self, first_hash: int, second_hash: int):
+        bits, bit_count = self.bits, self.bit_count
+        for i in range(self.hash_count):
+            position = (first_hash + i * second_hash) % bit_count
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, hashes: Tuple[int, int]) -> bool:
+        first_hash, second_hash = hashes
+        bits, bit_count = self.bits, self.bit_count
+        for i in range(self.hash_count):
+            position = (first_hash + i * second_hash) % bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class BloomFilter:
+    """
+    A probabilistic set of strings: 'value in bloom_filter' is False if
+    'value' was definitely never added, and True if it was added - or, with
+    a probability of at most 'false_positive_rate', if it was not
+    (a "false positive"). Values can not be removed.
+
+    With up to 'capacity' values, it needs ~1.4 bytes per value for a
+    false-positive-rate of 1% (~2 bytes for 0.1%), independent of the
+    length of the values.
+
+    Once more than 'capacity' values were added, the false-positive-rate
+    would rise; instead, a new stage with twice the capacity and half the
+    false-positive-rate is appended ("scalable Bloom filter"), so that the
+    false-positive-rate stays at about 'false_positive_rate' regardless of
+    the number of values. Every additional stage makes lookups a bit slower,
+    so a good 'capacity' should be given if the number of values is known.
+
+    Adding is thread-safe, lookups take no lock.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ):
+        """
+        Args:
+            capacity (int): The expected number of values.
+            false_positive_rate (float): The maximum probability of a
+                                         false positive, in (0, 1).
+
+        Raises:
+            ValueError: If 'capacity' is not a positive integer or
+                        'false_positive_rate' is not in (0, 1).
+        """
+        if not isinstance(capacity, int) or isinstance(capacity, bool) or capacity < 1:
+            raise ValueError("'capacity' needs to be a positive integer.")
+        if not isinstance(false_positive_rate, (int, float)) or not (
+            0 < false_positive_rate < 1
+        ):
+            raise ValueError("'false_positive_rate' needs to be in (0, 1).")
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        # the false-positive-rates of the stages add up to (at most)
+        # 'false_positive_rate': 1/2 + 1/4 + 1/8 + ...
+        self._stages: List[_Stage] = [_Stage(capacity, false_positive_rate / 2)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(stage.count for stage in self._stages)
+
+    def __contains__(self, value: str) -> bool:
+        hashes = _hash_pair(value)
+        # the newest stage is the largest one, thus the most likely to contain it
+        for stage in reversed(self._stages):
+            if hashes in stage:
+                return True
+        return False
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the bits of all stages.
+        """
+        return sum(len(stage.bits) for stage in self._stages)
+
+    @property
+    def stage_count(self) -> int:
+        return len(self._stages)
+
+    def add(self, value: str):
+        first_hash, second_hash = _hash_pair(value)
+        with self._lock:
+            stage = self._stages[-1]
+            if stage.count >= stage.capacity:
+                stage = _Stage(stage.capacity * 2, stage.false_positive_rate / 2)
+                self._stages.append(stage)
+            stage.add(first_hash, second_hash)
+
+    def update(self, values: Iterable[str]):
+        """
+        Adds all 'values'.
+        """
+        for value in values:
+            self.add(value)
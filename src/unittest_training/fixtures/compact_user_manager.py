@@ -0,0 +1,223 @@
+"""
+A memory-compact alternative to 'UserManager' for very large numbers of users.
+
+Memory per user, measured via 'measure_memory_per_user' (1,000,000 users with
+usernames like "user 123456" and emails like "user123456@example.com", i.e.
+~34 bytes of raw data per user; CPython 3.11, 64-bit Linux):
+
+    dict of str to str (UserManager.users alone)   ~ 160 bytes per user
+    UserManager (incl. its email-index)            ~ 260 bytes per user
+    CompactUserManager                             ~  60 bytes per user
+
+The dict needs two 'str'-objects per user (each with ~50 bytes of object
+header) plus a hash-table entry incl. spare capacity. 'CompactUserManager'
+stores the raw UTF-8 bytes of all users in one 'bytearray' and only a few
+fixed-size numbers per user in 'array.array's (~25 bytes per user).
+"""
+
+import array
+import tracemalloc
+from typing import Callable, Iterator, Tuple, Union
+
+from unittest_training.fixtures.user_manager_fixtures import (
+    DuplicateUserError,
+    InvalidInputError,
+    MissingUserError,
+    UserManager,
+)
+
+_EMPTY_SLOT = -1
+_HASH_MASK = 0xFFFFFFFF
+_INITIAL_TABLE_SIZE = 8
+
+
+def _encode(value: str) -> bytes:
+    # 'surrogatepass', so that every str (even one with lone surrogates)
+    # can be stored and decoded again
+    return value.encode("utf-8", "surrogatepass")
+
+
+def _decode(value: Union[bytes, bytearray, memoryview]) -> str:
+    return str(value, "utf-8", "surrogatepass")
+
+
+class CompactUserManager:
+    """
+    Manages a collection of users like 'UserManager' (same 'addUser' and
+    'getUserEmail' and the same exceptions), but stores them compactly.
+
+    The UTF-8 encoded username and email of every user are appended to one
+    byte-arena. Per user, only the offset of its record in the arena, the
+    length of its username and a 32-bit hash of its username are stored
+    (in 'array.array's, i.e. as raw numbers instead of Python objects).
+    Users are found via an open-addressing hash table (linear probing),
+    which holds the positions of the users as 32-bit numbers.
+
+    Looking up a user encodes the username, probes the table in Python and
+    compares bytes, so it is several times slower than a dict lookup; in
+    exchange, the memory per user is less than half of the dict´s (see the
+    module docstring).
+    """
+
+    def __init__(self):
+        self._arena = bytearray()
+        # the start offset of every user´s record, plus the end of the last one
+        self._offsets = array.array("Q", [0])
+        self._username_lengths = array.array("I")
+        self._hashes = array.array("I")
+        self._table = array.array("i", [_EMPTY_SLOT]) * _INITIAL_TABLE_SIZE
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, username: object) -> bool:
+        return isinstance(username, str) and self._find(_encode(username))[0] >= 0
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the buffers of all users
+        (without the spare capacity of the buffers).
+        """
+        return len(self._arena) + sum(
+            buffer.itemsize * len(buffer)
+            for buffer in (
+                self._offsets,
+                self._username_lengths,
+                self._hashes,
+                self._table,
+            )
+        )
+
+    def addUser(self, username: str, email: str) -> bool:
+        if not isinstance(username, str) or not isinstance(email, str):
+            raise InvalidInputError(
+                "Both 'username' and 'email' need to be of type 'str'."
+            )
+
+        encoded_username = _encode(username)
+        position, slot, username_hash = self._find(encoded_username)
+        if position >= 0:
+            raise DuplicateUserError("User already exists.")
+
+        self._arena += encoded_username
+        self._arena += _encode(email)
+        self._offsets.append(len(self._arena))
+        self._username_lengths.append(len(encoded_username))
+        self._hashes.append(username_hash)
+        self._table[slot] = len(self._hashes) - 1
+
+        # at most 2/3 of the slots are used, so that the probe-sequences stay short
+        if len(self._hashes) * 3 >= len(self._table) * 2:
+            self._grow_table()
+
+        return True
+
+    def getUserEmail(self, username) -> str:
+        if not isinstance(username, str):
+            raise InvalidInputError("'username' needs to be of type 'str'.")
+
+        position = self._find(_encode(username))[0]
+        if position < 0:
+            raise MissingUserError(
+                "The user you look for is not contained in the database."
+            )
+
+        return _decode(
+            self._arena[
+                self._offsets[position]
+                + self._username_lengths[position] : self._offsets[position + 1]
+            ]
+        )
+
+    def iterUsers(self) -> Iterator[Tuple[str, str]]:
+        """
+        Iterates over the (username, email)-pairs of all users,
+        in the order they were added.
+        """
+        for position in range(len(self)):
+            start = self._offsets[position]
+            split = start + self._username_lengths[position]
+            yield (
+                _decode(self._arena[start:split]),
+                _decode(self._arena[split : self._offsets[position + 1]]),
+            )
+
+    def _find(self, encoded_username: bytes) -> Tuple[int, int, int]:
+        """
+        Looks up a user in the hash table.
+
+        Returns:
+            Tuple[int, int, int]: The position of the user (-1 if it is not
+                                  contained), the slot of the user (or the
+                                  empty slot where it would be inserted),
+                                  and the hash of the username.
+        """
+        username_hash = hash(encoded_username) & _HASH_MASK
+        mask = len(self._table) - 1
+        slot = username_hash & mask
+        length = len(encoded_username)
+
+        while True:
+            position = self._table[slot]
+            if position == _EMPTY_SLOT:
+                return -1, slot, username_hash
+
+            if (
+                self._hashes[position] == username_hash
+                and self._username_lengths[position] == length
+            ):
+                start = self._offsets[position]
+                if self._arena[start : start + length] == encoded_username:
+                    return position, slot, username_hash
+
+            slot = (slot + 1) & mask
+
+    def _grow_table(self):
+        table = array.array("i", [_EMPTY_SLOT]) * (len(self._table) * 2)
+        mask = len(table) - 1
+        for position, username_hash in enumerate(self._hashes):
+            slot = username_hash & mask
+            while table[slot] != _EMPTY_SLOT:
+                slot = (slot + 1) & mask
+            table[slot] = position
+
+        self._table = table
+
+
+def measure_memory_per_user(
+    manager_factory: Callable[[], object] = CompactUserManager,
+    user_count: int = 1_000_000,
+) -> float:
+    """
+    Measures the memory per user of a user manager via 'tracemalloc'.
+
+    Args:
+        manager_factory (Callable[[], object]): Creates the (empty) manager,
+                                                e.g. 'UserManager' or
+                                                'CompactUserManager'.
+        user_count (int): The number of users to add.
+
+    Returns:
+        float: The number of bytes allocated per user.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        manager = manager_factory()
+        for i in range(user_count):
+            manager.addUser(username=f"user {i}", email=f"user{i}@example.com")
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / user_count
+
+
+if __name__ == "__main__":
+    for manager_factory in (UserManager, CompactUserManager):
+        print(
+            f"{manager_factory.__name__:<20} "
+            f"{measure_memory_per_user(manager_factory=manager_factory):>6.1f} "
+            "bytes per user"
+        )
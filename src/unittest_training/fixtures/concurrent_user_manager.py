@@ -0,0 +1,152 @@
+import threading
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from unittest_training.fixtures.bloom_filter import DEFAULT_FALSE_POSITIVE_RATE
+from unittest_training.fixtures.user_manager_fixtures import (
+    InvalidInputError,
+    UserManager,
+)
+from unittest_training.fixtures.username_search_index import UsernameSearchIndex
+
+if TYPE_CHECKING:
+    # only needed for the annotations; importing it would import 'sqlite3'
+    from unittest_training.fixtures.user_storage import UserStorage
+
+DEFAULT_STRIPES = 64
+
+
+class ConcurrentUserManager(UserManager):
+    """
+    A 'UserManager' which can safely be shared between many threads.
+
+    'addUser' checks whether the user already exists and then inserts it;
+    without synchronization, two threads could both pass the check for the
+    same username (resp. the same email-address with 'unique_emails').
+    Instead of one lock for all users, every username (and every normalized
+    email-address) is mapped to one of 'stripes' locks by its hash, so that
+    only writers of the same stripe wait for each other.
+
+    Readers ('getUserEmail', 'getUserByEmail') take no lock at all: they
+    only conduct single lookups, which are atomic on dicts, and thus never
+    contend with writers.
+
+    To avoid deadlocks, a writer always acquires its username-lock before
+    its email-lock, and 'addUsers' acquires all username-locks in order.
+
+    Unlike 'UserManager', the email-index is built right away (instead of
+    with its first use), so that it never has to be built while other
+    threads add users. The search-index is built with the first search,
+    and the Bloom filter is rebuilt, while all writers are excluded.
+    """
+
+    def __init__(
+        self,
+        unique_emails: bool = False,
+        storage: Optional["UserStorage"] = None,
+        stripes: int = DEFAULT_STRIPES,
+        bloom_filter: bool = False,
+        bloom_filter_false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ):
+        """
+        Args:
+            unique_emails (bool): Whether an email-address may only belong
+                                  to a single user.
+            storage (Optional[UserStorage]): Where the users are stored
+                                             (default: a new dict).
+            stripes (int): The number of locks the usernames
+                           (resp. email-addresses) are distributed to.
+            bloom_filter (bool): Whether a Bloom filter of the usernames is
+                                 kept in front of the storage.
+            bloom_filter_false_positive_rate (float): The maximum share of
+                                                      the lookups of missing
+                                                      users, which still
+                                                      access the storage.
+
+        Raises:
+            ValueError: If 'stripes' is not a positive integer, or
+                        'bloom_filter_false_positive_rate' is not in (0, 1).
+        """
+        if not isinstance(stripes, int) or stripes < 1:
+            raise ValueError("'stripes' needs to be a positive integer.")
+
+        # the locks are needed by 'rebuildBloomFilter' already
+        self.stripes = stripes
+        self._username_locks = [threading.Lock() for _ in range(stripes)]
+        self._email_locks = [threading.Lock() for _ in range(stripes)]
+        # writers of different stripes count their added users concurrently
+        self._count_lock = threading.Lock()
+        super().__init__(
+            unique_emails=unique_emails,
+            storage=storage,
+            bloom_filter=bloom_filter,
+            bloom_filter_false_positive_rate=bloom_filter_false_positive_rate,
+        )
+        self._getEmailIndex()
+
+    def addUser(self, username: str, email: str) -> bool:
+        if not isinstance(username, str) or not isinstance(email, str):
+            raise InvalidInputError(
+                "Both 'username' and 'email' need to be of type 'str'."
+            )
+
+        with self._username_locks[hash(username) % self.stripes]:
+            if not self.unique_emails:
+                return super().addUser(username=username, email=email)
+
+            email_lock = self._email_locks[
+                hash(self._normalize_email(email)) % self.stripes
+            ]
+            with email_lock:
+                return super().addUser(username=username, email=email)
+
+    def addUsers(
+        self, users: Iterable[Tuple[str, str]], all_or_nothing: bool = True
+    ) -> List[Tuple[int, Exception]]:
+        # a batch may touch every stripe, so all writers are excluded
+        # while it is validated and added
+        with ExitStack() as stack:
+            for lock in self._username_locks:
+                stack.enter_context(lock)
+
+            return super().addUsers(users=users, all_or_nothing=all_or_nothing)
+
+    def _getSearchIndex(self) -> UsernameSearchIndex:
+        if self._search_index is None:
+            # no user may be added between reading all users and
+            # publishing the index (it would be missing from the index)
+            with ExitStack() as stack:
+                for lock in self._username_locks:
+                    stack.enter_context(lock)
+
+                return super()._getSearchIndex()
+
+        return self._search_index
+
+    def rebuildBloomFilter(self):
+        # a user added while the stored users are read could be missing
+        # from the new filter, which must never happen
+        with ExitStack() as stack:
+            for lock in self._username_locks:
+                stack.enter_context(lock)
+
+            super().rebuildBloomFilter()
+
+    def _restoreUsers(self, users: Dict[str, str]):
+        with ExitStack() as stack:
+            for lock in self._username_locks:
+                stack.enter_context(lock)
+
+            super()._restoreUsers(users=users)
+
+    def _countAddedUsers(self, count: int):
+        with self._count_lock:
+            super()._countAddedUsers(count=count)
+
+    def _copyUsers(self, start: int = 0) -> Tuple[List[Tuple[str, str]], int, int]:
+        # a user added while the users are copied could be half in the copy
+        with ExitStack() as stack:
+            for lock in self._username_locks:
+                stack.enter_context(lock)
+
+            return super()._copyUsers(start=start)
@@ -0,0 +1,242 @@
+"""
+Stress benchmark for the concurrent use of 'UserManager' and
+'ConcurrentUserManager'.
+
+Usage:
+    python -m unittest_training.fixtures.user_manager_benchmark \
+        --threads 1 2 4 8 --read-ratio 0.9 [--output results.json]
+
+Every thread conducts the same number of operations: 'getUserEmail'-calls
+for existing users (reads) and 'addUser'-calls for new users (writes),
+mixed according to the read-ratio. For every manager and thread count,
+the operations per second are reported, and it is checked that no
+added user got lost.
+
+The managers compared are:
+ - 'global-lock': a 'UserManager' behind a single lock, which every
+   read and write has to acquire (the straightforward way to make it
+   thread-safe).
+ - 'striped': a 'ConcurrentUserManager' (striped locks for writers,
+   lock-free readers).
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from unittest_training.fixtures.concurrent_user_manager import (
+    DEFAULT_STRIPES,
+    ConcurrentUserManager,
+)
+from unittest_training.fixtures.user_manager_fixtures import UserManager
+
+
+class _GlobalLockUserManager(UserManager):
+    """
+    A 'UserManager' which is made thread-safe by a single lock.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def addUser(self, username: str, email: str) -> bool:
+        with self._lock:
+            return super().addUser(username=username, email=email)
+
+    def getUserEmail(self, username) -> str:
+        with self._lock:
+            return super().getUserEmail(username=username)
+
+
+MANAGERS: Dict[str, Callable[[], UserManager]] = {
+    "global-lock": _GlobalLockUserManager,
+    "striped": lambda: ConcurrentUserManager(stripes=DEFAULT_STRIPES),
+}
+
+DEFAULT_CONFIG = {
+    "preloaded_users": 10_000,
+    "operations_per_thread": 20_000,
+    "read_ratio": 0.9,
+}
+
+
+def _run_thread(
+    manager: UserManager,
+    thread_index: int,
+    config: dict,
+    barrier: threading.Barrier,
+    written: List[int],
+):
+    random_generator = random.Random(thread_index)
+    usernames = [
+        f"user {random_generator.randrange(config['preloaded_users'])}"
+        for _ in range(1024)
+    ]
+    is_read = [
+        random_generator.random() < config["read_ratio"]
+        for _ in range(config["operations_per_thread"])
+    ]
+
+    writes = 0
+    barrier.wait()
+    for i, read in enumerate(is_read):
+        if read:
+            manager.getUserEmail(username=usernames[i & 1023])
+        else:
+            manager.addUser(
+                username=f"thread {thread_index} user {i}",
+                email=f"thread{thread_index}.user{i}@test.de",
+            )
+            writes += 1
+
+    written[thread_index] = writes
+
+
+def run_stress(manager_name: str, threads: int, config: Optional[dict] = None) -> dict:
+    """
+    Runs the stress benchmark for one manager and thread count.
+
+    Args:
+        manager_name (str): The name of the manager, one of 'MANAGERS'.
+        threads (int): The number of concurrent threads.
+        config (Optional[dict]): Overrides for 'DEFAULT_CONFIG'.
+
+    Returns:
+        (dict): The results, including whether all added users were found.
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+
+    manager = MANAGERS[manager_name]()
+    manager.addUsers(
+        (f"user {i}", f"user{i}@test.de") for i in range(config["preloaded_users"])
+    )
+
+    # the threads start together, once all of them are prepared
+    barrier = threading.Barrier(threads + 1)
+    written = [0] * threads
+    workers = [
+        threading.Thread(
+            target=_run_thread, args=(manager, i, config, barrier, written)
+        )
+        for i in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - start
+
+    operations = threads * config["operations_per_thread"]
+    return {
+        "manager": manager_name,
+        "threads": threads,
+        "operations": operations,
+        "seconds": seconds,
+        "ops_per_sec": operations / seconds,
+        "consistent": len(manager.users) == config["preloaded_users"] + sum(written),
+    }
+
+
+def run_benchmark(
+    thread_counts: List[int],
+    managers: Optional[List[str]] = None,
+    config: Optional[dict] = None,
+) -> dict:
+    """
+    Runs the stress benchmark for every manager and thread count.
+
+    Args:
+        thread_counts (List[int]): The numbers of concurrent threads.
+        managers (Optional[List[str]]): The names of the managers
+                                        (default: all 'MANAGERS').
+        config (Optional[dict]): Overrides for 'DEFAULT_CONFIG'.
+
+    Returns:
+        (dict): The machine-readable results.
+    """
+    managers = list(MANAGERS) if managers is None else managers
+    config = {**DEFAULT_CONFIG, **(config or {})}
+
+    return {
+        "python": sys.version,
+        # without the GIL (free-threaded builds), the readers scale with the threads
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "config": config,
+        "results": [
+            run_stress(manager_name=manager_name, threads=threads, config=config)
+            for manager_name in managers
+            for threads in thread_counts
+        ],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Stress benchmark for the concurrent use of UserManager."
+    )
+    parser.add_argument(
+        "--threads",
+        nargs="+",
+        type=int,
+        default=[1, 2, 4, 8],
+        help="The thread counts to run (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--manager",
+        nargs="+",
+        choices=list(MANAGERS),
+        default=list(MANAGERS),
+        help="The managers to run (default: all)",
+    )
+    parser.add_argument(
+        "--operations",
+        type=int,
+        default=DEFAULT_CONFIG["operations_per_thread"],
+        help="The number of operations per thread (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--read-ratio",
+        type=float,
+        default=DEFAULT_CONFIG["read_ratio"],
+        help="The share of reads among the operations (default: %(default)s)",
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        thread_counts=args.threads,
+        managers=args.manager,
+        config={
+            "operations_per_thread": args.operations,
+            "read_ratio": args.read_ratio,
+        },
+    )
+
+    print(f"{'manager':<12} {'threads':>7} {'ops/s':>12} {'consistent':>10}")
+    for result in results["results"]:
+        print(
+            f"{result['manager']:<12} {result['threads']:>7} "
+            f"{result['ops_per_sec']:>12.0f} {str(result['consistent']):>10}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if not all(result["consistent"] for result in results["results"]):
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
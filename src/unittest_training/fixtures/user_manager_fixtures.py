@@ -1,3 +1,23 @@
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from unittest_training.fixtures.bloom_filter import (
+    DEFAULT_CAPACITY,
+    DEFAULT_FALSE_POSITIVE_RATE,
+    BloomFilter,
+    BloomFilterInfo,
+)
+from unittest_training.fixtures.username_search_index import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PREFIX_LENGTH,
+    UsernameSearchIndex,
+)
+
+if TYPE_CHECKING:
+    # only needed for the annotations; importing it would import 'sqlite3'
+    from unittest_training.fixtures.user_storage import UserStorage
+
+
 class DuplicateUserError(Exception):
     """
     A custom domain-specific exception for the case of a duplicate user.
@@ -6,6 +26,15 @@ class DuplicateUserError(Exception):
     pass
 
 
+class DuplicateEmailError(Exception):
+    """
+    A custom domain-specific exception for the case of an email-address,
+    which already belongs to another user.
+    """
+
+    pass
+
+
 class InvalidInputError(Exception):
     """
     A custom domain-specific Exception
@@ -29,10 +58,72 @@ class UserManager:
     Manages a collection of users.
 
     For every user, their full name and accompanying email-address are stored.
+
+    Additionally, an index from the normalized email-address (see
+    '_normalize_email') to the username is maintained, so that the user
+    owning an email-address is found without scanning all users.
+
+    The users are stored in a plain dict by default, or in any other
+    'UserStorage' (e.g. the persistent 'SQLiteUserStorage'). For users which
+    are already contained in a given storage, the email-index is only built
+    when it is needed for the first time (by 'getUserByEmail', or by adding
+    users while 'unique_emails'), so that opening a large storage is fast.
+
+    For searching users by the beginning of their username or by a
+    misspelled username, a 'UsernameSearchIndex' is built with the first
+    search and kept up to date by every added user from then on.
+
+    Optionally, a 'BloomFilter' of all usernames is kept in front of the
+    storage: a lookup of a username which the filter definitely does not
+    contain raises 'MissingUserError' (resp. passes the duplicate-check of
+    'addUser') without accessing the storage at all. This pays off once the
+    storage is not a local dict and many lookups are for missing users.
     """
 
-    def __init__(self):
-        self.users = {}
+    def __init__(
+        self,
+        unique_emails: bool = False,
+        storage: Optional["UserStorage"] = None,
+        bloom_filter: bool = False,
+        bloom_filter_false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ):
+        """
+        Args:
+            unique_emails (bool): Whether an email-address may only belong
+                                  to a single user.
+            storage (Optional[UserStorage]): Where the users are stored
+                                             (default: a new dict).
+            bloom_filter (bool): Whether a Bloom filter of the usernames is
+                                 kept in front of the storage (built from the
+                                 users already contained in 'storage').
+            bloom_filter_false_positive_rate (float): The maximum share of
+                                                      the lookups of missing
+                                                      users, which still
+                                                      access the storage.
+
+        Raises:
+            ValueError: If 'bloom_filter_false_positive_rate' is not in (0, 1).
+        """
+        self.users = {} if storage is None else storage
+        self.unique_emails = unique_emails
+        self._usernames_by_email: Optional[Dict[str, str]] = (
+            {} if storage is None else None
+        )
+        self._search_index: Optional[UsernameSearchIndex] = None
+
+        # the number of users added by this manager (so that users removed
+        # from the storage can be noticed), and the last snapshot of the
+        # users (see 'user_snapshot')
+        self._added_user_count = 0
+        self._snapshot_mark: Optional[tuple] = None
+
+        self._bloom_filter: Optional[BloomFilter] = None
+        self._bloom_filter_false_positive_rate = bloom_filter_false_positive_rate
+        self._bloom_filter_hits = 0
+        self._bloom_filter_misses = 0
+        self._bloom_filter_false_positives = 0
+        if bloom_filter:
+            self.rebuildBloomFilter()
 
     def addUser(self, username: str, email: str) -> bool:
         if not isinstance(username, str) or not isinstance(email, str):
@@ -40,26 +131,413 @@ class UserManager:
                 "Both 'username' and 'email' need to be of type 'str'."
             )
 
-        if username in self.users:
+        if (
+            self._bloom_filter is None or username in self._bloom_filter
+        ) and username in self.users:
             raise DuplicateUserError("User already exists.")
 
+        normalized_email = self._normalize_email(email)
+        if self.unique_emails and normalized_email in self._getEmailIndex():
+            raise DuplicateEmailError("Email already belongs to another user.")
+
+        # the filter is updated first, so that it never misses a stored user
+        if self._bloom_filter is not None:
+            self._bloom_filter.add(username)
         self.users[username] = email
+        self._countAddedUsers(count=1)
+        if self._usernames_by_email is not None:
+            # if the email-address is shared, it stays indexed to its first user
+            self._usernames_by_email.setdefault(normalized_email, username)
+        if self._search_index is not None:
+            self._search_index.add(username)
         return True
 
+    def addUsers(
+        self, users: Iterable[Tuple[str, str]], all_or_nothing: bool = True
+    ) -> List[Tuple[int, Exception]]:
+        """
+        Adds many users at once.
+
+        Every entry is validated (in a single pass) against the existing users
+        as well as against the valid entries before it, exactly like by
+        'addUser'; only then the valid entries are added in one go.
+
+        Args:
+            users (Iterable[Tuple[str, str]]): The (username, email)-pairs.
+            all_or_nothing (bool): If True, no user is added if any entry is
+                                   invalid, and the error of the first invalid
+                                   entry is raised. If False, all valid entries
+                                   are added and the errors of the invalid ones
+                                   are returned.
+
+        Returns:
+            List[Tuple[int, Exception]]: The position in 'users' and the error
+                                         of every rejected entry (always empty
+                                         if 'all_or_nothing').
+
+        Raises:
+            InvalidInputError: If an entry is not a pair of two strings
+                               (only if 'all_or_nothing').
+            DuplicateUserError: If a username already exists or appears twice
+                                (only if 'all_or_nothing').
+            DuplicateEmailError: If an email-address already belongs to another
+                                 user or appears twice while 'unique_emails'
+                                 (only if 'all_or_nothing').
+        """
+        unique_emails = self.unique_emails
+        # the index of a storage is only built if it is needed anyway
+        existing_index = self._getEmailIndex() if unique_emails else None
+
+        existing_users = self.users
+        if not isinstance(existing_users, dict):
+            # the usernames of the whole batch are looked up at once,
+            # instead of one storage-access per entry
+            users = list(users)
+            existing_users = self._findStoredUsernames(users=users)
+
+        new_users = {}
+        new_index = {}
+        errors = []
+        for position, entry in enumerate(users):
+            if not isinstance(entry, (tuple, list)) or len(entry) != 2:
+                error = InvalidInputError(
+                    "Every entry needs to be a pair of 'username' and 'email'."
+                )
+            else:
+                username, email = entry
+                if not isinstance(username, str) or not isinstance(email, str):
+                    error = InvalidInputError(
+                        "Both 'username' and 'email' need to be of type 'str'."
+                    )
+                elif username in new_users or username in existing_users:
+                    error = DuplicateUserError("User already exists.")
+                elif not unique_emails:
+                    new_users[username] = email
+                    continue
+                else:
+                    normalized_email = email.strip().lower()
+                    if (
+                        normalized_email in new_index
+                        or normalized_email in existing_index
+                    ):
+                        error = DuplicateEmailError(
+                            "Email already belongs to another user."
+                        )
+                    else:
+                        new_users[username] = email
+                        new_index[normalized_email] = username
+                        continue
+
+            if all_or_nothing:
+                raise error
+            errors.append((position, error))
+
+        if self._bloom_filter is not None:
+            self._bloom_filter.update(new_users)
+        self.users.update(new_users)
+        self._countAddedUsers(count=len(new_users))
+        if self._search_index is not None:
+            self._search_index.add_many(new_users)
+        if self._usernames_by_email is not None:
+            if not unique_emails:
+                # normalized all at once, and built backwards, so that a shared
+                # email-address stays indexed to its first user (like 'addUser')
+                normalized_emails = list(
+                    map(str.lower, map(str.strip, new_users.values()))
+                )
+                new_index = dict(zip(reversed(normalized_emails), reversed(new_users)))
+            self._mergeEmailIndex(new_index=new_index)
+        return errors
+
+    def _findStoredUsernames(self, users: List[Tuple[str, str]]) -> Set[str]:
+        """
+        Returns the usernames of the entries of 'addUsers' which are already
+        stored, looked up in one batch (skipping the ones, which the Bloom
+        filter definitely does not contain).
+        """
+        usernames = [
+            entry[0]
+            for entry in users
+            if isinstance(entry, (tuple, list))
+            and len(entry) == 2
+            and isinstance(entry[0], str)
+        ]
+        if self._bloom_filter is not None:
+            usernames = filter(self._bloom_filter.__contains__, usernames)
+        return self.users.existing_usernames(usernames)
+
+    def _restoreUsers(self, users: Dict[str, str]):
+        """
+        Adds 'users' without validating them, since they are known to be
+        valid and new (e.g. restored from a snapshot).
+        """
+        if self._bloom_filter is not None:
+            self._bloom_filter.update(users)
+        if self._search_index is not None:
+            self._search_index.add_many(users)
+        self.users.update(users)
+        self._countAddedUsers(count=len(users))
+        if self._usernames_by_email is not None:
+            normalized_emails = list(map(str.lower, map(str.strip, users.values())))
+            # built backwards, so that a shared email-address is indexed to its
+            # first user (like in 'addUser')
+            self._mergeEmailIndex(
+                new_index=dict(zip(reversed(normalized_emails), reversed(users)))
+            )
+
+    def _mergeEmailIndex(self, new_index: Dict[str, str]):
+        """
+        Adds 'new_index' (of new users) to the built email-index in one step,
+        so that readers never see a partially updated (or missing) index.
+        Existing email-addresses stay indexed to their first user.
+        """
+        existing_index = self._usernames_by_email
+        if not existing_index.keys().isdisjoint(new_index):
+            for normalized_email in [
+                email for email in new_index if email in existing_index
+            ]:
+                del new_index[normalized_email]
+
+        if existing_index:
+            existing_index.update(new_index)
+        else:
+            # saves copying all new users (e.g. when filling an empty manager)
+            self._usernames_by_email = new_index
+
+    def _countAddedUsers(self, count: int):
+        self._added_user_count += count
+
+    def _copyUsers(self, start: int = 0) -> Tuple[List[Tuple[str, str]], int, int]:
+        """
+        Returns the (username, email)-pairs of the users from the 'start'-th
+        on, in the order they were added (e.g. for writing a snapshot), as
+        well as the number of all users and of the users added by this
+        manager at the time of the copy.
+        """
+        return (
+            list(islice(self.users.items(), start, None)),
+            len(self.users),
+            self._added_user_count,
+        )
+
     def getUserEmail(self, username) -> str:
         if not isinstance(username, str):
             raise InvalidInputError("'username' needs to be of type 'str'.")
 
-        if username not in self.users:
+        bloom_filter = self._bloom_filter
+        if bloom_filter is None:
+            try:
+                return self.users[username]
+            except KeyError:
+                raise MissingUserError(
+                    "The user you look for is not contained in the database."
+                )
+
+        if username not in bloom_filter:
+            self._bloom_filter_misses += 1
             raise MissingUserError(
                 "The user you look for is not contained in the database."
             )
+        try:
+            email = self.users[username]
+        except KeyError:
+            self._bloom_filter_false_positives += 1
+            raise MissingUserError(
+                "The user you look for is not contained in the database."
+            )
+        self._bloom_filter_hits += 1
+        return email
+
+    def getBloomFilterInfo(self) -> Optional[BloomFilterInfo]:
+        """
+        Returns the counters of the lookups of 'getUserEmail' through the
+        Bloom filter (approximate while several threads look up users):
+         - hits: the user was possibly contained and was found in the storage
+         - misses: the user was definitely not contained, and the storage
+           was not accessed
+         - false_positives: the user was possibly contained, but was not
+           found in the storage
+
+        Returns:
+            Optional[BloomFilterInfo]: The counters, the number of usernames
+                                       added to the filter and its size in
+                                       bytes (None without a Bloom filter).
+        """
+        if self._bloom_filter is None:
+            return None
+
+        return BloomFilterInfo(
+            hits=self._bloom_filter_hits,
+            misses=self._bloom_filter_misses,
+            false_positives=self._bloom_filter_false_positives,
+            size=len(self._bloom_filter),
+            nbytes=self._bloom_filter.nbytes,
+        )
+
+    def rebuildBloomFilter(self):
+        """
+        Builds the Bloom filter anew from the stored users (and enables it,
+        if the manager was created without one).
+
+        This is done when the manager is created, and is needed when users
+        were removed from the storage by other means than this manager
+        (they stay in the filter, only costing storage-accesses). It also
+        shrinks a filter which grew beyond its capacity into a single,
+        faster stage. The counters are kept.
+        """
+        bloom_filter = BloomFilter(
+            capacity=max(2 * len(self.users), DEFAULT_CAPACITY),
+            false_positive_rate=self._bloom_filter_false_positive_rate,
+        )
+        bloom_filter.update(self.users)
+        self._bloom_filter = bloom_filter
+
+    def getUserByEmail(self, email: str) -> str:
+        """
+        Returns the username of the user owning 'email'.
+
+        The email-address is compared normalized, i.e. case-insensitively and
+        without surrounding whitespace. If several users share the
+        email-address (only possible without 'unique_emails'), the user
+        added first is returned.
+
+        Args:
+            email (str): The email-address to look up.
+
+        Returns:
+            str: The username.
+
+        Raises:
+            InvalidInputError: If 'email' is not of type 'str'.
+            MissingUserError: If no user owns 'email'.
+        """
+        if not isinstance(email, str):
+            raise InvalidInputError("'email' needs to be of type 'str'.")
+
+        try:
+            return self._getEmailIndex()[self._normalize_email(email)]
+        except KeyError:
+            raise MissingUserError(
+                "No user with this email is contained in the database."
+            )
+
+    def searchUsersByPrefix(
+        self, prefix: str, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> List[str]:
+        """
+        Returns the usernames starting with 'prefix', in sorted order and
+        in pages of at most 'limit' usernames.
+
+        Args:
+            prefix (str): The prefix ("" matches all usernames).
+            limit (int): The maximum number of usernames returned (page size).
+            after (Optional[str]): Only usernames greater than 'after' are
+                                   returned (the last username of the
+                                   previous page).
+
+        Returns:
+            List[str]: The usernames of the page.
+
+        Raises:
+            InvalidInputError: If 'prefix' (or 'after') is not of type 'str',
+                               or 'limit' is not a non-negative integer.
+        """
+        self._validateSearch(query=prefix, limit=limit, after=after)
+
+        return self._getSearchIndex().prefix_search(
+            prefix=prefix, limit=limit, after=after
+        )
+
+    def searchUsersFuzzy(
+        self,
+        query: str,
+        max_distance: int = 1,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        prefix_length: int = DEFAULT_PREFIX_LENGTH,
+    ) -> List[Tuple[str, int]]:
+        """
+        Returns the usernames within 'max_distance' edits (Levenshtein
+        distance) of 'query', in sorted order and in pages of at most
+        'limit' usernames (see 'UsernameSearchIndex.fuzzy_search').
+
+        Args:
+            query (str): The searched username.
+            max_distance (int): The maximum edit distance.
+            limit (int): The maximum number of usernames returned (page size).
+            after (Optional[str]): Only usernames greater than 'after' are
+                                   returned (the last username of the
+                                   previous page).
+            prefix_length (int): The number of leading characters of 'query'
+                                 which have to match exactly (0 searches
+                                 all usernames, which is much slower).
+
+        Returns:
+            List[Tuple[str, int]]: The (username, edit distance)-pairs of the page.
+
+        Raises:
+            InvalidInputError: If 'query' (or 'after') is not of type 'str',
+                               or 'max_distance', 'limit' or 'prefix_length'
+                               is not a non-negative integer.
+        """
+        self._validateSearch(query=query, limit=limit, after=after)
+        for value in (max_distance, prefix_length):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise InvalidInputError(
+                    "'max_distance' and 'prefix_length' need to be "
+                    "non-negative integers."
+                )
+
+        return self._getSearchIndex().fuzzy_search(
+            query=query,
+            max_distance=max_distance,
+            limit=limit,
+            after=after,
+            prefix_length=prefix_length,
+        )
+
+    @staticmethod
+    def _validateSearch(query, limit, after):
+        if not isinstance(query, str) or (
+            after is not None and not isinstance(after, str)
+        ):
+            raise InvalidInputError(
+                "The searched username (and 'after') need to be of type 'str'."
+            )
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+            raise InvalidInputError("'limit' needs to be a non-negative integer.")
+
+    def _getSearchIndex(self) -> UsernameSearchIndex:
+        """
+        Returns the search-index, building it from the stored users
+        if it was not built yet.
+        """
+        if self._search_index is None:
+            self._search_index = UsernameSearchIndex(usernames=self.users.keys())
+
+        return self._search_index
+
+    def _getEmailIndex(self) -> Dict[str, str]:
+        """
+        Returns the email-index, building it from the stored users
+        if it was not built yet.
+        """
+        if self._usernames_by_email is None:
+            usernames_by_email = {}
+            for username, email in self.users.items():
+                usernames_by_email.setdefault(self._normalize_email(email), username)
+            self._usernames_by_email = usernames_by_email
+
+        return self._usernames_by_email
 
-        return self.users.get(username)
+    @staticmethod
+    def _normalize_email(email: str) -> str:
+        return email.strip().lower()
 
 
-user_manager = UserManager()
-user_manager.addUser(username="Max Mustermann", email="max.mustermann@test.de")
-print(user_manager.users)
-print(user_manager.getUserEmail(username="Max Mustermann"))
-print(user_manager.users)
+if __name__ == "__main__":
+    user_manager = UserManager()
+    user_manager.addUser(username="Max Mustermann", email="max.mustermann@test.de")
+    print(user_manager.users)
+    print(user_manager.getUserEmail(username="Max Mustermann"))
+    print(user_manager.users)
@@ -0,0 +1,210 @@
+import sqlite3
+import threading
+from collections.abc import ItemsView, MutableMapping
+from typing import Iterable, Iterator, Mapping, Optional, Set, Tuple, Union
+
+# The default number of bytes of the database file, which are memory-mapped
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+# The maximum number of usernames looked up by a single query (below the
+# limit of 999 parameters of older SQLite versions)
+_MAX_QUERY_USERNAMES = 500
+
+
+class StorageError(Exception):
+    """
+    A custom domain-specific Exception
+    for failures of a storage backend.
+    """
+
+    pass
+
+
+class UserStorage(MutableMapping):
+    """
+    The interface of a storage backend for 'UserManager': a mutable mapping
+    from the username to the email-address of every user, which iterates
+    in the order the users were added.
+
+    A plain dict fulfills this interface (and is the default storage).
+    """
+
+    def existing_usernames(self, usernames: Iterable[str]) -> Set[str]:
+        """
+        Returns the ones of 'usernames' which are stored (e.g. for checking
+        a whole batch of new users). Backends, for which every lookup is
+        expensive, override this with a batched lookup.
+        """
+        return {username for username in usernames if username in self}
+
+
+UserStorage.register(dict)
+
+
+class _SQLiteItemsView(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        # one query for all items, instead of one query per username
+        return self._mapping._iter_items()
+
+
+class SQLiteUserStorage(UserStorage):
+    """
+    A persistent storage backend, which stores the users in an SQLite
+    database file.
+
+    Opening the storage is (almost) free: the database is only connected
+    with the first access, and nothing is loaded upfront. Every lookup reads
+    only the requested user via the primary-key index, and the database file
+    is memory-mapped (see 'mmap_size'), so that reads are served from the
+    page cache without copying. Thus, neither the startup time nor the
+    memory-usage grows with the number of users.
+
+    Writes are committed immediately; 'update' writes all users in
+    one transaction.
+
+    Usage:
+        with SQLiteUserStorage(path="users.db") as storage:
+            user_manager = UserManager(storage=storage)
+    """
+
+    def __init__(self, path: str, mmap_size: int = DEFAULT_MMAP_SIZE):
+        """
+        Args:
+            path (str): The path of the database file (created if missing).
+            mmap_size (int): The maximum number of bytes of the database file
+                             which are memory-mapped (0 disables memory-mapping).
+
+        Raises:
+            ValueError: If 'mmap_size' is not a non-negative integer.
+        """
+        if not isinstance(mmap_size, int) or mmap_size < 0:
+            raise ValueError("'mmap_size' needs to be a non-negative integer.")
+
+        self.path = path
+        self.mmap_size = mmap_size
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def __getitem__(self, username: str) -> str:
+        row = self._execute(
+            "SELECT email FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(username)
+        return row[0]
+
+    def __setitem__(self, username: str, email: str):
+        # an upsert (instead of 'INSERT OR REPLACE') keeps the position of
+        # an existing user in the iteration order
+        self._execute(
+            "INSERT INTO users (username, email) VALUES (?, ?) "
+            "ON CONFLICT (username) DO UPDATE SET email = excluded.email",
+            (username, email),
+        )
+
+    def __delitem__(self, username: str):
+        if self._execute("DELETE FROM users WHERE username = ?", (username,)).rowcount:
+            return
+        raise KeyError(username)
+
+    def __contains__(self, username: object) -> bool:
+        return (
+            self._execute(
+                "SELECT 1 FROM users WHERE username = ?", (username,)
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for (username,) in self._execute("SELECT username FROM users ORDER BY id"):
+            yield username
+
+    def __len__(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def items(self) -> ItemsView:
+        return _SQLiteItemsView(self)
+
+    def existing_usernames(self, usernames: Iterable[str]) -> Set[str]:
+        # one query per chunk of usernames, instead of one query per username
+        usernames = list(dict.fromkeys(usernames))
+        found = set()
+        for start in range(0, len(usernames), _MAX_QUERY_USERNAMES):
+            chunk = tuple(usernames[start : start + _MAX_QUERY_USERNAMES])
+            rows = self._execute(
+                "SELECT username FROM users WHERE username IN "
+                f"({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            found.update(username for (username,) in rows)
+        return found
+
+    def update(
+        self,
+        other: Union[Mapping[str, str], Iterable[Tuple[str, str]]] = (),
+        **kwargs: str,
+    ):
+        """
+        Stores all users of 'other' (and 'kwargs') in a single transaction.
+        """
+        items = other.items() if isinstance(other, Mapping) else other
+        with self._lock:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO users (username, email) VALUES (?, ?) "
+                        "ON CONFLICT (username) DO UPDATE SET email = excluded.email",
+                        list(items) + list(kwargs.items()),
+                    )
+            except sqlite3.Error as e:
+                raise StorageError(f"Storing the users failed: {e}") from e
+
+    def close(self):
+        """
+        Closes the connection to the database (it is reconnected with the
+        next access). Calling 'close' on a closed storage does nothing.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _iter_items(self) -> Iterator[Tuple[str, str]]:
+        yield from self._execute("SELECT username, email FROM users ORDER BY id")
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            connection = self._connect()
+            try:
+                with connection:
+                    return connection.execute(sql, parameters)
+            except sqlite3.Error as e:
+                raise StorageError(f"Accessing the users failed: {e}") from e
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        try:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(f"PRAGMA mmap_size = {self.mmap_size:d}")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS users ("
+                    "id INTEGER PRIMARY KEY, "
+                    "username TEXT NOT NULL UNIQUE, "
+                    "email TEXT NOT NULL)"
+                )
+        except sqlite3.Error as e:
+            raise StorageError(f"Opening the database '{self.path}' failed: {e}") from e
+
+        self._connection = connection
+        return connection
+
+    def __enter__(self) -> "SQLiteUserStorage":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,261 @@
+import bisect
+import heapq
+import itertools
+import threading
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+# The number of leading characters of the query of a fuzzy search, which
+# have to match exactly by default (see 'UsernameSearchIndex.fuzzy_search')
+DEFAULT_PREFIX_LENGTH = 2
+
+# The pending usernames are merged into the sorted usernames once there are
+# more than _PENDING_FACTOR * sqrt(number of usernames) (but at least
+# _MIN_PENDING_SIZE) of them: a merge moves all usernames, an insertion into
+# the pending usernames moves only the pending ones
+_PENDING_FACTOR = 8
+_MIN_PENDING_SIZE = 1024
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Returns the smallest string which is greater than every string
+    starting with 'prefix' (None if there is no such string).
+    """
+    prefix = prefix.rstrip(chr(0x10FFFF))
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class UsernameSearchIndex:
+    """
+    An index of usernames for prefix search and fuzzy (bounded edit-distance)
+    search, e.g. for a "search users" feature.
+
+    The usernames are kept in a sorted list, so that all usernames starting
+    with a prefix are found via binary search ('bisect') instead of a scan.
+    Added usernames are first inserted into a small sorted buffer, which is
+    merged into the sorted list once it exceeds ~8 * sqrt(number of usernames),
+    so that adding a username does not require moving the whole list.
+
+    The fuzzy search walks the sorted usernames like a trie: consecutive
+    usernames share their common prefix, whose rows of the edit-distance
+    table are reused. As soon as a prefix is too far away from the query,
+    all usernames with that prefix are skipped at once (again via 'bisect').
+
+    Results are returned in sorted order, in pages of at most 'limit' usernames;
+    the next page starts after the last username of the previous one ('after').
+
+    It is thread-safe.
+    """
+
+    def __init__(self, usernames: Iterable[str] = ()):
+        self._sorted: List[str] = sorted(usernames)
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._pending)
+
+    def add(self, username: str):
+        """
+        Adds 'username' to the index. The caller ensures that it is
+        not contained yet (like 'UserManager' does for its users).
+        """
+        with self._lock:
+            bisect.insort(self._pending, username)
+            if len(self._pending) > _MIN_PENDING_SIZE and len(
+                self._pending
+            ) ** 2 > _PENDING_FACTOR**2 * len(self._sorted):
+                self._merge_pending()
+
+    def add_many(self, usernames: Iterable[str]):
+        """
+        Adds all 'usernames' to the index (see 'add').
+        """
+        with self._lock:
+            self._pending.extend(usernames)
+            self._merge_pending()
+
+    def prefix_search(
+        self, prefix: str, limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None
+    ) -> List[str]:
+        """
+        Returns the usernames starting with 'prefix', in sorted order.
+
+        Args:
+            prefix (str): The prefix ("" matches all usernames).
+            limit (int): The maximum number of usernames returned (page size).
+            after (Optional[str]): Only usernames greater than 'after' are
+                                   returned (the last username of the
+                                   previous page).
+
+        Returns:
+            List[str]: The usernames of the page.
+        """
+        with self._lock:
+            return list(
+                itertools.islice(
+                    heapq.merge(
+                        self._iter_prefix(self._sorted, prefix, after),
+                        self._iter_prefix(self._pending, prefix, after),
+                    ),
+                    limit,
+                )
+            )
+
+    def fuzzy_search(
+        self,
+        query: str,
+        max_distance: int = 1,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        prefix_length: int = DEFAULT_PREFIX_LENGTH,
+    ) -> List[Tuple[str, int]]:
+        """
+        Returns the usernames within 'max_distance' edits (insertions,
+        deletions, substitutions of single characters; Levenshtein distance)
+        of 'query', in sorted order.
+
+        Without a 'prefix_length', every username whose beginning is close
+        to 'query' has to be checked. Requiring the first characters to match
+        exactly (like the 'prefix_length' of Lucene's fuzzy queries; typos
+        are rare there) restricts the search to the usernames with that
+        prefix. Measured with 1M random usernames (median per query):
+
+            prefix_length   max_distance=1   max_distance=2
+            0               44 ms            900 ms
+            1               17 ms            144 ms
+            2 (default)      4 ms             11 ms
+
+        Args:
+            query (str): The searched username.
+            max_distance (int): The maximum edit distance.
+            limit (int): The maximum number of usernames returned (page size).
+            after (Optional[str]): Only usernames greater than 'after' are
+                                   returned (the last username of the
+                                   previous page).
+            prefix_length (int): The number of leading characters of 'query'
+                                 which have to match exactly (0 searches
+                                 all usernames).
+
+        Returns:
+            List[Tuple[str, int]]: The (username, edit distance)-pairs of the page.
+        """
+        prefix = query[:prefix_length]
+        with self._lock:
+            return list(
+                itertools.islice(
+                    heapq.merge(
+                        self._iter_fuzzy(
+                            self._sorted, query, max_distance, after, prefix
+                        ),
+                        self._iter_fuzzy(
+                            self._pending, query, max_distance, after, prefix
+                        ),
+                    ),
+                    limit,
+                )
+            )
+
+    def _merge_pending(self):
+        # both lists are sorted runs, which 'sorted' merges in linear time
+        self._sorted = sorted(itertools.chain(self._sorted, self._pending))
+        self._pending = []
+
+    @staticmethod
+    def _iter_prefix(
+        usernames: List[str], prefix: str, after: Optional[str]
+    ) -> Iterator[str]:
+        if after is not None and after >= prefix:
+            start = bisect.bisect_right(usernames, after)
+        else:
+            start = bisect.bisect_left(usernames, prefix)
+
+        for index in range(start, len(usernames)):
+            username = usernames[index]
+            if not username.startswith(prefix):
+                return
+            yield username
+
+    @staticmethod
+    def _iter_fuzzy(
+        usernames: List[str],
+        query: str,
+        max_distance: int,
+        after: Optional[str],
+        prefix: str,
+    ) -> Iterator[Tuple[str, int]]:
+        query_length = len(query)
+        # Distances above 'max_distance' are capped, and only the cells
+        # within 'max_distance' of the diagonal are computed, since all other
+        # cells exceed 'max_distance' anyway (banded edit-distance table).
+        cap = max_distance + 1
+        # rows[d] is the row of the edit-distance table for the first d
+        # characters of the current username; rows[0] is the empty prefix
+        rows = [[min(column, cap) for column in range(query_length + 1)]]
+        previous = ""
+
+        # only the usernames starting with 'prefix' are searched
+        index = bisect.bisect_left(usernames, prefix)
+        if after is not None:
+            index = max(index, bisect.bisect_right(usernames, after))
+        upper_bound = _prefix_upper_bound(prefix)
+        end = (
+            len(usernames)
+            if upper_bound is None
+            else bisect.bisect_left(usernames, upper_bound, lo=index)
+        )
+
+        while index < end:
+            username = usernames[index]
+
+            # the rows of the common prefix with the previous username are reused
+            common = 0
+            for a, b in zip(previous, username):
+                if a != b:
+                    break
+                common += 1
+            del rows[common + 1 :]
+
+            pruned_depth = None
+            for depth in range(common, len(username)):
+                character = username[depth]
+                above = rows[depth]
+                row = [cap] * (query_length + 1)
+                row_min = row[0] = min(depth + 1, cap)
+
+                for column in range(
+                    max(1, depth + 1 - max_distance),
+                    min(query_length, depth + 1 + max_distance) + 1,
+                ):
+                    value = above[column - 1] + (query[column - 1] != character)
+                    if above[column] + 1 < value:
+                        value = above[column] + 1
+                    if row[column - 1] + 1 < value:
+                        value = row[column - 1] + 1
+                    if value > cap:
+                        value = cap
+                    row[column] = value
+                    if value < row_min:
+                        row_min = value
+                rows.append(row)
+
+                if row_min > max_distance:
+                    # no username with this prefix can be close enough
+                    pruned_depth = depth + 1
+                    break
+
+            previous = username
+            if pruned_depth is not None:
+                upper_bound = _prefix_upper_bound(username[:pruned_depth])
+                if upper_bound is None:
+                    return
+                index = bisect.bisect_left(usernames, upper_bound, index + 1, end)
+                continue
+
+            distance = rows[len(username)][query_length]
+            if distance <= max_distance:
+                yield username, distance
+            index += 1
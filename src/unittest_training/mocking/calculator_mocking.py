@@ -19,13 +19,44 @@ class CalculatorMocking:
         return a + b
 
     @staticmethod
-    def multiply(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
+    def multiply(
+        a: Union[int, float], b: Union[int, float], traced: bool = False
+    ) -> Union[int, float]:
+        """
+        Multiply 'a' by 'b'.
+
+        By default, the product is computed directly (in constant time).
+        With 'traced', the product is computed step by step as a repeated
+        addition via 'add', printing every iteration (the educational
+        variant, whose calls of 'add' can be inspected via mocking).
+
+        Args:
+            a (int | float): The multiplicand.
+            b (int | float): The multiplier; must be an int when 'traced'.
+            traced (bool): Whether to compute the product via repeated addition.
+
+        Returns:
+            int | float: The product.
+
+        Raises:
+            InvalidInputError: If a and/or b are not int/float, or if
+                               'traced' is used with a non-int 'b'.
+        """
         if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
             raise InvalidInputError("Operands must be int or float.")
 
+        if not traced:
+            return a * b
+
+        if not isinstance(b, int):
+            raise InvalidInputError("Traced multiplication requires an int 'b'.")
+
+        # a negative multiplier repeatedly adds the negated multiplicand
+        summand = a if b >= 0 else -a
+
         result = 0
-        for i in range(1, b + 1):
-            result = CalculatorMocking.add(result, a)
+        for i in range(1, abs(b) + 1):
+            result = CalculatorMocking.add(result, summand)
             print(f"Multiply-iteration: {i}")
 
         return result
@@ -0,0 +1,167 @@
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional, Tuple
+
+from unittest_training.basics.calculator_basics import (
+    Calculator,
+    DivisionByZeroError,
+    InvalidInputError,
+)
+from unittest_training.mocking.calculator_mocking import (
+    CalculatorMocking,
+    InvalidInputError as MockingInvalidInputError,
+)
+
+# The result of one operation: either its 'value' (and 'error' is None),
+# or the domain exception it raised as 'error' (and 'value' is None)
+BatchResult = namedtuple("BatchResult", ["value", "error"])
+
+# An operation: (name of the operation, a, b), e.g. ("divide", 1, 2)
+Operation = Tuple[str, Any, Any]
+
+# The operations which can be executed, per name. They are looked up by
+# name inside the worker processes, so that only plain data is pickled.
+OPERATIONS = {
+    "divide": Calculator.divide,
+    "add": CalculatorMocking.add,
+    "multiply": CalculatorMocking.multiply,
+}
+
+# The exceptions which are reported per operation (instead of aborting
+# the whole batch)
+_DOMAIN_ERRORS = (DivisionByZeroError, InvalidInputError, MockingInvalidInputError)
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _run_chunk(chunk: List[Operation]) -> List[BatchResult]:
+    """
+    Executes a chunk of operations (inside a worker process).
+    """
+    results = []
+    for name, a, b in chunk:
+        try:
+            results.append(BatchResult(OPERATIONS[name](a, b), None))
+        except _DOMAIN_ERRORS as e:
+            results.append(BatchResult(None, e))
+
+    return results
+
+
+class BatchExecutor:
+    """
+    Executes large batches of 'Calculator'/'CalculatorMocking' operations
+    in parallel in a pool of worker processes (and thus on multiple cores,
+    which threads cannot do for CPU-bound work due to the GIL).
+
+    A batch is split into chunks of 'chunk_size' operations, each of which is
+    sent to a worker as a whole, so that the inter-process overhead is paid
+    per chunk instead of per operation. Batches which fit into a single chunk
+    (or executors with a single worker) are executed in the calling process.
+    The worker processes are started with the first parallel batch and are
+    reused for all following batches until 'close' is called.
+
+    Usage:
+        with BatchExecutor(max_workers=4) as executor:
+            results = executor.run([("divide", 1, 2), ("add", 1, 2)])
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Args:
+            max_workers (Optional[int]): The number of worker processes
+                                         (default: the number of CPUs).
+            chunk_size (int): The number of operations sent to a worker at once.
+
+        Raises:
+            ValueError: If 'max_workers' or 'chunk_size' is not a positive integer.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("'max_workers' needs to be a positive integer.")
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("'chunk_size' needs to be a positive integer.")
+
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._executor = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def run(self, operations: Iterable[Operation]) -> List[BatchResult]:
+        """
+        Executes all 'operations'.
+
+        A domain exception of an operation (DivisionByZeroError or
+        InvalidInputError) does not abort the batch; it is returned as
+        the 'error' of that operation.
+
+        Args:
+            operations (Iterable[Operation]): The operations, as tuples of
+                                              (name, a, b) with name being one
+                                              of 'OPERATIONS'.
+
+        Returns:
+            List[BatchResult]: One result per operation, in the order of
+                               'operations'.
+
+        Raises:
+            InvalidInputError: If an operation is malformed or its name
+                               is unknown.
+            ValueError: If the executor is already closed.
+        """
+        operations = list(operations)
+        for operation in operations:
+            if (
+                not isinstance(operation, tuple)
+                or len(operation) != 3
+                or operation[0] not in OPERATIONS
+            ):
+                raise InvalidInputError(f"Invalid operation: {operation!r}.")
+
+        if self._closed:
+            raise ValueError("The executor is already closed.")
+
+        if len(operations) <= self.chunk_size or self.max_workers == 1:
+            return _run_chunk(operations)
+
+        chunks = [
+            operations[start : start + self.chunk_size]
+            for start in range(0, len(operations), self.chunk_size)
+        ]
+
+        results = []
+        for chunk_results in self._get_executor().map(_run_chunk, chunks):
+            results.extend(chunk_results)
+
+        return results
+
+    def close(self):
+        """
+        Shuts down the worker processes. Calling 'close' on a closed
+        executor does nothing.
+        """
+        with self._lock:
+            self._closed = True
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise ValueError("The executor is already closed.")
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def __enter__(self) -> "BatchExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
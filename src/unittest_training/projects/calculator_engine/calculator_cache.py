@@ -0,0 +1,205 @@
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable, Tuple, Union
+
+from unittest_training.basics.calculator_basics import Calculator
+from unittest_training.mocking.calculator_mocking import CalculatorMocking
+
+Number = Union[int, float]
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# The cached (pure) operations per name
+_OPERATIONS = {
+    "divide": Calculator.divide,
+    "add": CalculatorMocking.add,
+    "multiply": CalculatorMocking.multiply,
+}
+
+# Marks a cached entry as a raised exception (instead of a result)
+_RAISED = object()
+
+
+class LRUCache:
+    """
+    A bounded, thread-safe cache, which evicts the least recently used
+    entry once more than 'maxsize' entries are stored.
+    It counts the hits and misses of 'get'.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize (int): The maximum number of entries.
+
+        Raises:
+            ValueError: If 'maxsize' is not a positive integer.
+        """
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 1:
+            raise ValueError("'maxsize' needs to be a positive integer.")
+
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the entry of 'key' (and marks it as most recently used),
+        or 'default' if there is none.
+
+        Raises:
+            TypeError: If 'key' is not hashable.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Stores 'value' as the entry of 'key', evicting the least
+        recently used entry if the cache is full.
+
+        Raises:
+            TypeError: If 'key' is not hashable.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            (CacheInfo): The hits, misses, maximum and current size.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _get_operand_key(value: Any) -> Tuple[type, Hashable]:
+    """
+    Returns the part of a cache-key for one operand.
+
+    The type is part of the key, since e.g. 1 == 1.0 == True (and they have
+    the same hash), but the results differ in their type (1 + 1 == 2 vs.
+    1.0 + 1 == 2.0). Floats are keyed by their exact representation, so that
+    0.0 and -0.0 are kept apart and NaN operands are found again.
+    """
+    if type(value) is float:
+        return float, value.hex()
+
+    return type(value), value
+
+
+class CachedCalculator:
+    """
+    Wraps the pure operations 'Calculator.divide', 'CalculatorMocking.add'
+    and 'CalculatorMocking.multiply' with a shared LRU cache, for workloads
+    which repeatedly compute the same operand pairs.
+
+    The results are identical to calling the operations directly, including
+    their types and the exceptions raised for invalid operands or a zero
+    denominator (these are cached too and re-raised as new instances).
+    Operands which are not hashable are passed through without caching.
+
+    Usage:
+        calculator = CachedCalculator(maxsize=4096)
+        calculator.divide(1, 3)
+        calculator.cache_info()
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize (int): The maximum number of cached results.
+
+        Raises:
+            ValueError: If 'maxsize' is not a positive integer.
+        """
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def divide(self, a: Number, b: Number) -> Number:
+        """
+        Cached version of 'Calculator.divide'.
+        """
+        return self._call("divide", a, b)
+
+    def add(self, a: Number, b: Number) -> Number:
+        """
+        Cached version of 'CalculatorMocking.add'.
+        """
+        return self._call("add", a, b)
+
+    def multiply(self, a: Number, b: Number) -> Number:
+        """
+        Cached version of 'CalculatorMocking.multiply' (not traced).
+        """
+        return self._call("multiply", a, b)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            (CacheInfo): The hits, misses, maximum and current size.
+        """
+        return self._cache.info()
+
+    def cache_clear(self):
+        """
+        Removes all cached results and resets the statistics.
+        """
+        self._cache.clear()
+
+    def _call(self, operation: str, a: Any, b: Any) -> Number:
+        function: Callable[[Any, Any], Number] = _OPERATIONS[operation]
+        key = (operation, _get_operand_key(a), _get_operand_key(b))
+
+        try:
+            entry = self._cache.get(key)
+        except TypeError:
+            # unhashable operands (e.g. lists) are not cached
+            return function(a, b)
+
+        if entry is not None:
+            result, error = entry
+            if result is _RAISED:
+                # a new instance, so that the cached exception does not
+                # collect the tracebacks of all the calls raising it
+                raise error[0](*error[1])
+            return result
+
+        try:
+            result = function(a, b)
+        except Exception as e:
+            self._cache.put(key, (_RAISED, (type(e), e.args)))
+            raise
+
+        self._cache.put(key, (result, None))
+        return result
@@ -0,0 +1,400 @@
+import ast
+import itertools
+import operator
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from unittest_training.basics.calculator_basics import (
+    BatchDivisionByZeroError,
+    Calculator,
+    DivisionByZeroError,
+    InvalidInputError,
+    _is_numpy_value,
+    _validate_numeric_sequence,
+)
+from unittest_training.mocking.calculator_mocking import CalculatorMocking
+
+Number = Union[int, float]
+
+# The supported binary operators: (symbol, column-wise operator-function)
+_BINARY_OPERATORS = {
+    ast.Add: ("+", operator.add),
+    ast.Sub: ("-", operator.sub),
+    ast.Mult: ("*", operator.mul),
+    ast.Div: ("/", operator.truediv),
+}
+
+# The column-wise operator-function per symbol
+_COLUMN_OPERATORS = dict(_BINARY_OPERATORS.values())
+
+# The operators whose operands can be swapped without changing the result,
+# which lets e.g. 'a + b' and 'b + a' share one subexpression
+_COMMUTATIVE_OPERATORS = ("+", "*")
+
+
+def _fold(symbol: str, left: Number, right: Number) -> Number:
+    """
+    Computes a constant subexpression at compile time, via the same
+    operations as 'Calculator' and 'CalculatorMocking'.
+    """
+    if symbol == "+":
+        return CalculatorMocking.add(left, right)
+    if symbol == "-":
+        return CalculatorMocking.add(left, -right)
+    if symbol == "*":
+        return CalculatorMocking.multiply(left, right)
+    return Calculator.divide(left, right)
+
+
+class CompiledExpression:
+    """
+    An arithmetic expression, which was parsed and optimized once
+    (see 'compile_expression') and can then be evaluated quickly for many
+    variable bindings ('evaluate', 'evaluate_many') or for whole columns
+    of values at once ('evaluate_columns').
+
+    The expression is stored as a list of instructions (slots), in which
+    every distinct subexpression appears exactly once. Every slot is either
+    ("const", value), ("var", name), ("neg", operand) or (symbol, left, right),
+    where operands refer to earlier slots; the last slot is the result.
+    """
+
+    def __init__(self, expression: str, slots: List[tuple]):
+        self.expression = expression
+        self.slots = slots
+        self.variables: Tuple[str, ...] = tuple(
+            sorted(slot[1] for slot in slots if slot[0] == "var")
+        )
+        self._function = self._generate_function()
+
+    def evaluate(self, /, **bindings: Number) -> Number:
+        """
+        Evaluates the expression for one binding of its variables.
+
+        Args:
+            **bindings (int | float): The values of the variables.
+
+        Returns:
+            int | float: The value of the expression.
+
+        Raises:
+            InvalidInputError: If a variable is unbound or not an int/float.
+            DivisionByZeroError: If a denominator is zero.
+        """
+        return self._function(*self._get_arguments(bindings))
+
+    def evaluate_many(self, rows: Iterable[Mapping[str, Number]]) -> List[Number]:
+        """
+        Evaluates the expression for many bindings of its variables.
+
+        Args:
+            rows (Iterable[Mapping[str, int | float]]): The bindings.
+
+        Returns:
+            List[int | float]: The values of the expression, one per binding.
+
+        Raises:
+            InvalidInputError: If a variable is unbound or not an int/float.
+            DivisionByZeroError: If a denominator is zero.
+        """
+        function = self._function
+        get_arguments = self._get_arguments
+        return [function(*get_arguments(row)) for row in rows]
+
+    def evaluate_columns(
+        self, columns: Mapping[str, Sequence[Number]]
+    ) -> Union[List[Number], "numpy.ndarray"]:
+        """
+        Evaluates the expression for whole columns of values at once.
+
+        Every instruction is applied to entire columns (instead of evaluating
+        the expression row by row), so the per-value work happens inside
+        Python´s built-in operators resp. inside NumPy.
+
+        Args:
+            columns (Mapping[str, Sequence[int | float]]): One column (list, tuple,
+                                                           'array.array' or NumPy
+                                                           array) per variable,
+                                                           all of the same length.
+
+        Returns:
+            The values of the expression per row, as a list
+            (or as a NumPy array, if any column is a NumPy array).
+
+        Raises:
+            InvalidInputError: If a variable is unbound, a value is not an
+                               int/float, or the columns differ in length.
+            BatchDivisionByZeroError: If a denominator is zero; its 'indices'
+                                      hold all affected rows.
+        """
+        use_numpy = any(_is_numpy_value(column) for column in columns.values())
+        if use_numpy:
+            import numpy as np
+
+        length = None
+        values = []
+        for slot in self.slots:
+            kind = slot[0]
+            if kind == "const":
+                values.append(slot[1])
+            elif kind == "var":
+                column = self._get_column(columns=columns, name=slot[1])
+                if use_numpy:
+                    column = np.asarray(column)
+                    if column.dtype.kind not in "biuf":
+                        raise InvalidInputError("Operands must be int or float.")
+                if length is not None and len(column) != length:
+                    raise InvalidInputError("All columns must be of the same length.")
+                length = len(column)
+                values.append(column)
+            elif kind == "neg":
+                operand = values[slot[1]]
+                if use_numpy:
+                    values.append(-operand)
+                else:
+                    values.append(list(map(operator.neg, operand)))
+            else:
+                left = values[slot[1]]
+                right = values[slot[2]]
+                function = _COLUMN_OPERATORS[slot[0]]
+                if slot[0] == "/":
+                    self._check_column_denominator(
+                        denominator=right, use_numpy=use_numpy
+                    )
+                values.append(
+                    self._apply_to_columns(
+                        function=function, left=left, right=right, use_numpy=use_numpy
+                    )
+                )
+
+        result = values[-1]
+        if self.slots[-1][0] == "const":
+            # a constant expression has the same value in every row; the
+            # number of rows is taken from the (otherwise unused) columns
+            if not columns:
+                raise InvalidInputError("The number of rows cannot be determined.")
+            length = len(next(iter(columns.values())))
+            return np.full(length, result) if use_numpy else [result] * length
+
+        return result if use_numpy else list(result)
+
+    def _get_arguments(self, bindings: Mapping[str, Number]) -> List[Number]:
+        arguments = []
+        for name in self.variables:
+            try:
+                value = bindings[name]
+            except KeyError:
+                raise InvalidInputError(f"Missing value for variable '{name}'.")
+            if not isinstance(value, (int, float)):
+                raise InvalidInputError("Operands must be int or float.")
+            arguments.append(value)
+
+        return arguments
+
+    @staticmethod
+    def _get_column(columns: Mapping[str, Sequence[Number]], name: str):
+        try:
+            column = columns[name]
+        except KeyError:
+            raise InvalidInputError(f"Missing column for variable '{name}'.")
+
+        if not _is_numpy_value(column):
+            _validate_numeric_sequence(values=column)
+
+        return column
+
+    @staticmethod
+    def _check_column_denominator(denominator, use_numpy: bool):
+        if isinstance(denominator, (int, float)):
+            # constant zero denominators were rejected at compile time
+            return
+
+        if use_numpy:
+            import numpy as np
+
+            zero_mask = denominator == 0
+            if zero_mask.any():
+                raise BatchDivisionByZeroError(
+                    "Denominator cannot be zero.",
+                    indices=np.flatnonzero(zero_mask).tolist(),
+                )
+        elif 0 in denominator:
+            raise BatchDivisionByZeroError(
+                "Denominator cannot be zero.",
+                indices=[
+                    index for index, value in enumerate(denominator) if value == 0
+                ],
+            )
+
+    @staticmethod
+    def _apply_to_columns(function: Callable, left, right, use_numpy: bool):
+        if use_numpy:
+            return function(left, right)
+
+        if isinstance(left, (int, float)):
+            left = itertools.repeat(left)
+        if isinstance(right, (int, float)):
+            right = itertools.repeat(right)
+
+        return list(map(function, left, right))
+
+    def _generate_function(self) -> Callable[..., Number]:
+        """
+        Generates a Python function which evaluates all slots in order,
+        with the variables as parameters (in the order of 'self.variables').
+
+        The generated source only contains validated variable names,
+        names of temporaries/constants and arithmetic operators.
+        """
+        # bound under a '_'-prefixed name, which no variable can shadow
+        namespace = {"_DivisionByZeroError": DivisionByZeroError}
+        names = []
+        lines = []
+        for index, slot in enumerate(self.slots):
+            kind = slot[0]
+            if kind == "const":
+                # constants are bound via the namespace, since e.g. a folded
+                # 'inf' has no literal representation
+                names.append(f"_c{index}")
+                namespace[f"_c{index}"] = slot[1]
+            elif kind == "var":
+                names.append(slot[1])
+            elif kind == "neg":
+                names.append(f"_t{index}")
+                lines.append(f"        _t{index} = -{names[slot[1]]}")
+            else:
+                names.append(f"_t{index}")
+                lines.append(
+                    f"        _t{index} = {names[slot[1]]} {kind} {names[slot[2]]}"
+                )
+
+        source = "\n".join(
+            [
+                f"def _evaluate({', '.join(self.variables)}):",
+                "    try:",
+                *lines,
+                f"        return {names[-1]}",
+                "    except ZeroDivisionError:",
+                "        raise _DivisionByZeroError('Denominator cannot be zero.') from None",
+            ]
+        )
+
+        exec(compile(source, f"<expression {self.expression!r}>", "exec"), namespace)
+        return namespace["_evaluate"]
+
+
+def compile_expression(expression: str) -> CompiledExpression:
+    """
+    Parses and optimizes an arithmetic expression once.
+
+    Supported are int/float literals, variables, parentheses, the binary
+    operators +, -, *, / and the unary operators + and -. While compiling,
+    constant subexpressions are computed (constant folding) and identical
+    subexpressions are shared, so they are evaluated only once
+    (common subexpression elimination).
+
+    Args:
+        expression (str): The expression, e.g. "(price - cost) / price * 100".
+
+    Returns:
+        CompiledExpression: The compiled expression.
+
+    Raises:
+        InvalidInputError: If 'expression' is not a str or not a supported
+                           arithmetic expression.
+        DivisionByZeroError: If the expression divides by a constant zero.
+    """
+    if not isinstance(expression, str):
+        raise InvalidInputError("'expression' needs to be of type 'str'.")
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError:
+        raise InvalidInputError(f"Invalid expression: {expression!r}.")
+
+    slots: List[tuple] = []
+    slot_indices: Dict[tuple, int] = {}
+
+    def add_slot(slot: tuple) -> int:
+        # hash-consing: identical subexpressions share one slot
+        if slot not in slot_indices:
+            slot_indices[slot] = len(slots)
+            slots.append(slot)
+        return slot_indices[slot]
+
+    def add_constant(value: Number) -> int:
+        # the type is part of the key, so that e.g. 1 and 1.0 stay distinct
+        return add_slot(("const", value, type(value)))
+
+    def build(node: ast.AST) -> int:
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return add_constant(node.value)
+
+        if isinstance(node, ast.Name):
+            if node.id.startswith("_"):
+                raise InvalidInputError(
+                    f"Variable names must not start with '_': {node.id!r}."
+                )
+            return add_slot(("var", node.id))
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            operand = build(node.operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            if slots[operand][0] == "const":
+                return add_constant(-slots[operand][1])
+            return add_slot(("neg", operand))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            symbol = _BINARY_OPERATORS[type(node.op)][0]
+            left = build(node.left)
+            right = build(node.right)
+
+            if slots[left][0] == "const" and slots[right][0] == "const":
+                return add_constant(_fold(symbol, slots[left][1], slots[right][1]))
+
+            if symbol == "/" and slots[right][0] == "const" and slots[right][1] == 0:
+                raise DivisionByZeroError("Denominator cannot be zero.")
+
+            if symbol in _COMMUTATIVE_OPERATORS and left > right:
+                left, right = right, left
+
+            return add_slot((symbol, left, right))
+
+        raise InvalidInputError(
+            f"Unsupported element in expression {expression!r}: "
+            f"{type(node).__name__}."
+        )
+
+    result = build(tree.body)
+
+    # only the slots the result depends on are kept (folding can leave
+    # unused constants behind); their order stays topological
+    used = set()
+    stack = [result]
+    while stack:
+        index = stack.pop()
+        if index in used:
+            continue
+        used.add(index)
+        slot = slots[index]
+        if slot[0] == "neg":
+            stack.append(slot[1])
+        elif slot[0] not in ("const", "var"):
+            stack.extend(slot[1:])
+
+    remapped = {}
+    compacted_slots = []
+    for index in sorted(used):
+        slot = slots[index]
+        if slot[0] == "const":
+            compacted_slot = ("const", slot[1])
+        elif slot[0] == "var":
+            compacted_slot = slot
+        elif slot[0] == "neg":
+            compacted_slot = ("neg", remapped[slot[1]])
+        else:
+            compacted_slot = (slot[0], remapped[slot[1]], remapped[slot[2]])
+        remapped[index] = len(compacted_slots)
+        compacted_slots.append(compacted_slot)
+
+    return CompiledExpression(expression=expression, slots=compacted_slots)
@@ -0,0 +1,115 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Tuple
+
+from unittest_training.projects.textfile_writer.textfile_writer import (
+    DEFAULT_CHUNK_SIZE,
+    Durability,
+    TextfileWriter,
+    TextSource,
+)
+
+
+class AsyncTextfileWriter:
+    """
+    An asyncio-friendly wrapper around 'TextfileWriter'.
+
+    The blocking steps (open, write, sync, close and the rollback) are
+    conducted by 'TextfileWriter' in a bounded thread pool, so that the
+    event loop is never blocked. Since exactly the same code path is used,
+    the same exceptions (FileCreationError, FileDeletionError,
+    FileHandleCloseError, ...) are raised and the same rollback is conducted.
+
+    At most 'max_concurrency' files are processed at the same time; further
+    calls wait until a worker becomes available.
+
+    Usage:
+        async with AsyncTextfileWriter(max_concurrency=8) as writer:
+            await writer.process_textfile(text_to_write="...", file_path="...")
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("'max_concurrency' needs to be a positive integer.")
+
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="AsyncTextfileWriter"
+        )
+
+    async def process_textfile(
+        self,
+        text_to_write: TextSource,
+        file_path: str,
+        atomic: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        durability: Durability = Durability.FSYNC,
+    ):
+        """
+        Asynchronous version of 'TextfileWriter.process_textfile'.
+
+        Args:
+            text_to_write (TextSource): The text that shall be written to the file.
+            file_path (str): The file path of the file to write.
+            atomic (bool): Whether the file shall be written atomically.
+            chunk_size (int): The size of the chunks written to the file
+                              when 'text_to_write' is not a string.
+            durability (Durability): The durability policy for the file.
+        """
+        await self._run_in_executor(
+            functools.partial(
+                TextfileWriter.process_textfile,
+                text_to_write=text_to_write,
+                file_path=file_path,
+                atomic=atomic,
+                chunk_size=chunk_size,
+                durability=durability,
+            )
+        )
+
+    async def process_textfiles(
+        self,
+        items: Iterable[Tuple[str, TextSource]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        durability: Durability = Durability.FSYNC_DIR,
+    ):
+        """
+        Asynchronous version of 'TextfileWriter.process_textfiles'.
+
+        The whole batch occupies a single worker, since its group-commit
+        and its all-or-nothing rollback span all files of the batch.
+
+        Args:
+            items (Iterable[Tuple[str, TextSource]]): The (file_path, text_to_write)-
+                                                      pairs to write.
+            chunk_size (int): The size of the chunks written to the files
+                              whose text is not a string.
+            durability (Durability): The durability policy applied in the
+                                     group-commit phase.
+        """
+        await self._run_in_executor(
+            functools.partial(
+                TextfileWriter.process_textfiles,
+                items=items,
+                chunk_size=chunk_size,
+                durability=durability,
+            )
+        )
+
+    def close(self):
+        """
+        Shuts the thread pool down, waiting for all pending writes to finish.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def _run_in_executor(self, function: functools.partial):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function)
+
+    async def __aenter__(self) -> "AsyncTextfileWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # waiting for the shutdown in a separate thread keeps the loop responsive
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -0,0 +1,227 @@
+import bisect
+import threading
+import time
+from typing import Dict, List, Tuple, Union
+
+# The phases of writing a file, which are reported to the instrumentation
+PHASE_OPEN = "open"
+PHASE_WRITE = "write"
+PHASE_FLUSH = "flush"
+PHASE_FSYNC = "fsync"
+PHASE_CLOSE = "close"
+PHASE_ROLLBACK = "rollback"
+
+PHASES = (
+    PHASE_OPEN,
+    PHASE_WRITE,
+    PHASE_FLUSH,
+    PHASE_FSYNC,
+    PHASE_CLOSE,
+    PHASE_ROLLBACK,
+)
+
+# The upper bounds (in seconds) of the buckets of the duration-histograms
+DEFAULT_BUCKET_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, float("inf"))
+
+
+class Instrumentation:
+    """
+    The interface for instrumenting 'TextfileWriter'.
+
+    This base class records nothing and is used by default, so that
+    'TextfileWriter' is silent and (almost) free of overhead unless an
+    instrumentation is plugged in via 'TextfileWriter.instrumentation'.
+
+    Subclasses set 'enabled' to True and override 'record' and 'record_failure'.
+    """
+
+    enabled = False
+
+    def record(self, phase: str, duration: float, size: int = 0):
+        """
+        Records a successfully completed phase.
+
+        Args:
+            phase (str): The phase, one of 'PHASES'.
+            duration (float): The duration of the phase in seconds.
+            size (int): The number of bytes written in this phase
+                        (of the encoded text, for a textfile).
+        """
+        pass
+
+    def record_failure(self, phase: str):
+        """
+        Records a phase which failed with an exception.
+
+        Args:
+            phase (str): The phase, one of 'PHASES'.
+        """
+        pass
+
+
+class MetricsInstrumentation(Instrumentation):
+    """
+    An instrumentation which collects counters and duration-histograms
+    per phase. It is thread-safe.
+
+    Usage:
+        metrics = MetricsInstrumentation()
+        TextfileWriter.instrumentation = metrics
+        ...
+        metrics.snapshot()
+    """
+
+    enabled = True
+
+    def __init__(self, bucket_bounds: Tuple[float, ...] = DEFAULT_BUCKET_BOUNDS):
+        if list(bucket_bounds) != sorted(bucket_bounds) or not bucket_bounds:
+            raise ValueError("'bucket_bounds' need to be sorted ascendingly.")
+        if bucket_bounds[-1] != float("inf"):
+            bucket_bounds = tuple(bucket_bounds) + (float("inf"),)
+
+        self.bucket_bounds = tuple(bucket_bounds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Resets all counters and histograms.
+        """
+        with self._lock:
+            self._counts = dict.fromkeys(PHASES, 0)
+            self._failures = dict.fromkeys(PHASES, 0)
+            self._total_durations = dict.fromkeys(PHASES, 0.0)
+            self._total_sizes = dict.fromkeys(PHASES, 0)
+            self._histograms = {
+                phase: [0] * len(self.bucket_bounds) for phase in PHASES
+            }
+
+    def record(self, phase: str, duration: float, size: int = 0):
+        bucket_index = bisect.bisect_left(self.bucket_bounds, duration)
+        with self._lock:
+            self._counts[phase] += 1
+            self._total_durations[phase] += duration
+            self._total_sizes[phase] += size
+            self._histograms[phase][bucket_index] += 1
+
+    def record_failure(self, phase: str):
+        with self._lock:
+            self._failures[phase] += 1
+
+    def count(self, phase: str) -> int:
+        """
+        Returns the number of successfully completed 'phase's.
+        """
+        return self._counts[phase]
+
+    def failures(self, phase: str) -> int:
+        """
+        Returns the number of failed 'phase's.
+        """
+        return self._failures[phase]
+
+    def total_duration(self, phase: str) -> float:
+        """
+        Returns the summed-up duration (in seconds) of all completed 'phase's.
+        """
+        return self._total_durations[phase]
+
+    def total_size(self, phase: str) -> int:
+        """
+        Returns the summed-up size of all completed 'phase's.
+        """
+        return self._total_sizes[phase]
+
+    def histogram(self, phase: str) -> List[Tuple[float, int]]:
+        """
+        Returns the duration-histogram of 'phase'.
+
+        Returns:
+            (List[Tuple[float, int]]): The (upper bound in seconds, count)-pairs
+                                       of all buckets.
+        """
+        with self._lock:
+            return list(zip(self.bucket_bounds, self._histograms[phase]))
+
+    def snapshot(self) -> Dict[str, Dict[str, Union[int, float, list]]]:
+        """
+        Returns all counters and histograms as plain (JSON-serializable) data.
+
+        Returns:
+            (Dict[str, Dict[str, Union[int, float, list]]]): The metrics per phase.
+        """
+        with self._lock:
+            return {
+                phase: {
+                    "count": self._counts[phase],
+                    "failures": self._failures[phase],
+                    "total_duration": self._total_durations[phase],
+                    "total_size": self._total_sizes[phase],
+                    "histogram": [
+                        [bound if bound != float("inf") else None, count]
+                        for bound, count in zip(
+                            self.bucket_bounds, self._histograms[phase]
+                        )
+                    ],
+                }
+                for phase in PHASES
+            }
+
+
+class PhaseTimer:
+    """
+    A context-manager which measures the duration of a phase and reports
+    it to an instrumentation (or reports a failure on an exception).
+    The 'size' can be set inside the 'with'-block.
+    """
+
+    __slots__ = ("_instrumentation", "_phase", "_start", "size")
+
+    def __init__(self, instrumentation: Instrumentation, phase: str, size: int = 0):
+        self._instrumentation = instrumentation
+        self._phase = phase
+        self._start = 0.0
+        self.size = size
+
+    def __enter__(self) -> "PhaseTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self._instrumentation.record(
+                self._phase, time.perf_counter() - self._start, self.size
+            )
+        else:
+            self._instrumentation.record_failure(self._phase)
+
+
+class _NullPhaseTimer:
+    """
+    The context-manager used when no instrumentation is enabled.
+    """
+
+    __slots__ = ("size",)
+
+    def __enter__(self) -> "_NullPhaseTimer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+def measure(instrumentation: Instrumentation, phase: str):
+    """
+    Creates a context-manager which measures 'phase' for 'instrumentation'.
+
+    Args:
+        instrumentation (Instrumentation): The instrumentation to report to.
+        phase (str): The phase to measure, one of 'PHASES'.
+
+    Returns:
+        (PhaseTimer | _NullPhaseTimer): The context-manager.
+    """
+    if not instrumentation.enabled:
+        return _NullPhaseTimer()
+
+    return PhaseTimer(instrumentation=instrumentation, phase=phase)
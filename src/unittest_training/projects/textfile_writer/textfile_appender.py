@@ -0,0 +1,182 @@
+import threading
+import time
+from typing import Optional
+
+from unittest_training.projects.textfile_writer import instrumentation as instr
+from unittest_training.projects.textfile_writer.textfile_writer import (
+    Durability,
+    TextfileWriter,
+)
+
+
+class TextfileAppender:
+    """
+    A long-lived writer for append-workloads (e.g. audit logs).
+
+    Unlike 'TextfileWriter.process_textfile', the file is opened once in
+    append-mode and kept open. Appended records are buffered in memory and
+    written to the file in one go as soon as either 'max_buffer_size'
+    characters are buffered or 'flush_interval' seconds passed since the
+    last flush. Every 'sync_every'-th flush, the file is additionally synced
+    to disk according to 'durability'.
+
+    The time-threshold is checked whenever a record is appended, i.e. no
+    background thread is used. Call 'flush' explicitly to write out the
+    buffer during idle periods.
+
+    Since the file is appended to (and may contain previous records),
+    no rollback is conducted on failure; the file is never deleted.
+
+    Usage:
+        with TextfileAppender(file_path="audit.log") as appender:
+            appender.append("Some record")
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        max_buffer_size: int = 64 * 1024,
+        flush_interval: Optional[float] = 1.0,
+        sync_every: int = 1,
+        durability: Durability = Durability.FSYNC,
+        record_separator: str = "\n",
+    ):
+        """
+        Opens the file at 'file_path' in append-mode.
+
+        Args:
+            file_path (str): The file path of the file to append to.
+            max_buffer_size (int): The number of buffered characters which
+                                   triggers a flush.
+            flush_interval (Optional[float]): The number of seconds after which
+                                              the buffer is flushed with the next
+                                              appended record; None disables the
+                                              time-threshold.
+            sync_every (int): Every how many flushes the file is synced to disk.
+            durability (Durability): How the file is synced to disk.
+            record_separator (str): The string appended after every record.
+
+        Raises:
+            ValueError: If 'max_buffer_size' or 'sync_every' is not a positive
+                        integer, or 'flush_interval' is negative.
+            FileCreationError: If the file cannot be opened.
+        """
+        if not isinstance(max_buffer_size, int) or max_buffer_size < 1:
+            raise ValueError("'max_buffer_size' needs to be a positive integer.")
+        if not isinstance(sync_every, int) or sync_every < 1:
+            raise ValueError("'sync_every' needs to be a positive integer.")
+        if flush_interval is not None and flush_interval < 0:
+            raise ValueError("'flush_interval' must not be negative.")
+
+        self.file_path = file_path
+        self.max_buffer_size = max_buffer_size
+        self.flush_interval = flush_interval
+        self.sync_every = sync_every
+        self.durability = durability
+        self.record_separator = record_separator
+
+        self._buffer = []
+        self._buffered_size = 0
+        self._flush_count = 0
+        self._last_flush_time = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._file_handle = TextfileWriter._create_file(file_path=file_path, mode="a")
+
+    @property
+    def closed(self) -> bool:
+        return not TextfileWriter._check_for_open_file_handle(
+            file_handle=self._file_handle
+        )
+
+    def append(self, record: str):
+        """
+        Appends 'record' (followed by the record separator) to the buffer,
+        and flushes the buffer if one of the thresholds is reached.
+
+        Args:
+            record (str): The record to append.
+
+        Raises:
+            TypeError: If 'record' is not of type 'str'.
+            ValueError: If the appender is already closed.
+        """
+        # checked before buffering: a non-str record would break every later
+        # flush and lose all records buffered so far
+        if not isinstance(record, str):
+            raise TypeError("'record' needs to be of type 'str'.")
+
+        with self._lock:
+            self._raise_if_closed()
+
+            self._buffer.append(record)
+            self._buffer.append(self.record_separator)
+            self._buffered_size += len(record) + len(self.record_separator)
+
+            if self._buffered_size >= self.max_buffer_size or (
+                self.flush_interval is not None
+                and time.monotonic() - self._last_flush_time >= self.flush_interval
+            ):
+                self._flush_buffer()
+
+    def flush(self):
+        """
+        Writes all buffered records to the file (and syncs it to disk
+        if this is a 'sync_every'-th flush).
+
+        Raises:
+            ValueError: If the appender is already closed.
+        """
+        with self._lock:
+            self._raise_if_closed()
+            self._flush_buffer()
+
+    def close(self):
+        """
+        Flushes all buffered records, syncs the file to disk and closes
+        the file-handle. Calling 'close' on a closed appender does nothing.
+
+        Raises:
+            FileHandleCloseError: If the file handle could not be closed.
+        """
+        with self._lock:
+            if self.closed:
+                return
+
+            try:
+                self._flush_buffer(force_sync=True)
+            finally:
+                # cleanup: close the file-handle, even if the last flush failed
+                if TextfileWriter._check_for_open_file_handle(
+                    file_handle=self._file_handle
+                ):
+                    TextfileWriter._close_file_handle(file_handle=self._file_handle)
+
+    def _flush_buffer(self, force_sync: bool = False):
+        if self._buffer:
+            TextfileWriter._write_text(
+                file_handle=self._file_handle, text_to_write="".join(self._buffer)
+            )
+            self._buffer.clear()
+            self._buffered_size = 0
+
+        with TextfileWriter._measure(phase=instr.PHASE_FLUSH):
+            self._file_handle.flush()
+        self._flush_count += 1
+        self._last_flush_time = time.monotonic()
+
+        if force_sync or self._flush_count % self.sync_every == 0:
+            if self.durability not in (Durability.NONE, Durability.FLUSH):
+                TextfileWriter._sync_fd(
+                    fd=self._file_handle.fileno(), durability=self.durability
+                )
+
+    def _raise_if_closed(self):
+        if self.closed:
+            raise ValueError("The appender is already closed.")
+
+    def __enter__(self) -> "TextfileAppender":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,13 +1,30 @@
+import errno
 import os
-from io import TextIOWrapper
+from enum import Enum
+from io import BufferedWriter, TextIOWrapper
+from typing import BinaryIO, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from unittest_training.projects.textfile_writer import instrumentation as instr
 
 
 text_to_write = "SomeText"
 filename = "someFile.txt"
 
-current_file_path = os.path.abspath(__file__)
-current_dir_path = os.path.dirname(current_file_path)
-file_path = os.path.realpath(os.path.join(current_dir_path, filename))
+
+def __getattr__(name: str) -> str:
+    # The example paths 'current_file_path', 'current_dir_path' and 'file_path'
+    # are only computed when they are accessed, so that importing this module
+    # conducts no file-system calls.
+    if name == "current_file_path":
+        return os.path.abspath(__file__)
+    if name == "current_dir_path":
+        return os.path.dirname(os.path.abspath(__file__))
+    if name == "file_path":
+        return os.path.realpath(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        )
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # -----Custom, domain-specific exceptions--------
@@ -39,32 +56,281 @@ class FileHandleCloseError(Exception):
     pass
 
 
+class FileReplaceError(Exception):
+    """
+    A custom domain-specific Exception
+    for when a temporary file cannot be
+    renamed onto its target file.
+    """
+
+    pass
+
+
 # -----------------------------------------------
 
 
+class Durability(Enum):
+    """
+    The durability policies for writing files, ordered from the
+    fastest (but least durable) to the slowest (but most durable) one.
+
+    - NONE: The text is only written; it reaches the operating system
+            when the file-handle is closed.
+    - FLUSH: Python´s internal buffer is flushed to the operating system,
+             but nothing is synced to disk.
+    - FDATASYNC: The file´s data is synced to disk via 'os.fdatasync'
+                 (falls back to 'os.fsync' where it is not available).
+    - FSYNC: The file´s data and metadata are synced to disk via 'os.fsync'.
+    - FSYNC_DIR: Like FSYNC, and additionally the parent directory is fsynced,
+                 so that the creation (or renaming) of the file is durable too.
+    """
+
+    NONE = "none"
+    FLUSH = "flush"
+    FDATASYNC = "fdatasync"
+    FSYNC = "fsync"
+    FSYNC_DIR = "fsync+dir"
+
+
+# A text source is either a complete string, an iterable (e.g. a generator)
+# of string-chunks, or a readable file-like object in text mode.
+TextSource = Union[str, Iterable[str], TextIO]
+
+# A binary source is either a complete bytes-like object (bytes, bytearray,
+# memoryview), an iterable of bytes-like chunks, or a readable binary file object.
+BytesLike = Union[bytes, bytearray, memoryview]
+BinarySource = Union[BytesLike, Iterable[BytesLike], BinaryIO]
+
+# The default size (in characters resp. bytes) of the chunks written to the
+# file when the text resp. the data is not passed in as one object.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# The maximum number of bytes copied by the kernel per system call when the
+# binary source is another file ('os.copy_file_range' / 'os.sendfile').
+_KERNEL_COPY_SIZE = 1 << 30
+
+# The errors of 'os.copy_file_range' / 'os.sendfile' which signal that the
+# kernel copy is not supported for the two files (e.g. across filesystems).
+_KERNEL_COPY_UNSUPPORTED_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(errno, name, None)
+        for name in ("EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP", "ENOTSUP", "EBADF")
+    )
+    if code is not None
+)
+
+
 # Implementation without context-manager for handling textfiles
 class TextfileWriter:
+    # The instrumentation which receives the durations and sizes of all
+    # phases (open, write, flush, fsync, close, rollback). By default
+    # nothing is recorded; plug in e.g. an 'instr.MetricsInstrumentation'.
+    instrumentation: instr.Instrumentation = instr.Instrumentation()
+
+    @staticmethod
+    def process_textfile(
+        text_to_write: TextSource,
+        file_path: str,
+        atomic: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        durability: Durability = Durability.FSYNC,
+    ):
+        TextfileWriter._process_file(
+            payload=text_to_write,
+            file_path=file_path,
+            binary=False,
+            atomic=atomic,
+            chunk_size=chunk_size,
+            durability=durability,
+        )
+
+    @staticmethod
+    def process_binaryfile(
+        data: BinarySource,
+        file_path: str,
+        atomic: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        durability: Durability = Durability.FSYNC,
+        preallocate: bool = False,
+    ):
+        """
+        Writes binary 'data' to the file at 'file_path', with the same
+        rollback and cleanup as 'process_textfile', but without any encoding.
+
+        Bytes-like objects (including memoryviews) are written without
+        intermediate copies. If 'data' is another (regular) file, its content
+        is copied inside the kernel via 'os.copy_file_range' resp. 'os.sendfile'
+        where available. With 'preallocate', the file is sized up-front and
+        'data' is copied into a memory-map of the file.
+
+        Args:
+            data (BinarySource): The data that shall be written to the file.
+            file_path (str): The file path of the file to write.
+            atomic (bool): Whether the file shall be written atomically
+                           (see 'process_textfile').
+            chunk_size (int): The size of the chunks written to the file
+                              when 'data' is not a bytes-like object.
+            durability (Durability): The durability policy for the file.
+            preallocate (bool): Whether the file shall be preallocated and written
+                                via a memory-map; requires a bytes-like 'data'.
+
+        Raises:
+            ValueError: If 'preallocate' is used with a 'data' which is not
+                        bytes-like, or if 'chunk_size' is not positive.
+            FileCreationError: If the file cannot be created.
+            FileDeletionError: If the rollback fails.
+            FileHandleCloseError: If the file handle cannot be closed.
+        """
+        if preallocate and not isinstance(data, (bytes, bytearray, memoryview)):
+            raise ValueError("'preallocate' requires a bytes-like 'data'.")
+
+        TextfileWriter._process_file(
+            payload=data,
+            file_path=file_path,
+            binary=True,
+            atomic=atomic,
+            chunk_size=chunk_size,
+            durability=durability,
+            preallocate=preallocate,
+        )
+
     @staticmethod
-    def process_textfile(text_to_write: str, file_path: str):
+    def _process_file(
+        payload: Union[TextSource, BinarySource],
+        file_path: str,
+        binary: bool,
+        atomic: bool,
+        chunk_size: int,
+        durability: Durability,
+        preallocate: bool = False,
+    ):
+        if atomic:
+            TextfileWriter._process_file_atomic(
+                payload=payload,
+                file_path=file_path,
+                binary=binary,
+                chunk_size=chunk_size,
+                durability=durability,
+                preallocate=preallocate,
+            )
+            return
+
         file_handle = None
         try:
             # create file in write mode
-            file_handle = TextfileWriter._create_file(file_path=file_path, mode="w")
+            file_handle = TextfileWriter._create_file(
+                file_path=file_path,
+                mode=TextfileWriter._get_file_mode(
+                    create_mode="w", binary=binary, preallocate=preallocate
+                ),
+            )
 
-            was_write_succesful = False
             # write to file
-            was_write_succesful = TextfileWriter._write_to_file(
-                file_handle=file_handle, text_to_write=text_to_write
-            )
-            print(
-                "Writing to file was successful."
-                if was_write_succesful
-                else "Writing to file was not successful."
+            TextfileWriter._write_payload(
+                file_handle=file_handle,
+                payload=payload,
+                binary=binary,
+                chunk_size=chunk_size,
+                durability=durability,
+                preallocate=preallocate,
             )
+
+            if durability is Durability.FSYNC_DIR:
+                TextfileWriter._sync_directory(
+                    dir_path=os.path.dirname(os.path.abspath(file_path))
+                )
         except Exception as e:
             # rollback: if file was already created, delete the file again
-            if TextfileWriter._check_for_file_presence(file_path=file_path):
-                TextfileWriter._delete_file(file_path=file_path)
+            with TextfileWriter._measure(phase=instr.PHASE_ROLLBACK):
+                if TextfileWriter._check_for_file_presence(file_path=file_path):
+                    TextfileWriter._delete_file(file_path=file_path)
+
+            raise e
+        finally:
+            # cleanup: close the file-handle
+            if file_handle is not None:
+                if TextfileWriter._check_for_open_file_handle(file_handle=file_handle):
+                    TextfileWriter._close_file_handle(file_handle=file_handle)
+
+    @staticmethod
+    def _process_file_atomic(
+        payload: Union[TextSource, BinarySource],
+        file_path: str,
+        binary: bool,
+        chunk_size: int,
+        durability: Durability,
+        preallocate: bool = False,
+    ):
+        """
+        Writes 'payload' to the file at 'file_path' atomically.
+
+        The payload is written to a temporary sibling file, which is synced
+        according to 'durability' and closed, and only then renamed onto
+        'file_path' via 'os.replace'.
+        Thus readers either see the previous file (or no file at all) or the
+        completely written new file, but never a half-written one.
+        The rollback only has to delete the temporary file; an already
+        existing file at 'file_path' is left untouched on failure.
+
+        Args:
+            payload (Union[TextSource, BinarySource]): The text resp. the data
+                                                       that shall be written.
+            file_path (str): The file path of the file to write.
+            binary (bool): Whether 'payload' is binary.
+            chunk_size (int): The size of the chunks written to the file
+                              when 'payload' is not a single object.
+            durability (Durability): The durability policy for the file.
+            preallocate (bool): Whether the file shall be preallocated and
+                                written via a memory-map.
+
+        Raises:
+            FileCreationError: If the temporary file cannot be created.
+            FileReplaceError: If the temporary file cannot be renamed
+                              onto 'file_path'.
+            FileDeletionError: If the rollback fails, i.e. the temporary
+                               file cannot be deleted.
+            FileHandleCloseError: If the file handle cannot be closed.
+        """
+        temp_file_path = TextfileWriter._get_temp_file_path(file_path=file_path)
+        file_handle = None
+        try:
+            # create the temporary file in exclusive-creation mode
+            file_handle = TextfileWriter._create_file(
+                file_path=temp_file_path,
+                mode=TextfileWriter._get_file_mode(
+                    create_mode="x", binary=binary, preallocate=preallocate
+                ),
+            )
+
+            # a failed sync raises, so that an un-synced temporary file
+            # never replaces the target
+            TextfileWriter._write_payload(
+                file_handle=file_handle,
+                payload=payload,
+                binary=binary,
+                chunk_size=chunk_size,
+                durability=durability,
+                preallocate=preallocate,
+            )
+
+            # the file-handle must be closed before the temporary file
+            # can be renamed (at least on Windows)
+            TextfileWriter._close_file_handle(file_handle=file_handle)
+
+            TextfileWriter._replace_file(
+                source_path=temp_file_path, target_path=file_path
+            )
+
+            if durability is Durability.FSYNC_DIR:
+                TextfileWriter._sync_directory(
+                    dir_path=os.path.dirname(os.path.abspath(file_path))
+                )
+        except Exception as e:
+            # rollback: if the temporary file was already created, delete it again
+            with TextfileWriter._measure(phase=instr.PHASE_ROLLBACK):
+                if TextfileWriter._check_for_file_presence(file_path=temp_file_path):
+                    TextfileWriter._delete_file(file_path=temp_file_path)
 
             raise e
         finally:
@@ -73,39 +339,687 @@ class TextfileWriter:
                 if TextfileWriter._check_for_open_file_handle(file_handle=file_handle):
                     TextfileWriter._close_file_handle(file_handle=file_handle)
 
+    @staticmethod
+    def process_textfiles(
+        items: Iterable[Tuple[str, TextSource]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        durability: Durability = Durability.FSYNC_DIR,
+    ):
+        """
+        Writes multiple textfiles as one batch with a single group-commit.
+
+        Every file is created and written without an individual fsync.
+        Only after all files were written, durability is established in
+        one group-commit phase: by default every file is fsynced, and every
+        distinct parent directory is fsynced exactly once.
+
+        The batch is all-or-nothing: If any step fails, every file created
+        by this batch is deleted again (rollback) and the exception is re-raised.
+
+        Args:
+            items (Iterable[Tuple[str, TextSource]]): The (file_path, text_to_write)-
+                                                      pairs to write.
+            chunk_size (int): The size of the chunks written to the files
+                              whose text is not a string.
+            durability (Durability): The durability policy applied in the
+                                     group-commit phase.
+
+        Raises:
+            FileCreationError: If one of the files cannot be created.
+            FileDeletionError: If the rollback fails, i.e. at least one of the
+                               created files could not be deleted again.
+            FileHandleCloseError: If one of the file handles cannot be closed.
+        """
+        created_file_paths = []
+        try:
+            for file_path, text_to_write in items:
+                file_handle = None
+                try:
+                    file_handle = TextfileWriter._create_file(
+                        file_path=file_path, mode="w"
+                    )
+                    created_file_paths.append(file_path)
+
+                    TextfileWriter._write_text(
+                        file_handle=file_handle,
+                        text_to_write=text_to_write,
+                        chunk_size=chunk_size,
+                    )
+                finally:
+                    # cleanup: close the file-handle (keeping all handles open
+                    # until the group-commit could exhaust the file descriptors)
+                    if file_handle is not None:
+                        if TextfileWriter._check_for_open_file_handle(
+                            file_handle=file_handle
+                        ):
+                            TextfileWriter._close_file_handle(file_handle=file_handle)
+
+            # group-commit: make the whole batch durable at once
+            TextfileWriter._commit_files(
+                file_paths=created_file_paths, durability=durability
+            )
+        except Exception as e:
+            # rollback: delete every file created by this batch. All deletions
+            # are attempted before a potential FileDeletionError is raised.
+            deletion_failed = False
+            with TextfileWriter._measure(phase=instr.PHASE_ROLLBACK):
+                for created_file_path in created_file_paths:
+                    if TextfileWriter._check_for_file_presence(
+                        file_path=created_file_path
+                    ):
+                        try:
+                            TextfileWriter._delete_file(file_path=created_file_path)
+                        except FileDeletionError:
+                            deletion_failed = True
+
+            if deletion_failed:
+                raise FileDeletionError from e
+
+            raise e
+
     @staticmethod
     def _create_file(file_path: str, mode: str) -> TextIOWrapper:
         try:
-            file_handle = open(file=file_path, mode=mode)
+            with TextfileWriter._measure(phase=instr.PHASE_OPEN):
+                file_handle = open(file=file_path, mode=mode)
         except:
             raise FileCreationError
 
         return file_handle
 
     @staticmethod
-    def _write_to_file(file_handle: TextIOWrapper, text_to_write: str) -> bool:
+    def _get_file_mode(create_mode: str, binary: bool, preallocate: bool) -> str:
+        """
+        Builds the mode for opening a file.
+
+        Args:
+            create_mode (str): Either "w" (create or truncate) or "x"
+                               (exclusive creation).
+            binary (bool): Whether the file is opened in binary mode.
+            preallocate (bool): Whether the file is memory-mapped, which
+                                requires it to be readable too.
+
+        Returns:
+            (str): The mode for 'open'.
+        """
+        if not binary:
+            return create_mode
+
+        return create_mode + ("+b" if preallocate else "b")
+
+    @staticmethod
+    def _write_payload(
+        file_handle: Union[TextIOWrapper, BufferedWriter],
+        payload: Union[TextSource, BinarySource],
+        binary: bool,
+        chunk_size: int,
+        durability: Durability,
+        preallocate: bool = False,
+    ) -> bool:
+        """
+        Writes 'payload' to the 'file_handle' via '_write_to_file' (text)
+        resp. '_write_binary_to_file' (binary).
+
+        Args:
+            file_handle (Union[TextIOWrapper, BufferedWriter]): The file-handle in
+                                                                writable-mode.
+            payload (Union[TextSource, BinarySource]): The text resp. the data
+                                                       that shall be written.
+            binary (bool): Whether 'payload' is binary.
+            chunk_size (int): The size of the chunks written to the file
+                              when 'payload' is not a single object.
+            durability (Durability): The durability policy for the file.
+            preallocate (bool): Whether the file shall be preallocated and
+                                written via a memory-map.
+
+        Returns:
+            (bool): True, once the payload was written to the file and synced.
+
+        Raises:
+            OSError: If the file could not be synced to disk.
+        """
+        if binary:
+            return TextfileWriter._write_binary_to_file(
+                file_handle=file_handle,
+                data=payload,
+                chunk_size=chunk_size,
+                durability=durability,
+                preallocate=preallocate,
+            )
+
+        return TextfileWriter._write_to_file(
+            file_handle=file_handle,
+            text_to_write=payload,
+            chunk_size=chunk_size,
+            durability=durability,
+        )
+
+    @staticmethod
+    def _write_binary_to_file(
+        file_handle: BufferedWriter,
+        data: BinarySource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        durability: Durability = Durability.FSYNC,
+        preallocate: bool = False,
+    ) -> bool:
+        """
+        Writes the binary 'data' to the file passed in as a 'file_handle'.
+
+        Args:
+            file_handle (BufferedWriter): The file-handle in binary writable-mode
+                                          where 'data' shall be written to.
+            data (BinarySource): The data that shall be written to the file.
+            chunk_size (int): The size of the chunks written to the file
+                              when 'data' is not a bytes-like object.
+            durability (Durability): The durability policy for the file.
+            preallocate (bool): Whether the file shall be preallocated and written
+                                via a memory-map (requires a bytes-like 'data').
+
+        Returns:
+            (bool): True, once the data was written to the file and synced.
+
+        Raises:
+            OSError: If the file could not be synced to disk.
+        """
+        if preallocate:
+            TextfileWriter._write_bytes_mmap(
+                file_handle=file_handle, data=data, durability=durability
+            )
+        else:
+            TextfileWriter._write_bytes(
+                file_handle=file_handle, data=data, chunk_size=chunk_size
+            )
+
+        return TextfileWriter._sync_file(file_handle=file_handle, durability=durability)
+
+    @staticmethod
+    def _write_bytes(
+        file_handle: BufferedWriter,
+        data: BinarySource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Writes the binary 'data' to the 'file_handle' (without flushing it).
+
+        Bytes-like objects are handed over as they are; large writes bypass
+        Python´s internal buffer, so no copy of 'data' is made. Readable
+        files are copied via '_copy_from_file', iterables of chunks are
+        written chunk by chunk.
+
+        Args:
+            file_handle (BufferedWriter): The file-handle in binary writable-mode
+                                          where 'data' shall be written to.
+            data (BinarySource): The data that shall be written to the file.
+            chunk_size (int): The size of the chunks written to the file
+                              when 'data' is not a bytes-like object.
+
+        Raises:
+            ValueError: If 'chunk_size' is not a positive integer.
+        """
+        with TextfileWriter._measure(phase=instr.PHASE_WRITE) as timer:
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                file_handle.write(data)
+                timer.size = memoryview(data).nbytes
+                return
+
+            if chunk_size < 1:
+                raise ValueError("'chunk_size' needs to be a positive integer.")
+
+            if hasattr(data, "read"):
+                timer.size = TextfileWriter._copy_from_file(
+                    file_handle=file_handle, source=data, chunk_size=chunk_size
+                )
+                return
+
+            written_size = 0
+            for chunk in data:
+                file_handle.write(chunk)
+                written_size += memoryview(chunk).nbytes
+
+            timer.size = written_size
+
+    @staticmethod
+    def _copy_from_file(
+        file_handle: BufferedWriter, source: BinaryIO, chunk_size: int
+    ) -> int:
+        """
+        Copies the remaining content of the readable binary file 'source'
+        to the 'file_handle'.
+
+        If both are real files, the content is copied inside the kernel
+        (see '_copy_fd_range'). Otherwise, the content is read chunk-wise
+        into a single reusable buffer.
+
+        Args:
+            file_handle (BufferedWriter): The file-handle in binary writable-mode.
+            source (BinaryIO): The readable binary file to copy from.
+            chunk_size (int): The size of the chunks for the fallback copy.
+
+        Returns:
+            (int): The number of copied bytes.
+        """
+        try:
+            source_fd = source.fileno()
+            offset = source.tell()
+        except (AttributeError, OSError, ValueError):
+            source_fd = None
+
+        if source_fd is not None:
+            # the kernel writes directly to the file descriptor, so Python´s
+            # internal buffer must be emptied first
+            file_handle.flush()
+            copied_size = TextfileWriter._copy_fd_range(
+                source_fd=source_fd,
+                target_fd=file_handle.fileno(),
+                offset=offset,
+            )
+            if copied_size is not None:
+                source.seek(offset + copied_size)
+                return copied_size
+
+        copied_size = 0
+        buffer = memoryview(bytearray(chunk_size))
+        if hasattr(source, "readinto"):
+            while True:
+                read_size = source.readinto(buffer)
+                if not read_size:
+                    break
+                file_handle.write(buffer[:read_size])
+                copied_size += read_size
+        else:
+            for chunk in iter(lambda: source.read(chunk_size), b""):
+                file_handle.write(chunk)
+                copied_size += len(chunk)
+
+        return copied_size
+
+    @staticmethod
+    def _copy_fd_range(source_fd: int, target_fd: int, offset: int) -> Optional[int]:
+        """
+        Copies everything from 'offset' on of the file 'source_fd' to the
+        current position of the file 'target_fd' inside the kernel, via
+        'os.copy_file_range' or, if unavailable, 'os.sendfile'.
+
+        Args:
+            source_fd (int): The file descriptor to copy from.
+            target_fd (int): The file descriptor to copy to.
+            offset (int): The position in 'source_fd' to start copying from.
+
+        Returns:
+            (Optional[int]): The number of copied bytes, or None if no
+                             kernel copy is supported for these files (and
+                             nothing was copied).
+
+        Raises:
+            OSError: If the kernel copy failed after some bytes were copied.
+        """
+        kernel_copy_functions = []
+        if hasattr(os, "copy_file_range"):
+            kernel_copy_functions.append(
+                lambda position: os.copy_file_range(
+                    source_fd, target_fd, _KERNEL_COPY_SIZE, position
+                )
+            )
+        if hasattr(os, "sendfile") and os.name == "posix":
+            kernel_copy_functions.append(
+                lambda position: os.sendfile(
+                    target_fd, source_fd, position, _KERNEL_COPY_SIZE
+                )
+            )
+
+        for kernel_copy_function in kernel_copy_functions:
+            copied_size = 0
+            try:
+                while True:
+                    size = kernel_copy_function(offset + copied_size)
+                    if size == 0:
+                        return copied_size
+                    copied_size += size
+            except OSError as e:
+                if copied_size or e.errno not in _KERNEL_COPY_UNSUPPORTED_ERRNOS:
+                    raise
+
+        return None
+
+    @staticmethod
+    def _write_bytes_mmap(
+        file_handle: BufferedWriter, data: BytesLike, durability: Durability
+    ):
+        """
+        Preallocates the file to the size of 'data' and copies 'data'
+        into a memory-map of the file.
+
+        Args:
+            file_handle (BufferedWriter): The file-handle in binary read-write-mode.
+            data (BytesLike): The data that shall be written to the file.
+            durability (Durability): The durability policy for the file; for
+                                     the syncing ones the memory-map is flushed.
+        """
+        import mmap
+
+        view = memoryview(data).cast("B")
+        with TextfileWriter._measure(phase=instr.PHASE_WRITE) as timer:
+            fd = file_handle.fileno()
+            try:
+                # reserves the disk blocks up-front (where supported)
+                os.posix_fallocate(fd, 0, view.nbytes)
+            except (AttributeError, OSError):
+                os.ftruncate(fd, view.nbytes)
+
+            # an empty file cannot be memory-mapped
+            if view.nbytes:
+                mapping = mmap.mmap(fd, view.nbytes)
+                try:
+                    mapping[:] = view
+                    if durability not in (Durability.NONE, Durability.FLUSH):
+                        mapping.flush()
+                finally:
+                    mapping.close()
+
+            timer.size = view.nbytes
+
+    @staticmethod
+    def _write_to_file(
+        file_handle: TextIOWrapper,
+        text_to_write: TextSource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        durability: Durability = Durability.FSYNC,
+    ) -> bool:
         """
         Writes 'text_to_write' to the file passed in as a 'file_handle'.
 
         Args:
             file_handle (TextIOWrapper): The file-handle in writable-mode where
                                          'text_to_write' shall be written to.
-            text_to_write (str): The text that shall be written to the file.
+            text_to_write (TextSource): The text that shall be written to the file.
+            chunk_size (int): The size of the chunks written to the file
+                              when 'text_to_write' is not a string.
+            durability (Durability): The durability policy for the file.
 
         Returns:
-            (bool): True, if the text was successfully written to the file,
-                    False otherwise.
+            (bool): True, once the text was written to the file and synced.
+
+        Raises:
+            OSError: If the file could not be synced to disk.
         """
-        file_handle.write(text_to_write)
-        file_handle.flush()
+        TextfileWriter._write_text(
+            file_handle=file_handle, text_to_write=text_to_write, chunk_size=chunk_size
+        )
 
-        try:
-            os.fsync(file_handle.fileno())
-            print("Flushed safely to disk.")
+        return TextfileWriter._sync_file(file_handle=file_handle, durability=durability)
+
+    @staticmethod
+    def _sync_file(file_handle: TextIOWrapper, durability: Durability) -> bool:
+        """
+        Flushes and syncs the 'file_handle' according to 'durability'.
+
+        Args:
+            file_handle (TextIOWrapper): The file-handle in writable-mode to sync.
+            durability (Durability): The durability policy for the file.
+
+        Returns:
+            (bool): True, once the file was synced as requested by 'durability'.
+
+        Raises:
+            OSError: If the file could not be synced to disk (which is also
+                     reported to the instrumentation); like in
+                     'process_textfiles', this triggers the rollback.
+        """
+        if durability is Durability.NONE:
             return True
-        except OSError as e:
-            print(f"Flush failed. Exception: {e}.")
-            return False
+
+        with TextfileWriter._measure(phase=instr.PHASE_FLUSH):
+            file_handle.flush()
+
+        if durability is Durability.FLUSH:
+            return True
+
+        TextfileWriter._sync_fd(fd=file_handle.fileno(), durability=durability)
+        return True
+
+    @staticmethod
+    def _sync_fd(fd: int, durability: Durability):
+        """
+        Syncs the file descriptor 'fd' to disk, via 'os.fdatasync' for
+        Durability.FDATASYNC (where available) and via 'os.fsync' otherwise.
+
+        Args:
+            fd (int): The file descriptor to sync.
+            durability (Durability): The durability policy for the file.
+
+        Raises:
+            OSError: If the file descriptor could not be synced.
+        """
+        with TextfileWriter._measure(phase=instr.PHASE_FSYNC):
+            if durability is Durability.FDATASYNC and hasattr(os, "fdatasync"):
+                os.fdatasync(fd)
+            else:
+                os.fsync(fd)
+
+    @staticmethod
+    def _write_text(
+        file_handle: TextIOWrapper,
+        text_to_write: TextSource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Writes 'text_to_write' to the 'file_handle' (without flushing it).
+
+        A string is written as a whole. Any other text source is streamed
+        to the file in chunks of (at least) 'chunk_size' characters, so that
+        the complete text never has to be held in memory.
+
+        If instrumentation is enabled, the size of the write-phase is the
+        number of bytes written (after encoding the text and translating its
+        newlines), taken from the file position (resp. the number of encoded
+        bytes for a file without position, e.g. a pipe).
+
+        Args:
+            file_handle (TextIOWrapper): The file-handle in writable-mode where
+                                         'text_to_write' shall be written to.
+            text_to_write (TextSource): The text that shall be written to the file.
+            chunk_size (int): The size of the chunks written to the file
+                              when 'text_to_write' is not a string.
+
+        Raises:
+            ValueError: If 'chunk_size' is not a positive integer.
+        """
+        with TextfileWriter._measure(phase=instr.PHASE_WRITE) as timer:
+            # the size is only determined if it is recorded at all
+            measure_size = TextfileWriter.instrumentation.enabled
+            seekable = measure_size and file_handle.seekable()
+            count_encoded = measure_size and not seekable
+            start_position = file_handle.tell() if seekable else 0
+            written_size = 0
+
+            if isinstance(text_to_write, str):
+                file_handle.write(text_to_write)
+                if count_encoded:
+                    written_size = TextfileWriter._encoded_size(
+                        file_handle=file_handle, text=text_to_write
+                    )
+            else:
+                if chunk_size < 1:
+                    raise ValueError("'chunk_size' needs to be a positive integer.")
+
+                buffer = []
+                buffered_size = 0
+                for chunk in TextfileWriter._iter_chunks(
+                    text_source=text_to_write, chunk_size=chunk_size
+                ):
+                    buffer.append(chunk)
+                    buffered_size += len(chunk)
+
+                    if buffered_size >= chunk_size:
+                        text = "".join(buffer)
+                        file_handle.write(text)
+                        if count_encoded:
+                            written_size += TextfileWriter._encoded_size(
+                                file_handle=file_handle, text=text
+                            )
+                        buffer.clear()
+                        buffered_size = 0
+
+                if buffer:
+                    text = "".join(buffer)
+                    file_handle.write(text)
+                    if count_encoded:
+                        written_size += TextfileWriter._encoded_size(
+                            file_handle=file_handle, text=text
+                        )
+
+            if seekable:
+                written_size = file_handle.tell() - start_position
+            timer.size = written_size
+
+    @staticmethod
+    def _encoded_size(file_handle: TextIOWrapper, text: str) -> int:
+        """
+        Returns the number of bytes of 'text' in the encoding of 'file_handle'
+        (for a file without position, e.g. a pipe).
+        """
+        return len(text.encode(file_handle.encoding, file_handle.errors))
+
+    @staticmethod
+    def _iter_chunks(text_source: TextSource, chunk_size: int) -> Iterator[str]:
+        """
+        Iterates over the chunks of 'text_source'.
+
+        Args:
+            text_source (TextSource): Either an iterable of string-chunks or a
+                                      readable file-like object.
+            chunk_size (int): The number of characters read per chunk
+                              from a file-like object.
+
+        Returns:
+            (Iterator[str]): The chunks of 'text_source'.
+
+        Raises:
+            TypeError: If a chunk is not of type 'str' (e.g. read from a
+                       file-like object in binary-mode).
+        """
+        if hasattr(text_source, "read"):
+            # any empty chunk ('""', or 'b""' of a binary file) marks the end
+            chunks = iter(lambda: text_source.read(chunk_size) or None, None)
+        else:
+            chunks = iter(text_source)
+
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError("Every chunk of the text needs to be of type 'str'.")
+            yield chunk
+
+    @staticmethod
+    def _commit_files(file_paths: List[str], durability: Durability):
+        """
+        Makes already written and closed files durable (group-commit).
+
+        Every file in 'file_paths' is synced according to 'durability'.
+        For Durability.FSYNC_DIR, afterwards every distinct parent directory
+        is fsynced exactly once, so that the directory entries of newly
+        created files are durable too. For Durability.NONE and
+        Durability.FLUSH nothing is done, since closing the files already
+        handed their content over to the operating system.
+
+        Args:
+            file_paths (List[str]): The file paths of the files to commit.
+            durability (Durability): The durability policy for the files.
+
+        Raises:
+            OSError: If a file or a directory could not be synced.
+        """
+        if durability in (Durability.NONE, Durability.FLUSH):
+            return
+
+        for file_path in file_paths:
+            TextfileWriter._sync_file_path(file_path=file_path, durability=durability)
+
+        if durability is not Durability.FSYNC_DIR:
+            return
+
+        dir_paths = dict.fromkeys(
+            os.path.dirname(os.path.abspath(file_path)) for file_path in file_paths
+        )
+        for dir_path in dir_paths:
+            TextfileWriter._sync_directory(dir_path=dir_path)
+
+    @staticmethod
+    def _sync_file_path(file_path: str, durability: Durability):
+        """
+        Syncs the (already closed) file at 'file_path' to disk.
+
+        Args:
+            file_path (str): The file path of the file to sync.
+            durability (Durability): The durability policy for the file.
+
+        Raises:
+            OSError: If the file could not be opened or synced.
+        """
+        fd = os.open(file_path, os.O_RDWR)
+        try:
+            TextfileWriter._sync_fd(fd=fd, durability=durability)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _sync_directory(dir_path: str):
+        """
+        Fsyncs the directory at 'dir_path', which makes the creation
+        (or renaming) of the files inside it durable.
+
+        On non-POSIX systems (i.e. Windows), directories cannot be opened
+        and thus not be fsynced, so nothing is done there.
+
+        Args:
+            dir_path (str): The path of the directory to fsync.
+
+        Raises:
+            OSError: If the directory could not be opened or fsynced.
+        """
+        if os.name != "posix":
+            return
+
+        fd = os.open(dir_path, os.O_RDONLY)
+        try:
+            with TextfileWriter._measure(phase=instr.PHASE_FSYNC):
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _get_temp_file_path(file_path: str) -> str:
+        """
+        Creates a unique path for a temporary (hidden) file in the same
+        directory as 'file_path'. Being in the same directory (and thus on
+        the same filesystem) is required for the rename to be atomic.
+
+        Args:
+            file_path (str): The file path of the target file.
+
+        Returns:
+            (str): The file path of the temporary file.
+        """
+        dir_path, filename = os.path.split(os.fspath(file_path))
+        # 128 random bits, like a 'uuid.uuid4' (without importing 'uuid')
+        return os.path.join(dir_path, f".{filename}.{os.urandom(16).hex()}.tmp")
+
+    @staticmethod
+    def _replace_file(source_path: str, target_path: str):
+        """
+        Atomically renames the file at 'source_path' onto 'target_path',
+        replacing a potentially existing file at 'target_path'.
+
+        Args:
+            source_path (str): The file path of the file to rename.
+            target_path (str): The file path the file shall be renamed to.
+
+        Raises:
+            FileReplaceError: If the file could not be renamed.
+        """
+        try:
+            os.replace(source_path, target_path)
+        except:
+            raise FileReplaceError
 
     @staticmethod
     def _check_for_file_presence(file_path: str) -> bool:
@@ -174,13 +1088,29 @@ class TextfileWriter:
             FileHandleCloseError: If the file handle could not be closed.
         """
         try:
-            file_handle.close()
-            assert file_handle.closed
-            print(f"File handle was closed successfully.")
+            with TextfileWriter._measure(phase=instr.PHASE_CLOSE):
+                file_handle.close()
+                assert file_handle.closed
         except:
-            print(f"File handle could not be closed.")
             raise FileHandleCloseError
 
+    @staticmethod
+    def _measure(phase: str):
+        """
+        Creates a context-manager which reports the duration of 'phase'
+        to the instrumentation of 'TextfileWriter'.
+
+        Args:
+            phase (str): The phase to measure.
+
+        Returns:
+            A context-manager; its attribute 'size' can be set to the number
+            of bytes written in this phase.
+        """
+        return instr.measure(
+            instrumentation=TextfileWriter.instrumentation, phase=phase
+        )
+
 
 # -----TEST----------
 # TextfileWriter.process_textfile(text_to_write=text_to_write, file_path=file_path)
@@ -0,0 +1,346 @@
+"""
+Benchmark suite for the write throughput and latency of 'TextfileWriter'.
+
+Usage:
+    python -m unittest_training.projects.textfile_writer.textfile_writer_benchmark \
+        --durability none fsync --output results.json [--compare baseline.json]
+
+Every scenario is run once per durability level inside a temporary directory.
+For every run, the operations per second, the throughput (MB/s) and the
+p50/p99 latency of a single operation are reported. The results are written
+as JSON, so that two runs can be compared (e.g. to detect regressions).
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from unittest_training.projects.textfile_writer.textfile_writer import (
+    Durability,
+    TextfileWriter,
+)
+
+RESULTS_FORMAT_VERSION = 1
+
+# The metrics where a higher value is better; for all other metrics
+# (the latencies) a lower value is better.
+_HIGHER_IS_BETTER = ("ops_per_sec", "mb_per_sec")
+
+
+def _run_small_file(directory: str, durability: Durability, config: dict) -> dict:
+    """
+    Writes many small files, one 'process_textfile'-call per file.
+    """
+    text = "x" * config["small_file_size"]
+    latencies = []
+    for i in range(config["small_file_count"]):
+        file_path = os.path.join(directory, f"small_{i}.txt")
+        start = time.perf_counter()
+        TextfileWriter.process_textfile(
+            text_to_write=text, file_path=file_path, durability=durability
+        )
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        "latencies": latencies,
+        "operations": config["small_file_count"],
+        "bytes": config["small_file_count"] * config["small_file_size"],
+    }
+
+
+def _run_large_file(directory: str, durability: Durability, config: dict) -> dict:
+    """
+    Writes a few large files, which are streamed in chunks.
+    """
+    chunk = "x" * config["large_file_chunk_size"]
+    chunk_count = max(1, config["large_file_size"] // len(chunk))
+    latencies = []
+    for i in range(config["large_file_count"]):
+        file_path = os.path.join(directory, f"large_{i}.txt")
+        start = time.perf_counter()
+        TextfileWriter.process_textfile(
+            text_to_write=(chunk for _ in range(chunk_count)),
+            file_path=file_path,
+            chunk_size=len(chunk),
+            durability=durability,
+        )
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        "latencies": latencies,
+        "operations": config["large_file_count"],
+        "bytes": config["large_file_count"] * chunk_count * len(chunk),
+    }
+
+
+def _run_many_file(directory: str, durability: Durability, config: dict) -> dict:
+    """
+    Writes many small files in batches via 'process_textfiles';
+    one operation is one batch.
+    """
+    text = "x" * config["small_file_size"]
+    batch_size = config["many_file_batch_size"]
+    latencies = []
+    for batch in range(config["many_file_batch_count"]):
+        items = [
+            (os.path.join(directory, f"many_{batch}_{i}.txt"), text)
+            for i in range(batch_size)
+        ]
+        start = time.perf_counter()
+        TextfileWriter.process_textfiles(items=items, durability=durability)
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        "latencies": latencies,
+        "operations": config["many_file_batch_count"],
+        "bytes": config["many_file_batch_count"] * batch_size * len(text),
+    }
+
+
+SCENARIOS: Dict[str, Callable[[str, Durability, dict], dict]] = {
+    "small-file": _run_small_file,
+    "large-file": _run_large_file,
+    "many-file": _run_many_file,
+}
+
+DEFAULT_CONFIG = {
+    "small_file_count": 500,
+    "small_file_size": 1024,
+    "large_file_count": 3,
+    "large_file_size": 64 * 1024 * 1024,
+    "large_file_chunk_size": 64 * 1024,
+    "many_file_batch_count": 5,
+    "many_file_batch_size": 200,
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Computes the 'q'-th percentile of 'values' (nearest-rank method).
+
+    Args:
+        values (List[float]): The values; must not be empty.
+        q (float): The percentile, between 0 and 100.
+
+    Returns:
+        (float): The percentile.
+    """
+    sorted_values = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_benchmark(
+    directory: Optional[str] = None,
+    scenarios: Optional[List[str]] = None,
+    durabilities: Optional[List[Durability]] = None,
+    config: Optional[dict] = None,
+) -> dict:
+    """
+    Runs the benchmark scenarios.
+
+    Args:
+        directory (Optional[str]): The directory in which the temporary
+                                   benchmark directories are created
+                                   (default: the system´s temp directory).
+        scenarios (Optional[List[str]]): The names of the scenarios to run
+                                         (default: all 'SCENARIOS').
+        durabilities (Optional[List[Durability]]): The durability levels to run
+                                                   every scenario with
+                                                   (default: NONE and FSYNC).
+        config (Optional[dict]): Overrides for 'DEFAULT_CONFIG'.
+
+    Returns:
+        (dict): The machine-readable results.
+    """
+    scenarios = list(SCENARIOS) if scenarios is None else scenarios
+    durabilities = (
+        [Durability.NONE, Durability.FSYNC] if durabilities is None else durabilities
+    )
+    config = {**DEFAULT_CONFIG, **(config or {})}
+
+    results = []
+    for scenario in scenarios:
+        for durability in durabilities:
+            with tempfile.TemporaryDirectory(dir=directory) as run_directory:
+                start = time.perf_counter()
+                run = SCENARIOS[scenario](run_directory, durability, config)
+                seconds = time.perf_counter() - start
+
+            results.append(
+                {
+                    "scenario": scenario,
+                    "durability": durability.value,
+                    "operations": run["operations"],
+                    "bytes": run["bytes"],
+                    "seconds": seconds,
+                    "ops_per_sec": run["operations"] / seconds,
+                    "mb_per_sec": run["bytes"] / (1024 * 1024) / seconds,
+                    "p50_ms": percentile(run["latencies"], 50) * 1000,
+                    "p99_ms": percentile(run["latencies"], 99) * 1000,
+                }
+            )
+
+    return {
+        "version": RESULTS_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float = 0.1
+) -> List[dict]:
+    """
+    Compares the results of two benchmark runs.
+
+    Args:
+        baseline (dict): The results of the reference run.
+        current (dict): The results of the run to check.
+        threshold (float): The relative change (e.g. 0.1 for 10%) beyond which
+                           a worse metric counts as a regression.
+
+    Returns:
+        (List[dict]): One entry per scenario, durability and metric present in
+                      both runs, with the relative 'change' (positive means
+                      better) and whether it is a 'regression'.
+    """
+    baseline_results = {
+        (result["scenario"], result["durability"]): result
+        for result in baseline["results"]
+    }
+
+    comparisons = []
+    for result in current["results"]:
+        key = (result["scenario"], result["durability"])
+        if key not in baseline_results:
+            continue
+
+        for metric in ("ops_per_sec", "mb_per_sec", "p50_ms", "p99_ms"):
+            baseline_value = baseline_results[key][metric]
+            current_value = result[metric]
+            if baseline_value == 0:
+                continue
+
+            change = (current_value - baseline_value) / baseline_value
+            if metric not in _HIGHER_IS_BETTER:
+                change = -change
+
+            comparisons.append(
+                {
+                    "scenario": key[0],
+                    "durability": key[1],
+                    "metric": metric,
+                    "baseline": baseline_value,
+                    "current": current_value,
+                    "change": change,
+                    "regression": change < -threshold,
+                }
+            )
+
+    return comparisons
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the write throughput and latency of TextfileWriter."
+    )
+    parser.add_argument(
+        "--scenario",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        help="The scenarios to run (default: all)",
+    )
+    parser.add_argument(
+        "--durability",
+        nargs="+",
+        choices=[durability.value for durability in Durability],
+        default=[Durability.NONE.value, Durability.FSYNC.value],
+        help="The durability levels to run every scenario with "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--directory", help="Where to create the temporary benchmark files"
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Scales the number of files and the size of the large files "
+        "(e.g. 0.1 for a quick run)",
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument(
+        "--compare", help="Compare the results with a previous JSON results file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The relative slowdown counted as a regression (default: %(default)s)",
+    )
+
+    args = parser.parse_args(argv)
+
+    config = dict(DEFAULT_CONFIG)
+    for key in (
+        "small_file_count",
+        "large_file_size",
+        "many_file_batch_count",
+        "many_file_batch_size",
+    ):
+        config[key] = max(1, int(config[key] * args.scale))
+
+    results = run_benchmark(
+        directory=args.directory,
+        scenarios=args.scenario,
+        durabilities=[Durability(durability) for durability in args.durability],
+        config=config,
+    )
+
+    print(
+        f"{'scenario':<12} {'durability':<10} {'ops/s':>10} {'MB/s':>10} "
+        f"{'p50 ms':>10} {'p99 ms':>10}"
+    )
+    for result in results["results"]:
+        print(
+            f"{result['scenario']:<12} {result['durability']:<10} "
+            f"{result['ops_per_sec']:>10.1f} {result['mb_per_sec']:>10.2f} "
+            f"{result['p50_ms']:>10.3f} {result['p99_ms']:>10.3f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        comparisons = compare_results(
+            baseline=baseline, current=results, threshold=args.threshold
+        )
+        for comparison in comparisons:
+            marker = "REGRESSION" if comparison["regression"] else ""
+            print(
+                f"{comparison['scenario']:<12} {comparison['durability']:<10} "
+                f"{comparison['metric']:<12} {comparison['change']:>+8.1%} {marker}"
+            )
+
+        if any(comparison["regression"] for comparison in comparisons):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,309 @@
 import argparse
+import os
+import sys
+from typing import Dict, Iterator, List, Optional, TextIO, Union
 
-from unittest_training.projects.textfile_writer.textfile_writer import TextfileWriter
+from unittest_training.projects.textfile_writer.textfile_writer import (
+    Durability,
+    TextfileWriter,
+)
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     # Setup the argument parser
     parser = argparse.ArgumentParser(
         description="Simple CLI tool to create text files with rollback on error."
     )
 
     # Define command-line arguments
-    parser.add_argument(
-        "--text", required=True, help="The text content to write into the file"
-    )
+    parser.add_argument("--text", help="The text content to write into the file")
     parser.add_argument(
         "--filename",
-        required=True,
         help="Name of the text file to create (e.g. output.txt)",
     )
+    parser.add_argument(
+        "--manifest",
+        help="Bulk mode: a manifest file (or '-' for stdin) listing the files to "
+        "create, with the columns/keys 'filename' and either 'text' or 'source' "
+        "(the path of a file whose content is copied)",
+    )
+    parser.add_argument(
+        "--manifest-format",
+        choices=["jsonl", "csv"],
+        help="The format of the manifest (default: 'csv' for '.csv'-files, "
+        "'jsonl' otherwise)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Bulk mode: the number of files written in parallel (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--atomic",
+        action="store_true",
+        help="Write to a temporary file first and rename it onto the target, "
+        "so that the file is never visible half-written",
+    )
+    parser.add_argument(
+        "--durability",
+        choices=[durability.value for durability in Durability],
+        default=Durability.FSYNC.value,
+        help="How durably the file is written to disk (default: %(default)s)",
+    )
+
+    args = parser.parse_args(argv)
 
-    args = parser.parse_args()
+    if args.manifest is not None:
+        if args.text is not None or args.filename is not None:
+            parser.error("--manifest cannot be combined with --text/--filename")
+        if args.workers < 1:
+            parser.error("--workers needs to be a positive integer")
+
+        return _process_manifest(args=args)
+
+    if args.text is None or args.filename is None:
+        parser.error("the arguments --text and --filename are required")
 
     # Calling the class
-    TextfileWriter.process_textfile(text_to_write=args.text, file_path=args.filename)
+    TextfileWriter.process_textfile(
+        text_to_write=args.text,
+        file_path=args.filename,
+        atomic=args.atomic,
+        durability=Durability(args.durability),
+    )
 
     # (optionally): Printing the output of the method-call
     # print(f"✅ File processed successfully: {result}")
 
+    return 0
+
+
+def _process_manifest(args: argparse.Namespace) -> int:
+    """
+    Writes all entries of the manifest in a thread pool and reports
+    the outcome of every entry.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        (int): The exit code: 0 if all entries were written successfully,
+               1 if at least one entry failed.
+    """
+    manifest_format = args.manifest_format
+    if manifest_format is None:
+        manifest_format = "csv" if args.manifest.lower().endswith(".csv") else "jsonl"
+
+    if args.manifest == "-":
+        entries = list(_read_manifest(manifest_file=sys.stdin, fmt=manifest_format))
+    else:
+        with open(args.manifest, "r", newline="", encoding="utf-8") as manifest_file:
+            entries = list(
+                _read_manifest(manifest_file=manifest_file, fmt=manifest_format)
+            )
+
+    # entries writing the same file would race each other in the pool
+    duplicate_errors = _find_duplicate_destinations(entries=entries)
+
+    def process_entry(entry_index: int) -> Optional[Exception]:
+        if entry_index in duplicate_errors:
+            return duplicate_errors[entry_index]
+
+        try:
+            _process_manifest_entry(
+                entry=entries[entry_index],
+                atomic=args.atomic,
+                durability=Durability(args.durability),
+            )
+        except Exception as e:
+            return e
+
+        return None
+
+    # only needed in bulk mode, so not imported at startup
+    from concurrent.futures import ThreadPoolExecutor
+
+    failure_count = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        # 'map' reports the outcomes in the order of the manifest
+        for entry_number, (entry, error) in enumerate(
+            zip(entries, executor.map(process_entry, range(len(entries)))), start=1
+        ):
+            label = _get_entry_label(entry=entry, entry_number=entry_number)
+            if error is None:
+                print(f"OK      {label}")
+            else:
+                failure_count += 1
+                print(f"FAILED  {label}: {type(error).__name__}: {error}")
+
+    print(
+        f"{len(entries) - failure_count} of {len(entries)} entries written "
+        f"successfully, {failure_count} failed."
+    )
+
+    return 0 if failure_count == 0 else 1
+
+
+def _read_manifest(
+    manifest_file: TextIO, fmt: str
+) -> Iterator[Union[str, Dict[str, str]]]:
+    """
+    Reads the raw entries of a manifest.
+
+    JSON-lines are not decoded here, so that a single malformed line
+    is reported as a failed entry instead of aborting the whole batch.
+
+    Args:
+        manifest_file (TextIO): The opened manifest.
+        fmt (str): The format of the manifest, either 'jsonl' or 'csv'.
+
+    Returns:
+        (Iterator[Union[str, Dict[str, str]]]): The raw JSON-lines resp. the
+                                                 rows of the CSV-file.
+    """
+    if fmt == "csv":
+        import csv
+
+        yield from csv.DictReader(manifest_file)
+    else:
+        for line in manifest_file:
+            if line.strip():
+                yield line
+
+
+def _process_manifest_entry(
+    entry: Union[str, Dict[str, str]], atomic: bool, durability: Durability
+):
+    """
+    Writes the file described by a single manifest entry.
+
+    Args:
+        entry (Union[str, Dict[str, str]]): A raw JSON-line or a CSV-row.
+        atomic (bool): Whether the file shall be written atomically.
+        durability (Durability): The durability policy for the file.
+
+    Raises:
+        ValueError: If the entry is malformed.
+    """
+    if isinstance(entry, str):
+        import json
+
+        entry = json.loads(entry)
+        if not isinstance(entry, dict):
+            raise ValueError("A manifest entry needs to be a JSON-object.")
+
+    filename = entry.get("filename")
+    text = entry.get("text")
+    source = entry.get("source")
+
+    if not isinstance(filename, str) or not filename:
+        raise ValueError("A manifest entry needs a 'filename'.")
+
+    # CSV-rows contain empty strings for unused columns
+    if source is not None and source != "":
+        # anything else than a path (e.g. a number) would be opened
+        # as a file descriptor of this process
+        if not isinstance(source, str):
+            raise ValueError("The 'source' of a manifest entry needs to be a path.")
+        if text is not None and text != "":
+            raise ValueError("A manifest entry needs either 'text' or 'source'.")
+
+        # copied as bytes, so that neither its encoding nor its line endings
+        # matter (and the content is copied inside the kernel where possible)
+        with open(source, "rb") as source_file:
+            TextfileWriter.process_binaryfile(
+                data=source_file,
+                file_path=filename,
+                atomic=atomic,
+                durability=durability,
+            )
+    else:
+        if not isinstance(text, str):
+            raise ValueError("A manifest entry needs either 'text' or 'source'.")
+
+        TextfileWriter.process_textfile(
+            text_to_write=text,
+            file_path=filename,
+            atomic=atomic,
+            durability=durability,
+        )
+
+
+def _find_duplicate_destinations(
+    entries: List[Union[str, Dict[str, str]]],
+) -> Dict[int, ValueError]:
+    """
+    Finds the manifest entries which write the same file as an earlier entry
+    (only the first entry of a file is written).
+
+    Args:
+        entries (List[Union[str, Dict[str, str]]]): The raw JSON-lines resp.
+                                                    the rows of the CSV-file.
+
+    Returns:
+        (Dict[int, ValueError]): The error of every duplicate entry,
+                                 by its index in 'entries'.
+    """
+    first_entry_numbers = {}
+    errors = {}
+    for entry_index, entry in enumerate(entries):
+        filename = _get_entry_filename(entry=entry)
+        # malformed filenames are reported by '_process_manifest_entry'
+        if not isinstance(filename, str) or not filename:
+            continue
+
+        destination = os.path.normcase(os.path.realpath(filename))
+        if destination in first_entry_numbers:
+            errors[entry_index] = ValueError(
+                f"The file '{filename}' is already written by entry "
+                f"#{first_entry_numbers[destination]}."
+            )
+        else:
+            first_entry_numbers[destination] = entry_index + 1
+
+    return errors
+
+
+def _get_entry_filename(entry: Union[str, Dict[str, str]]) -> Optional[object]:
+    """
+    Returns the 'filename' of a manifest entry (None if it has none,
+    or is no valid JSON-object).
+
+    Args:
+        entry (Union[str, Dict[str, str]]): A raw JSON-line or a CSV-row.
+
+    Returns:
+        (Optional[object]): The (unchecked) 'filename' of the entry.
+    """
+    if isinstance(entry, dict):
+        return entry.get("filename")
+
+    import json
+
+    try:
+        decoded_entry = json.loads(entry)
+    except ValueError:
+        return None
+
+    return decoded_entry.get("filename") if isinstance(decoded_entry, dict) else None
+
+
+def _get_entry_label(entry: Union[str, Dict[str, str]], entry_number: int) -> str:
+    """
+    Creates a label for a manifest entry used in the report.
+
+    Args:
+        entry (Union[str, Dict[str, str]]): A raw JSON-line or a CSV-row.
+        entry_number (int): The (1-based) position of the entry in the manifest.
+
+    Returns:
+        (str): The label of the entry.
+    """
+    filename = _get_entry_filename(entry=entry)
+
+    return f"#{entry_number} {filename}" if filename else f"#{entry_number}"
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,7 +1,15 @@
+import array
+import decimal
+import math
+import pickle
 import pytest
+from decimal import Decimal
+from fractions import Fraction
 
 from unittest_training.basics.calculator_basics import (
+    BatchDivisionByZeroError,
     DivisionByZeroError,
+    DivisionMode,
     InvalidInputError,
     Calculator,
 )
@@ -65,3 +73,201 @@ class TestCalculator:
 
         with pytest.raises(InvalidInputError):
             Calculator.divide(a="Hello", b="Hello")  # two valid inputs
+
+    # -----unittests for the batch-division------
+    @staticmethod
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            ([2, 2, -2.5, 0], [4, -5, -5, 0.01], [0.5, -0.4, 0.5, 0.0]),
+            ((1, 2, 3), 2, [0.5, 1.0, 1.5]),  # scalar denominator
+            (array.array("d", [1.0, 3.0]), array.array("i", [2, 4]), [0.5, 0.75]),
+            ([], [], []),
+        ],
+    )
+    def test_divide_many_valid_inputs(a, b, expected):
+        results = Calculator.divide_many(a, b)
+
+        assert results == expected
+        assert all(isinstance(result, float) for result in results)
+
+    @staticmethod
+    def test_divide_many_denominator_zero():
+        # all zero positions are reported, not only the first one
+        with pytest.raises(BatchDivisionByZeroError) as exc_info:
+            Calculator.divide_many([1, 2, 3, 4], [0, 1, 0.0, 2])
+
+        assert exc_info.value.indices == [0, 2]
+
+        # the batch-error is still a 'DivisionByZeroError'
+        with pytest.raises(DivisionByZeroError):
+            Calculator.divide_many([1, 2], 0)
+
+    @staticmethod
+    def test_divide_many_denominator_zero_pickle():
+        error = BatchDivisionByZeroError("Denominator cannot be zero.", indices=[1])
+
+        unpickled_error = pickle.loads(pickle.dumps(error))
+
+        assert unpickled_error.indices == [1]
+        assert str(unpickled_error) == "Denominator cannot be zero."
+
+    @staticmethod
+    def test_divide_many_return_mask():
+        results, zero_mask = Calculator.divide_many(
+            [1, 2, 3], [0, 4, 0], return_mask=True
+        )
+
+        assert zero_mask == [True, False, True]
+        assert results[1] == 0.5
+        assert math.isnan(results[0]) and math.isnan(results[2])
+
+        results, zero_mask = Calculator.divide_many([1, 2], 2, return_mask=True)
+        assert results == [0.5, 1.0]
+        assert zero_mask == [False, False]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ([1, "Hello"], [1, 2]),  # invalid element
+            ([1, 2], [1, None]),  # invalid element
+            ([1, 2], "Hello"),  # invalid denominator
+            ("Hello", [1, 2, 3, 4, 5]),  # invalid numerator
+            ([1, 2], [1, 2, 3]),  # different lengths
+            (array.array("u", "ab"), [1, 2]),  # character array
+        ],
+    )
+    def test_divide_many_invalid_inputs(a, b):
+        with pytest.raises(InvalidInputError):
+            Calculator.divide_many(a, b)
+
+    @staticmethod
+    def test_divide_many_numpy():
+        np = pytest.importorskip("numpy")
+
+        results = Calculator.divide_many(np.array([1, 2, 3]), np.array([2, 4, 5]))
+        assert isinstance(results, np.ndarray)
+        assert results.tolist() == [0.5, 0.5, 0.6]
+
+        with pytest.raises(BatchDivisionByZeroError) as exc_info:
+            Calculator.divide_many(np.array([1.0, 2.0, 3.0]), np.array([0, 1, 0]))
+        assert exc_info.value.indices == [0, 2]
+
+        results, zero_mask = Calculator.divide_many(
+            np.array([1.0, 2.0]), np.array([0.0, 4.0]), return_mask=True
+        )
+        assert zero_mask.tolist() == [True, False]
+        assert np.isnan(results[0]) and results[1] == 0.5
+
+        # a list combined with a NumPy-scalar is divided by NumPy too
+        assert Calculator.divide_many([1, 2], np.int64(2)).tolist() == [0.5, 1.0]
+
+        with pytest.raises(InvalidInputError):
+            Calculator.divide_many(np.array(["a", "b"]), np.array([1, 2]))
+
+    # -------------------------------------------
+
+    # -----unittests for the division-modes-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (7, 2, 3),  # two ints
+            (-7, 2, -4),  # rounded towards negative infinity, not towards zero
+            (7.5, 2, 3),  # float numerator
+            (Decimal("-7.5"), Decimal("2"), -4),  # Decimals
+            (Fraction(7, 2), Fraction(1, 2), 7),  # Fractions
+            (10**30 + 1, 10**15, 10**15),  # beyond the precision of floats
+        ],
+    )
+    def test_divide_floor_int(a, b, expected):
+        result = Calculator.divide(a, b, mode=DivisionMode.FLOOR_INT)
+
+        assert result == expected
+        assert type(result) is int
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (1, 3, Fraction(1, 3)),
+            (0.5, 2, Fraction(1, 4)),  # floats are converted exactly
+            (Decimal("0.1"), 3, Fraction(1, 30)),
+            (Fraction(2, 3), Fraction(4, 9), Fraction(3, 2)),
+        ],
+    )
+    def test_divide_fraction(a, b, expected):
+        result = Calculator.divide(a, b, mode=DivisionMode.FRACTION)
+
+        assert result == expected
+        assert type(result) is Fraction
+
+    @staticmethod
+    def test_divide_decimal():
+        result = Calculator.divide(Decimal("1.00"), 3, mode=DivisionMode.DECIMAL)
+
+        assert type(result) is Decimal
+        assert result == Decimal(1) / Decimal(3)
+
+        # a Fraction operand is converted via the context as well
+        assert Calculator.divide(
+            Fraction(1, 2), Decimal("0.25"), mode=DivisionMode.DECIMAL
+        ) == Decimal(2)
+
+    @staticmethod
+    def test_divide_decimal_with_context():
+        context = decimal.Context(prec=4, rounding=decimal.ROUND_DOWN)
+
+        result = Calculator.divide(2, 3, mode=DivisionMode.DECIMAL, context=context)
+
+        assert result == Decimal("0.6666")
+
+    @staticmethod
+    def test_divide_decimal_uses_the_current_context():
+        with decimal.localcontext() as context:
+            context.prec = 3
+            result = Calculator.divide(1, 7, mode=DivisionMode.DECIMAL)
+
+        assert result == Decimal("0.143")
+
+    @staticmethod
+    def test_divide_float_mode_is_unchanged():
+        # the default mode keeps the contract of always returning a float
+        # (see 'test_divide_valid_inputs_correct_datatype')
+        assert Calculator.divide(7, 2, mode=DivisionMode.FLOAT) == 3.5
+
+        with pytest.raises(InvalidInputError):
+            Calculator.divide(Decimal("1"), 2)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "mode",
+        [DivisionMode.FLOOR_INT, DivisionMode.DECIMAL, DivisionMode.FRACTION],
+    )
+    def test_divide_modes_denominator_zero(mode):
+        with pytest.raises(DivisionByZeroError):
+            Calculator.divide(1, Decimal("0.0"), mode=mode)
+
+        with pytest.raises(DivisionByZeroError):
+            Calculator.divide(1, Fraction(0), mode=mode)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "a, b, mode, context",
+        [
+            ("1", 2, DivisionMode.FRACTION, None),  # invalid operand
+            (1, [2], DivisionMode.DECIMAL, None),  # invalid operand
+            (math.inf, 2, DivisionMode.FRACTION, None),  # not finite
+            (math.nan, 2, DivisionMode.FLOOR_INT, None),  # not finite
+            (1, 2, "fraction", None),  # invalid mode
+            (1, 2, DivisionMode.DECIMAL, "context"),  # invalid context
+            (1, 2, DivisionMode.FLOAT, decimal.Context()),  # context not used
+            (1, 2, DivisionMode.FRACTION, decimal.Context()),  # context not used
+        ],
+    )
+    def test_divide_modes_invalid_inputs(a, b, mode, context):
+        with pytest.raises(InvalidInputError):
+            Calculator.divide(a, b, mode=mode, context=context)
+
+    # -------------------------------------------
@@ -0,0 +1,216 @@
+import pytest
+
+from unittest_training.fixtures.bloom_filter import BloomFilter, BloomFilterInfo
+from unittest_training.fixtures.concurrent_user_manager import ConcurrentUserManager
+from unittest_training.fixtures.user_manager_fixtures import (
+    DuplicateUserError,
+    MissingUserError,
+    UserManager,
+)
+from unittest_training.fixtures.user_storage import SQLiteUserStorage
+
+
+class _CountingStorage(dict):
+    """
+    A dict-storage counting the accesses of single users.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.accesses = 0
+
+    def __getitem__(self, username):
+        self.accesses += 1
+        return super().__getitem__(username)
+
+    def __contains__(self, username):
+        self.accesses += 1
+        return super().__contains__(username)
+
+
+class TestBloomFilter:
+    # -----unittests for BloomFilter-----
+    @staticmethod
+    def test_contains_all_added_values():
+        bloom_filter = BloomFilter(capacity=100)
+        bloom_filter.update(f"user {i}" for i in range(100))
+
+        assert all(f"user {i}" in bloom_filter for i in range(100))
+        assert len(bloom_filter) == 100
+
+    @staticmethod
+    def test_empty_filter_contains_nothing():
+        bloom_filter = BloomFilter()
+
+        assert "Max Mustermann" not in bloom_filter
+        assert "" not in bloom_filter
+
+    @staticmethod
+    @pytest.mark.parametrize("false_positive_rate", [0.1, 0.01])
+    def test_false_positive_rate(false_positive_rate):
+        bloom_filter = BloomFilter(
+            capacity=5000, false_positive_rate=false_positive_rate
+        )
+        bloom_filter.update(f"user {i}" for i in range(5000))
+
+        false_positives = sum(f"missing {i}" in bloom_filter for i in range(20_000))
+
+        # with some tolerance, since the hashes differ between processes
+        assert false_positives / 20_000 < 1.5 * false_positive_rate
+
+    @staticmethod
+    def test_grows_beyond_capacity():
+        bloom_filter = BloomFilter(capacity=100, false_positive_rate=0.01)
+        bloom_filter.update(f"user {i}" for i in range(2000))
+
+        false_positives = sum(f"missing {i}" in bloom_filter for i in range(20_000))
+
+        assert bloom_filter.stage_count == 5  # capacities 100 + 200 + ... + 1600
+        assert all(f"user {i}" in bloom_filter for i in range(2000))
+        assert false_positives / 20_000 < 0.015
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "capacity, false_positive_rate",
+        [
+            (0, 0.01),  # no capacity
+            (1.5, 0.01),  # invalid capacity
+            (True, 0.01),  # bool is no valid capacity
+            (100, 0),  # no false positives are impossible
+            (100, 1),  # every lookup is a false positive
+            (100, "0.01"),  # invalid false_positive_rate
+        ],
+    )
+    def test_invalid_parameters(capacity, false_positive_rate):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, false_positive_rate=false_positive_rate)
+
+    # -------------------------------------------
+
+
+class TestUserManagerBloomFilter:
+    @staticmethod
+    @pytest.fixture
+    def storage() -> _CountingStorage:
+        """
+        Creates a new storage containing two users.
+
+        Returns:
+            _CountingStorage: The new storage.
+        """
+        return _CountingStorage(
+            {"Max Mustermann": "max@test.de", "Erika Musterfrau": "erika@test.de"}
+        )
+
+    # -----unittests for the Bloom filter of UserManager-----
+    @staticmethod
+    def test_without_bloom_filter():
+        assert UserManager().getBloomFilterInfo() is None
+
+    @staticmethod
+    def test_missing_user_does_not_access_storage(storage: _CountingStorage):
+        user_manager = UserManager(storage=storage, bloom_filter=True)
+        storage.accesses = 0
+
+        with pytest.raises(MissingUserError):
+            user_manager.getUserEmail(username="Jürgen Müller")
+
+        assert storage.accesses == 0
+        assert user_manager.getBloomFilterInfo() == BloomFilterInfo(
+            hits=0,
+            misses=1,
+            false_positives=0,
+            size=2,
+            nbytes=user_manager.getBloomFilterInfo().nbytes,
+        )
+
+    @staticmethod
+    def test_existing_user_is_found(storage: _CountingStorage):
+        # the filter is built from the users already contained in the storage
+        user_manager = UserManager(storage=storage, bloom_filter=True)
+
+        assert user_manager.getUserEmail(username="Max Mustermann") == "max@test.de"
+        assert user_manager.getBloomFilterInfo().hits == 1
+
+    @staticmethod
+    def test_added_users_are_found(storage: _CountingStorage):
+        user_manager = UserManager(storage=storage, bloom_filter=True)
+        user_manager.addUser(username="Jürgen Müller", email="juergen@test.de")
+        user_manager.addUsers([("Anna", "anna@test.de"), ("Ben", "ben@test.de")])
+        user_manager.addUsers(
+            [("Clara", "clara@test.de"), ("Anna", "anna@test.de")],
+            all_or_nothing=False,
+        )
+
+        for username in ("Jürgen Müller", "Anna", "Ben", "Clara"):
+            assert user_manager.getUserEmail(username=username) is not None
+        assert user_manager.getBloomFilterInfo().size == 6
+
+    @staticmethod
+    def test_addUser_duplicate_user(storage: _CountingStorage):
+        user_manager = UserManager(storage=storage, bloom_filter=True)
+
+        with pytest.raises(DuplicateUserError):
+            user_manager.addUser(username="Max Mustermann", email="max@test.de")
+
+    @staticmethod
+    def test_false_positives_are_counted(storage: _CountingStorage):
+        user_manager = UserManager(storage=storage, bloom_filter=True)
+        # removed by other means than the manager, thus still in the filter
+        del storage["Max Mustermann"]
+
+        with pytest.raises(MissingUserError):
+            user_manager.getUserEmail(username="Max Mustermann")
+
+        assert user_manager.getBloomFilterInfo().false_positives == 1
+
+        user_manager.rebuildBloomFilter()
+        storage.accesses = 0
+
+        with pytest.raises(MissingUserError):
+            user_manager.getUserEmail(username="Max Mustermann")
+
+        assert storage.accesses == 0
+        assert user_manager.getBloomFilterInfo()[:3] == (0, 1, 1)
+
+    @staticmethod
+    def test_rebuild_enables_bloom_filter(storage: _CountingStorage):
+        user_manager = UserManager(storage=storage)
+
+        user_manager.rebuildBloomFilter()
+
+        assert user_manager.getBloomFilterInfo().size == 2
+
+    @staticmethod
+    def test_rebuild_on_load_of_sqlite_storage(tmp_path):
+        path = str(tmp_path / "users.db")
+        with SQLiteUserStorage(path=path) as storage:
+            UserManager(storage=storage).addUsers(
+                (f"user {i}", f"user{i}@test.de") for i in range(100)
+            )
+
+        with SQLiteUserStorage(path=path) as storage:
+            user_manager = UserManager(storage=storage, bloom_filter=True)
+
+            assert user_manager.getUserEmail(username="user 42") == "user42@test.de"
+            with pytest.raises(MissingUserError):
+                user_manager.getUserEmail(username="user 100")
+            assert user_manager.getBloomFilterInfo().size == 100
+
+    @staticmethod
+    def test_invalid_false_positive_rate():
+        with pytest.raises(ValueError):
+            UserManager(bloom_filter=True, bloom_filter_false_positive_rate=2)
+
+    @staticmethod
+    def test_concurrent_user_manager(storage: _CountingStorage):
+        user_manager = ConcurrentUserManager(storage=storage, bloom_filter=True)
+        user_manager.addUser(username="Jürgen Müller", email="juergen@test.de")
+        user_manager.rebuildBloomFilter()
+
+        assert user_manager.getUserEmail(username="Jürgen Müller") == "juergen@test.de"
+        with pytest.raises(MissingUserError):
+            user_manager.getUserEmail(username="Anna")
+        assert user_manager.getBloomFilterInfo().size == 3
+
+    # -------------------------------------------
@@ -0,0 +1,139 @@
+import pytest
+
+from unittest_training.fixtures.compact_user_manager import (
+    CompactUserManager,
+    measure_memory_per_user,
+)
+from unittest_training.fixtures.user_manager_fixtures import (
+    DuplicateUserError,
+    InvalidInputError,
+    MissingUserError,
+    UserManager,
+)
+
+
+class TestCompactUserManager:
+    @staticmethod
+    @pytest.fixture
+    def user_manager() -> CompactUserManager:
+        """
+        Creates a new instance of 'CompactUserManager'
+
+        Returns:
+            CompactUserManager: The new instance of CompactUserManager.
+        """
+        return CompactUserManager()
+
+    # -----unittests for the API shared with UserManager-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "username, email",
+        [
+            ("Max Mustermann", "max.mustermann@test.de"),
+            ("Jürgen Müller", "jürgen@test.de"),  # non-ASCII characters
+            ("", ""),  # empty strings
+            ("\ud800", "lone@surrogate.de"),  # not encodable as plain UTF-8
+        ],
+    )
+    def test_addUser_getUserEmail_valid_inputs(
+        user_manager: CompactUserManager, username, email
+    ):
+        assert user_manager.addUser(username=username, email=email) == True
+        assert user_manager.getUserEmail(username=username) == email
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "username, email",
+        [
+            ("Max Mustermann", 3.5),  # valid username, invalid email
+            (384, "max.mustermann@test.de"),  # invalid username, valid email
+        ],
+    )
+    def test_addUser_invalid_inputs(user_manager: CompactUserManager, username, email):
+        with pytest.raises(
+            InvalidInputError,
+            match="Both 'username' and 'email' need to be of type 'str'.",
+        ):
+            user_manager.addUser(username=username, email=email)
+
+    @staticmethod
+    def test_addUser_duplicate_user(user_manager: CompactUserManager):
+        user_manager.addUser(username="Max Mustermann", email="max.mustermann@test.de")
+        with pytest.raises(DuplicateUserError, match="User already exists."):
+            user_manager.addUser(
+                username="Max Mustermann", email="another.email@test.de"
+            )
+
+        assert len(user_manager) == 1
+
+    @staticmethod
+    def test_getUserEmail_invalid_input(user_manager: CompactUserManager):
+        with pytest.raises(
+            InvalidInputError, match="'username' needs to be of type 'str'."
+        ):
+            user_manager.getUserEmail(username=254.2418)
+
+    @staticmethod
+    def test_getUserEmail_missing_user(user_manager: CompactUserManager):
+        user_manager.addUser(username="Max Mustermann", email="max.mustermann@test.de")
+        with pytest.raises(
+            MissingUserError,
+            match="The user you look for is not contained in the database.",
+        ):
+            user_manager.getUserEmail(username="Max")
+
+    # -------------------------------------------
+
+    # -----unittests for the compact storage-----
+    @staticmethod
+    def test_many_users(user_manager: CompactUserManager):
+        # enough users to grow the hash table several times
+        for i in range(5000):
+            user_manager.addUser(username=f"user {i}", email=f"user{i}@example.com")
+
+        assert len(user_manager) == 5000
+        assert all(
+            user_manager.getUserEmail(username=f"user {i}") == f"user{i}@example.com"
+            for i in range(5000)
+        )
+        assert "user 4999" in user_manager
+        assert "user 5000" not in user_manager
+        assert 42 not in user_manager
+
+    @staticmethod
+    def test_hash_collisions(user_manager: CompactUserManager, mocker):
+        # with all usernames in one probe-sequence, they are told apart by their bytes
+        mocker.patch(
+            "unittest_training.fixtures.compact_user_manager.hash",
+            return_value=7,
+            create=True,
+        )
+        for i in range(20):
+            user_manager.addUser(username=f"user {i}", email=f"user{i}@test.de")
+
+        assert user_manager.getUserEmail(username="user 13") == "user13@test.de"
+        with pytest.raises(DuplicateUserError):
+            user_manager.addUser(username="user 13", email="other@test.de")
+
+    @staticmethod
+    def test_iterUsers(user_manager: CompactUserManager):
+        user_manager.addUser(username="B", email="b@test.de")
+        user_manager.addUser(username="A", email="a@test.de")
+
+        assert list(user_manager.iterUsers()) == [
+            ("B", "b@test.de"),
+            ("A", "a@test.de"),
+        ]
+
+    @staticmethod
+    def test_uses_less_memory_than_UserManager():
+        compact_memory = measure_memory_per_user(
+            manager_factory=CompactUserManager, user_count=20_000
+        )
+        dict_memory = measure_memory_per_user(
+            manager_factory=UserManager, user_count=20_000
+        )
+
+        assert compact_memory < dict_memory / 2
+
+    # -------------------------------------------
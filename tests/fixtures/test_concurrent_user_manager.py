@@ -0,0 +1,130 @@
+import threading
+import pytest
+
+from unittest_training.fixtures.concurrent_user_manager import ConcurrentUserManager
+from unittest_training.fixtures.user_manager_fixtures import (
+    DuplicateEmailError,
+    DuplicateUserError,
+    InvalidInputError,
+    MissingUserError,
+)
+
+
+def _run_concurrently(function, threads: int = 16) -> list:
+    """
+    Calls 'function(i)' from 'threads' threads at the same time.
+
+    Returns:
+        list: The return value (or the raised exception) of every call.
+    """
+    barrier = threading.Barrier(threads)
+    outcomes = [None] * threads
+
+    def run(i):
+        barrier.wait()
+        try:
+            outcomes[i] = function(i)
+        except Exception as e:
+            outcomes[i] = e
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return outcomes
+
+
+class TestConcurrentUserManager:
+    @staticmethod
+    @pytest.fixture
+    def user_manager() -> ConcurrentUserManager:
+        """
+        Creates a new instance of 'ConcurrentUserManager'
+
+        Returns:
+            ConcurrentUserManager: The new instance of ConcurrentUserManager.
+        """
+        return ConcurrentUserManager(unique_emails=True, stripes=4)
+
+    # -----unittests for the sequential behavior-----
+    @staticmethod
+    def test_behaves_like_UserManager(user_manager: ConcurrentUserManager):
+        assert user_manager.addUser(username="Max Mustermann", email="max@test.de")
+        assert user_manager.getUserEmail(username="Max Mustermann") == "max@test.de"
+        assert user_manager.getUserByEmail(email="MAX@test.de") == "Max Mustermann"
+
+        with pytest.raises(DuplicateUserError):
+            user_manager.addUser(username="Max Mustermann", email="other@test.de")
+        with pytest.raises(DuplicateEmailError):
+            user_manager.addUser(username="Test Person", email="max@test.de")
+        with pytest.raises(InvalidInputError):
+            user_manager.addUser(username=["unhashable"], email="max@test.de")
+        with pytest.raises(MissingUserError):
+            user_manager.getUserEmail(username="Test Person")
+
+    @staticmethod
+    def test_addUsers(user_manager: ConcurrentUserManager):
+        user_manager.addUsers([("A", "a@test.de"), ("B", "b@test.de")])
+
+        assert user_manager.getUserByEmail(email="b@test.de") == "B"
+
+        # the locks are released again, also after a failed batch
+        with pytest.raises(DuplicateUserError):
+            user_manager.addUsers([("A", "other@test.de")])
+        assert user_manager.addUser(username="C", email="c@test.de")
+
+    @staticmethod
+    def test_email_index_of_prefilled_storage():
+        user_manager = ConcurrentUserManager(storage={"A": "a@test.de"})
+
+        assert user_manager._usernames_by_email == {"a@test.de": "A"}
+
+    @staticmethod
+    @pytest.mark.parametrize("stripes", [0, -1, 2.5])
+    def test_invalid_stripes(stripes):
+        with pytest.raises(ValueError):
+            ConcurrentUserManager(stripes=stripes)
+
+    # -------------------------------------------
+
+    # -----unittests for the concurrent behavior-----
+    @staticmethod
+    def test_same_username_is_added_once(user_manager: ConcurrentUserManager):
+        outcomes = _run_concurrently(
+            lambda i: user_manager.addUser(username="Max", email=f"max{i}@test.de")
+        )
+
+        assert outcomes.count(True) == 1
+        assert all(
+            isinstance(outcome, DuplicateUserError)
+            for outcome in outcomes
+            if outcome is not True
+        )
+
+    @staticmethod
+    def test_same_email_is_added_once(user_manager: ConcurrentUserManager):
+        outcomes = _run_concurrently(
+            lambda i: user_manager.addUser(username=f"User {i}", email="Same@test.de")
+        )
+
+        assert outcomes.count(True) == 1
+        assert len(user_manager.users) == 1
+
+    @staticmethod
+    def test_no_user_gets_lost(user_manager: ConcurrentUserManager):
+        def add_users(i):
+            for j in range(200):
+                user_manager.addUser(
+                    username=f"User {i}-{j}", email=f"user{i}.{j}@test.de"
+                )
+                assert user_manager.getUserEmail(username=f"User {i}-{j}")
+
+        outcomes = _run_concurrently(add_users, threads=8)
+
+        assert outcomes == [None] * 8
+        assert len(user_manager.users) == 8 * 200
+        assert len(user_manager._usernames_by_email) == 8 * 200
+
+    # -------------------------------------------
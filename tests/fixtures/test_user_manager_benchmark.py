@@ -0,0 +1,57 @@
+import json
+import pytest
+
+from unittest_training.fixtures.user_manager_benchmark import (
+    MANAGERS,
+    main,
+    run_benchmark,
+)
+
+# a configuration which keeps the benchmark runs of the tests short
+_SMALL_CONFIG = {"preloaded_users": 100, "operations_per_thread": 200}
+
+
+class TestUserManagerBenchmark:
+    # -----unittests for run_benchmark-----
+    @staticmethod
+    def test_run_benchmark():
+        results = run_benchmark(thread_counts=[1, 4], config=_SMALL_CONFIG)
+
+        assert [
+            (result["manager"], result["threads"]) for result in results["results"]
+        ] == [(manager, threads) for manager in MANAGERS for threads in (1, 4)]
+        for result in results["results"]:
+            assert result["operations"] == result["threads"] * 200
+            assert result["ops_per_sec"] > 0
+            assert result["consistent"]
+
+    # -------------------------------------------
+
+    # -----unittests for main-----
+    @staticmethod
+    def test_main(tmp_path, capsys):
+        output = tmp_path / "results.json"
+
+        exit_code = main(
+            [
+                "--threads",
+                "2",
+                "--manager",
+                "striped",
+                "--operations",
+                "100",
+                "--output",
+                str(output),
+            ]
+        )
+
+        assert exit_code == 0
+        assert "striped" in capsys.readouterr().out
+        assert json.loads(output.read_text())["results"][0]["threads"] == 2
+
+    @staticmethod
+    def test_main_invalid_manager():
+        with pytest.raises(SystemExit):
+            main(["--manager", "unknown"])
+
+    # -------------------------------------------
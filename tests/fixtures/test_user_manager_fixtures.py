@@ -1,6 +1,7 @@
 import pytest
 
 from unittest_training.fixtures.user_manager_fixtures import (
+    DuplicateEmailError,
     DuplicateUserError,
     InvalidInputError,
     MissingUserError,
@@ -82,3 +83,284 @@ class TestUserManager:
             match="The user you look for is not contained in the database.",
         ):
             user_manager.getUserEmail(username="Another User")
+
+    # -----unittests for the email-index-----
+    @staticmethod
+    @pytest.fixture
+    def unique_email_user_manager() -> UserManager:
+        """
+        Creates a new instance of 'UserManager', which enforces unique emails.
+
+        Returns:
+            UserManager: The new instance of UserManager.
+        """
+        return UserManager(unique_emails=True)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "email",
+        [
+            "max.mustermann@test.de",  # exactly as added
+            "Max.Mustermann@Test.DE",  # different case
+            "  max.mustermann@test.de\n",  # surrounding whitespace
+        ],
+    )
+    def test_getUserByEmail_valid_inputs(user_manager: UserManager, email):
+        user_manager.addUser(username="Max Mustermann", email="max.mustermann@test.de")
+        user_manager.addUser(username="Test Person", email="test.person@test.de")
+
+        assert user_manager.getUserByEmail(email=email) == "Max Mustermann"
+
+    @staticmethod
+    def test_getUserByEmail_keeps_the_original_email(user_manager: UserManager):
+        # only the index is normalized, the stored email stays as it was added
+        user_manager.addUser(username="Max Mustermann", email="Max@Test.de")
+
+        assert user_manager.getUserEmail(username="Max Mustermann") == "Max@Test.de"
+
+    @staticmethod
+    def test_getUserByEmail_shared_email(user_manager: UserManager):
+        # without 'unique_emails', the user added first owns a shared email
+        user_manager.addUser(username="Max Mustermann", email="shared@test.de")
+        user_manager.addUser(username="Test Person", email="SHARED@test.de")
+
+        assert user_manager.getUserByEmail(email="shared@test.de") == "Max Mustermann"
+
+    @staticmethod
+    def test_getUserByEmail_invalid_input(user_manager: UserManager):
+        with pytest.raises(
+            InvalidInputError, match="'email' needs to be of type 'str'."
+        ):
+            user_manager.getUserByEmail(email=None)
+
+    @staticmethod
+    def test_getUserByEmail_missing_user(user_manager: UserManager):
+        user_manager.addUser(username="Max Mustermann", email="max.mustermann@test.de")
+        with pytest.raises(MissingUserError):
+            user_manager.getUserByEmail(email="another.email@test.de")
+
+    @staticmethod
+    def test_addUser_duplicate_email(unique_email_user_manager: UserManager):
+        unique_email_user_manager.addUser(
+            username="Max Mustermann", email="max.mustermann@test.de"
+        )
+        with pytest.raises(
+            DuplicateEmailError, match="Email already belongs to another user."
+        ):
+            unique_email_user_manager.addUser(
+                username="Test Person", email=" Max.Mustermann@test.de"
+            )
+
+        # the rejected user was not added
+        with pytest.raises(MissingUserError):
+            unique_email_user_manager.getUserEmail(username="Test Person")
+
+    @staticmethod
+    def test_addUser_duplicate_user_is_checked_first(
+        unique_email_user_manager: UserManager,
+    ):
+        unique_email_user_manager.addUser(
+            username="Max Mustermann", email="max.mustermann@test.de"
+        )
+        with pytest.raises(DuplicateUserError):
+            unique_email_user_manager.addUser(
+                username="Max Mustermann", email="max.mustermann@test.de"
+            )
+
+    # -------------------------------------------
+
+    # -----unittests for addUsers-----
+    @staticmethod
+    def test_addUsers_valid_inputs(user_manager: UserManager):
+        user_manager.addUser(username="Existing User", email="existing@test.de")
+
+        errors = user_manager.addUsers(
+            [
+                ("Max Mustermann", "max.mustermann@test.de"),
+                ["Test Person", "Test.Person@test.de"],  # lists are fine too
+            ]
+        )
+
+        assert errors == []
+        assert user_manager.users == {
+            "Existing User": "existing@test.de",
+            "Max Mustermann": "max.mustermann@test.de",
+            "Test Person": "Test.Person@test.de",
+        }
+        assert user_manager.getUserByEmail(email="test.person@test.de") == "Test Person"
+
+    @staticmethod
+    def test_addUsers_accepts_a_generator(user_manager: UserManager):
+        user_manager.addUsers((f"User {i}", f"user{i}@test.de") for i in range(100))
+
+        assert len(user_manager.users) == 100
+        assert user_manager.getUserByEmail(email="user42@test.de") == "User 42"
+
+    @staticmethod
+    def test_addUsers_shared_email(user_manager: UserManager):
+        # like with 'addUser', a shared email stays indexed to its first user
+        user_manager.addUser(username="First User", email="shared@test.de")
+        user_manager.addUsers(
+            [
+                ("Second User", "Shared@test.de"),
+                ("Third User", "other@test.de"),
+                ("Fourth User", "OTHER@test.de"),
+            ]
+        )
+
+        assert user_manager.getUserByEmail(email="shared@test.de") == "First User"
+        assert user_manager.getUserByEmail(email="other@test.de") == "Third User"
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "users, expected_error",
+        [
+            # duplicate of an existing user
+            (
+                [("New User", "new@test.de"), ("Max Mustermann", "a@test.de")],
+                DuplicateUserError,
+            ),
+            # duplicate within the batch
+            (
+                [("New User", "new@test.de"), ("New User", "a@test.de")],
+                DuplicateUserError,
+            ),
+            # invalid types
+            ([("New User", "new@test.de"), ("Other User", 3.5)], InvalidInputError),
+            # not a pair
+            ([("New User", "new@test.de"), ("Other User",)], InvalidInputError),
+            ([("New User", "new@test.de"), "ab"], InvalidInputError),
+        ],
+    )
+    def test_addUsers_all_or_nothing(user_manager: UserManager, users, expected_error):
+        user_manager.addUser(username="Max Mustermann", email="max.mustermann@test.de")
+
+        with pytest.raises(expected_error):
+            user_manager.addUsers(users)
+
+        # no user of the batch was added
+        assert list(user_manager.users) == ["Max Mustermann"]
+        with pytest.raises(MissingUserError):
+            user_manager.getUserByEmail(email="new@test.de")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "users",
+        [
+            # email of an existing user
+            [("New User", "new@test.de"), ("Other User", "MAX.mustermann@test.de")],
+            # email twice within the batch
+            [("New User", "new@test.de"), ("Other User", " new@test.de")],
+        ],
+    )
+    def test_addUsers_duplicate_email(unique_email_user_manager: UserManager, users):
+        unique_email_user_manager.addUser(
+            username="Max Mustermann", email="max.mustermann@test.de"
+        )
+
+        with pytest.raises(DuplicateEmailError):
+            unique_email_user_manager.addUsers(users)
+
+        assert list(unique_email_user_manager.users) == ["Max Mustermann"]
+
+    @staticmethod
+    def test_addUsers_collect_errors(unique_email_user_manager: UserManager):
+        unique_email_user_manager.addUser(
+            username="Max Mustermann", email="max.mustermann@test.de"
+        )
+
+        errors = unique_email_user_manager.addUsers(
+            [
+                ("User A", "a@test.de"),
+                ("Max Mustermann", "b@test.de"),  # existing user
+                ("User C", 3),  # invalid type
+                ("User D", "A@test.de"),  # email of 'User A'
+                ("User A", "e@test.de"),  # duplicate within the batch
+                ("User F", "f@test.de"),
+            ],
+            all_or_nothing=False,
+        )
+
+        # the valid entries were added, the invalid ones are reported
+        assert [(position, type(error)) for position, error in errors] == [
+            (1, DuplicateUserError),
+            (2, InvalidInputError),
+            (3, DuplicateEmailError),
+            (4, DuplicateUserError),
+        ]
+        assert list(unique_email_user_manager.users) == [
+            "Max Mustermann",
+            "User A",
+            "User F",
+        ]
+        assert unique_email_user_manager.getUserByEmail(email="a@test.de") == "User A"
+        assert unique_email_user_manager.getUserByEmail(email="f@test.de") == "User F"
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "unique_emails, users",
+        [
+            # a username twice: the first entry keeps its email
+            (
+                False,
+                [("User A", "a@test.de"), ("User B", "b@test.de"), ("User A", "c")],
+            ),
+            # a username twice, and a username of an existing user
+            (
+                True,
+                [("User A", "a@test.de"), ("Max Mustermann", "m"), ("User A", "c")],
+            ),
+            # an email twice, and an email of an existing user
+            (
+                True,
+                [
+                    ("User A", " MAX.mustermann@test.de"),
+                    ("User B", "b@test.de"),
+                    ("User C", "B@test.de"),
+                ],
+            ),
+            # the rejected email of 'User A' leaves the username to the later entry
+            (
+                True,
+                [
+                    ("User A", "max.mustermann@test.de"),
+                    ("User B", "b@test.de"),
+                    ("User A", "a@test.de"),
+                ],
+            ),
+            # a malformed entry next to a duplicate
+            (False, [("User A", "a@test.de"), ("User B", None), ("User A", "c")]),
+        ],
+    )
+    def test_addUsers_like_addUser(unique_emails: bool, users):
+        user_manager = UserManager(unique_emails=unique_emails)
+        user_manager.addUser(username="Max Mustermann", email="max.mustermann@test.de")
+        expected_manager = UserManager(unique_emails=unique_emails)
+        expected_manager.addUser(
+            username="Max Mustermann", email="max.mustermann@test.de"
+        )
+        expected_errors = []
+        for position, (username, email) in enumerate(users):
+            try:
+                expected_manager.addUser(username=username, email=email)
+            except Exception as error:
+                expected_errors.append((position, type(error)))
+
+        errors = user_manager.addUsers(users, all_or_nothing=False)
+
+        # the same result as adding one entry after the other
+        assert [(position, type(error)) for position, error in errors] == (
+            expected_errors
+        )
+        assert list(user_manager.users.items()) == list(expected_manager.users.items())
+        for email in ["max.mustermann@test.de", "a@test.de", "b@test.de"]:
+            assert user_manager._getEmailIndex().get(
+                email
+            ) == expected_manager._getEmailIndex().get(email)
+
+    @staticmethod
+    def test_addUsers_empty(user_manager: UserManager):
+        assert user_manager.addUsers([]) == []
+        assert user_manager.users == {}
+
+    # -------------------------------------------
@@ -0,0 +1,461 @@
+import os
+import threading
+
+import pytest
+
+from unittest_training.fixtures.concurrent_user_manager import ConcurrentUserManager
+from unittest_training.fixtures.user_manager_fixtures import (
+    DuplicateEmailError,
+    InvalidInputError,
+    UserManager,
+)
+from unittest_training.fixtures.user_snapshot import (
+    KIND_DELTA,
+    KIND_FULL,
+    SnapshotChainError,
+    SnapshotFormatError,
+    apply_delta_snapshot,
+    read_snapshot_info,
+    restore_snapshot,
+    write_snapshot,
+)
+from unittest_training.fixtures.user_storage import SQLiteUserStorage
+from unittest_training.projects.textfile_writer.textfile_writer import (
+    Durability,
+    TextfileWriter,
+)
+
+USERS = [
+    ("Max Mustermann", "max.mustermann@test.de"),
+    ("Jürgen Müller", "jürgen@test.de"),  # non-ASCII characters
+    ("", ""),  # empty strings
+    ("\ud800", "lone@surrogate.de"),  # not encodable as plain UTF-8
+]
+
+
+class TestUserSnapshot:
+    @staticmethod
+    @pytest.fixture
+    def user_manager() -> UserManager:
+        """
+        Creates a new instance of 'UserManager' containing 'USERS'.
+
+        Returns:
+            UserManager: The new instance of UserManager.
+        """
+        user_manager = UserManager(unique_emails=True)
+        user_manager.addUsers(USERS)
+        return user_manager
+
+    @staticmethod
+    @pytest.fixture
+    def snapshot_path(tmp_path) -> str:
+        return str(tmp_path / "users.snap")
+
+    # -----unittests for full snapshots-----
+    @staticmethod
+    @pytest.mark.parametrize("block_size", [1, 3, 1000])
+    def test_write_restore(user_manager: UserManager, snapshot_path, block_size):
+        info = write_snapshot(
+            user_manager=user_manager, file_path=snapshot_path, block_size=block_size
+        )
+        restored_user_manager = restore_snapshot(file_path=snapshot_path)
+
+        assert info.kind == KIND_FULL
+        assert info.user_count == len(USERS)
+        assert read_snapshot_info(file_path=snapshot_path) == info
+        assert list(restored_user_manager.users.items()) == USERS
+        assert restored_user_manager.unique_emails
+
+    @staticmethod
+    def test_restored_manager_is_fully_functional(
+        user_manager: UserManager, snapshot_path
+    ):
+        write_snapshot(user_manager=user_manager, file_path=snapshot_path)
+        restored_user_manager = restore_snapshot(file_path=snapshot_path)
+
+        # the restored users are contained in the email-index
+        assert (
+            restored_user_manager.getUserByEmail(email="MAX.mustermann@test.de")
+            == "Max Mustermann"
+        )
+        with pytest.raises(DuplicateEmailError):
+            restored_user_manager.addUser(username="Max", email="jürgen@test.de")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "username, email",
+        [
+            ("Max\x00Mustermann", "max@test.de"),  # separator in a username
+            ("Max Mustermann", "max\x00@test.de"),  # separator in an email
+        ],
+    )
+    def test_users_containing_the_separator(snapshot_path, username, email):
+        user_manager = UserManager()
+        user_manager.addUsers([(username, email), ("Erika", "erika@test.de")])
+
+        write_snapshot(user_manager=user_manager, file_path=snapshot_path)
+
+        assert restore_snapshot(file_path=snapshot_path).users == user_manager.users
+
+    @staticmethod
+    def test_empty_user_manager(snapshot_path):
+        write_snapshot(user_manager=UserManager(), file_path=snapshot_path)
+
+        assert restore_snapshot(file_path=snapshot_path).users == {}
+
+    @staticmethod
+    def test_restore_into_user_manager(user_manager: UserManager, snapshot_path):
+        write_snapshot(user_manager=user_manager, file_path=snapshot_path)
+        concurrent_user_manager = ConcurrentUserManager(bloom_filter=True)
+
+        restored_user_manager = restore_snapshot(
+            file_path=snapshot_path, user_manager=concurrent_user_manager
+        )
+
+        assert restored_user_manager is concurrent_user_manager
+        assert restored_user_manager.getUserEmail(username="") == ""
+        assert restored_user_manager.getUserByEmail(email="jürgen@test.de") == (
+            "Jürgen Müller"
+        )
+        assert restored_user_manager.getBloomFilterInfo().size == len(USERS)
+
+    @staticmethod
+    def test_write_concurrent_user_manager(snapshot_path):
+        user_manager = ConcurrentUserManager()
+        user_manager.addUsers(USERS)
+        writer = threading.Thread(
+            target=write_snapshot,
+            kwargs={"user_manager": user_manager, "file_path": snapshot_path},
+        )
+
+        with user_manager._username_locks[0]:
+            writer.start()
+            writer.join(timeout=0.2)
+            # the users are only copied while no user is added
+            assert writer.is_alive()
+        writer.join()
+
+        assert restore_snapshot(file_path=snapshot_path).users == user_manager.users
+
+    @staticmethod
+    def test_restore_into_sqlite_storage(snapshot_path, tmp_path):
+        # SQLite can not store lone surrogates
+        user_manager = UserManager()
+        user_manager.addUsers(USERS[:3])
+        write_snapshot(user_manager=user_manager, file_path=snapshot_path)
+
+        with SQLiteUserStorage(path=str(tmp_path / "users.db")) as storage:
+            restored_user_manager = restore_snapshot(
+                file_path=snapshot_path, storage=storage
+            )
+
+            assert restored_user_manager.users is storage
+            assert list(storage.items()) == USERS[:3]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "user_manager_to_restore_into",
+        [
+            UserManager(unique_emails=True),  # the snapshot allows shared emails
+            ConcurrentUserManager(unique_emails=True),
+        ],
+    )
+    def test_restore_into_user_manager_with_stricter_emails(
+        snapshot_path, user_manager_to_restore_into
+    ):
+        write_snapshot(user_manager=UserManager(), file_path=snapshot_path)
+
+        with pytest.raises(InvalidInputError):
+            restore_snapshot(
+                file_path=snapshot_path, user_manager=user_manager_to_restore_into
+            )
+
+    @staticmethod
+    def test_restore_into_non_empty_user_manager(
+        user_manager: UserManager, snapshot_path
+    ):
+        write_snapshot(user_manager=user_manager, file_path=snapshot_path)
+
+        with pytest.raises(InvalidInputError):
+            restore_snapshot(file_path=snapshot_path, user_manager=user_manager)
+
+    @staticmethod
+    @pytest.mark.parametrize("block_size", [0, -1, 1.5, True])
+    def test_write_invalid_block_size(
+        user_manager: UserManager, snapshot_path, block_size
+    ):
+        with pytest.raises(ValueError):
+            write_snapshot(
+                user_manager=user_manager,
+                file_path=snapshot_path,
+                block_size=block_size,
+            )
+
+    # -------------------------------------------
+
+    # -----unittests for delta snapshots-----
+    @staticmethod
+    def test_restore_with_deltas(user_manager: UserManager, tmp_path):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        user_manager.addUser(username="Erika", email="erika@test.de")
+        first_info = write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta1.snap"),
+            base=full_info,
+        )
+        # a delta without new users
+        second_info = write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta2.snap"),
+            base=first_info,
+        )
+        user_manager.addUsers([("Anna", "anna@test.de"), ("Ben", "ben@test.de")])
+        write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta3.snap"),
+            base=second_info,
+        )
+
+        restored_user_manager = restore_snapshot(
+            file_path=str(tmp_path / "full.snap"),
+            delta_file_paths=[str(tmp_path / f"delta{i}.snap") for i in range(1, 4)],
+        )
+
+        assert first_info.kind == KIND_DELTA
+        assert first_info.base_id == full_info.snapshot_id
+        assert os.path.getsize(tmp_path / "delta1.snap") < os.path.getsize(
+            tmp_path / "full.snap"
+        )
+        assert list(restored_user_manager.users.items()) == list(
+            user_manager.users.items()
+        )
+
+    @staticmethod
+    def test_apply_delta_snapshot(user_manager: UserManager, tmp_path):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        restored_user_manager = restore_snapshot(file_path=str(tmp_path / "full.snap"))
+        user_manager.addUser(username="Erika", email="erika@test.de")
+        write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta.snap"),
+            base=full_info,
+        )
+
+        apply_delta_snapshot(
+            user_manager=restored_user_manager,
+            file_path=str(tmp_path / "delta.snap"),
+            base=full_info,
+        )
+
+        assert restored_user_manager.getUserEmail(username="Erika") == "erika@test.de"
+
+    @staticmethod
+    def test_apply_delta_snapshot_keeps_the_email_index(
+        user_manager: UserManager, tmp_path
+    ):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        restored_user_manager = restore_snapshot(
+            file_path=str(tmp_path / "full.snap"),
+            user_manager=ConcurrentUserManager(unique_emails=True),
+        )
+        email_index = restored_user_manager._usernames_by_email
+        user_manager.addUser(username="Erika", email=" Erika@test.de")
+        write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta.snap"),
+            base=full_info,
+        )
+
+        apply_delta_snapshot(
+            user_manager=restored_user_manager,
+            file_path=str(tmp_path / "delta.snap"),
+            base=full_info,
+        )
+
+        # the new users are added to the index in one step, instead of
+        # leaving the lock-free readers without an index in the meantime
+        assert restored_user_manager._usernames_by_email is email_index
+        assert restored_user_manager.getUserByEmail(email="erika@test.de") == "Erika"
+        assert restored_user_manager.getUserByEmail(email="jürgen@test.de") == (
+            "Jürgen Müller"
+        )
+
+    @staticmethod
+    def test_delta_of_another_base(user_manager: UserManager, tmp_path):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        other_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "other.snap")
+        )
+        user_manager.addUser(username="Erika", email="erika@test.de")
+        write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta.snap"),
+            base=other_info,
+        )
+
+        with pytest.raises(SnapshotChainError):
+            restore_snapshot(
+                file_path=str(tmp_path / "full.snap"),
+                delta_file_paths=[str(tmp_path / "delta.snap")],
+            )
+        assert full_info.snapshot_id != other_info.snapshot_id
+
+    @staticmethod
+    def test_delta_as_first_snapshot(user_manager: UserManager, tmp_path):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta.snap"),
+            base=full_info,
+        )
+
+        with pytest.raises(SnapshotChainError):
+            restore_snapshot(file_path=str(tmp_path / "delta.snap"))
+
+    @staticmethod
+    def test_delta_applied_to_modified_user_manager(
+        user_manager: UserManager, tmp_path
+    ):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        restored_user_manager = restore_snapshot(file_path=str(tmp_path / "full.snap"))
+        restored_user_manager.addUser(username="Anna", email="anna@test.de")
+        user_manager.addUser(username="Erika", email="erika@test.de")
+        write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta.snap"),
+            base=full_info,
+        )
+
+        with pytest.raises(SnapshotChainError):
+            apply_delta_snapshot(
+                user_manager=restored_user_manager,
+                file_path=str(tmp_path / "delta.snap"),
+                base=full_info,
+            )
+
+    @staticmethod
+    def test_delta_with_fewer_users_than_base(user_manager: UserManager, tmp_path):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+
+        with pytest.raises(SnapshotChainError):
+            write_snapshot(
+                user_manager=UserManager(),
+                file_path=str(tmp_path / "delta.snap"),
+                base=full_info,
+            )
+
+    @staticmethod
+    def test_delta_of_an_older_base(user_manager: UserManager, tmp_path):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        write_snapshot(user_manager=user_manager, file_path=str(tmp_path / "new.snap"))
+
+        with pytest.raises(SnapshotChainError):
+            write_snapshot(
+                user_manager=user_manager,
+                file_path=str(tmp_path / "delta.snap"),
+                base=full_info,
+            )
+
+    @staticmethod
+    def test_delta_after_removed_user(user_manager: UserManager, tmp_path):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        # the same number of users as the base, but not the same users
+        del user_manager.users["Max Mustermann"]
+        user_manager.addUser(username="Erika", email="erika@test.de")
+
+        with pytest.raises(SnapshotChainError):
+            write_snapshot(
+                user_manager=user_manager,
+                file_path=str(tmp_path / "delta.snap"),
+                base=full_info,
+            )
+        assert not os.path.exists(tmp_path / "delta.snap")
+
+    @staticmethod
+    def test_delta_applied_after_removed_user(user_manager: UserManager, tmp_path):
+        full_info = write_snapshot(
+            user_manager=user_manager, file_path=str(tmp_path / "full.snap")
+        )
+        restored_user_manager = restore_snapshot(file_path=str(tmp_path / "full.snap"))
+        del restored_user_manager.users["Max Mustermann"]
+        restored_user_manager.addUser(username="Anna", email="anna@test.de")
+        user_manager.addUser(username="Erika", email="erika@test.de")
+        write_snapshot(
+            user_manager=user_manager,
+            file_path=str(tmp_path / "delta.snap"),
+            base=full_info,
+        )
+
+        with pytest.raises(SnapshotChainError):
+            apply_delta_snapshot(
+                user_manager=restored_user_manager,
+                file_path=str(tmp_path / "delta.snap"),
+                base=full_info,
+            )
+        assert "Erika" not in restored_user_manager.users
+
+    # -------------------------------------------
+
+    # -----unittests for corrupt snapshots-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "corrupt",
+        [
+            lambda data: b"NOTASNAP" + data[8:],  # wrong magic
+            lambda data: data[:8] + b"\x02\x00" + data[10:],  # unknown version
+            lambda data: data[:-30],  # truncated
+            lambda data: data[:80] + bytes([data[80] ^ 0xFF]) + data[81:],  # bit-flip
+            lambda data: data[:20],  # truncated header
+        ],
+    )
+    def test_corrupt_snapshot(user_manager: UserManager, snapshot_path, corrupt):
+        write_snapshot(user_manager=user_manager, file_path=snapshot_path)
+        with open(snapshot_path, "rb") as f:
+            data = f.read()
+        with open(snapshot_path, "wb") as f:
+            f.write(corrupt(data))
+
+        with pytest.raises(SnapshotFormatError):
+            restore_snapshot(file_path=snapshot_path)
+
+    @staticmethod
+    def test_failed_write_keeps_previous_snapshot(
+        user_manager: UserManager, snapshot_path, mocker
+    ):
+        write_snapshot(user_manager=user_manager, file_path=snapshot_path)
+        user_manager.addUser(username="Erika", email="erika@test.de")
+        mocker.patch.object(
+            TextfileWriter, "_sync_file", side_effect=OSError("disk full")
+        )
+
+        with pytest.raises(OSError):
+            write_snapshot(
+                user_manager=user_manager,
+                file_path=snapshot_path,
+                durability=Durability.FSYNC,
+            )
+
+        # the previous snapshot is still complete, and no temporary file is left
+        assert len(restore_snapshot(file_path=snapshot_path).users) == len(USERS)
+        assert os.listdir(os.path.dirname(snapshot_path)) == ["users.snap"]
+
+    # -------------------------------------------
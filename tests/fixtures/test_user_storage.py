@@ -0,0 +1,230 @@
+import sqlite3
+import pytest
+
+from unittest_training.fixtures.user_manager_fixtures import (
+    DuplicateEmailError,
+    DuplicateUserError,
+    MissingUserError,
+    UserManager,
+)
+from unittest_training.fixtures.user_storage import (
+    SQLiteUserStorage,
+    StorageError,
+    UserStorage,
+)
+
+
+class TestSQLiteUserStorage:
+    @staticmethod
+    @pytest.fixture
+    def storage(tmp_path) -> SQLiteUserStorage:
+        """
+        Creates a new instance of 'SQLiteUserStorage' in a temporary directory,
+        and closes it after the test.
+
+        Returns:
+            SQLiteUserStorage: The new instance of SQLiteUserStorage.
+        """
+        with SQLiteUserStorage(path=str(tmp_path / "users.db")) as storage:
+            yield storage
+
+    # -----unittests for the mapping-interface-----
+    @staticmethod
+    def test_is_a_user_storage(storage: SQLiteUserStorage):
+        assert isinstance(storage, UserStorage)
+        # a plain dict is a storage too
+        assert isinstance({}, UserStorage)
+
+    @staticmethod
+    def test_set_get_delete(storage: SQLiteUserStorage):
+        storage["Max Mustermann"] = "max.mustermann@test.de"
+
+        assert storage["Max Mustermann"] == "max.mustermann@test.de"
+        assert "Max Mustermann" in storage
+        assert len(storage) == 1
+
+        del storage["Max Mustermann"]
+
+        assert "Max Mustermann" not in storage
+        assert len(storage) == 0
+
+    @staticmethod
+    def test_missing_user(storage: SQLiteUserStorage):
+        with pytest.raises(KeyError):
+            storage["Another User"]
+
+        with pytest.raises(KeyError):
+            del storage["Another User"]
+
+        assert storage.get("Another User") is None
+
+    @staticmethod
+    def test_iterates_in_insertion_order(storage: SQLiteUserStorage):
+        storage["B"] = "b@test.de"
+        storage["A"] = "a@test.de"
+        storage["C"] = "c@test.de"
+        # overwriting keeps the position
+        storage["B"] = "new.b@test.de"
+
+        assert list(storage) == ["B", "A", "C"]
+        assert list(storage.items()) == [
+            ("B", "new.b@test.de"),
+            ("A", "a@test.de"),
+            ("C", "c@test.de"),
+        ]
+
+    @staticmethod
+    def test_update(storage: SQLiteUserStorage):
+        storage.update({"A": "a@test.de", "B": "b@test.de"})
+        storage.update([("C", "c@test.de")], D="d@test.de")
+
+        assert dict(storage.items()) == {
+            "A": "a@test.de",
+            "B": "b@test.de",
+            "C": "c@test.de",
+            "D": "d@test.de",
+        }
+
+    @staticmethod
+    def test_existing_usernames(storage: SQLiteUserStorage, mocker):
+        storage.update((f"User {i}", f"user{i}@test.de") for i in range(0, 1200, 2))
+        spy_execute = mocker.spy(storage, "_execute")
+
+        usernames = [f"User {i}" for i in range(1200)]
+        assert storage.existing_usernames(usernames + ["User 0"]) == {
+            f"User {i}" for i in range(0, 1200, 2)
+        }
+        # one query per chunk of usernames (and not per username)
+        assert spy_execute.call_count == 3
+
+        # the default implementation of the interface gives the same result
+        assert UserStorage.existing_usernames(storage, usernames) == set(storage)
+
+    @staticmethod
+    def test_update_is_one_transaction(storage: SQLiteUserStorage):
+        # the invalid email (None) aborts the whole transaction
+        with pytest.raises(StorageError):
+            storage.update([("A", "a@test.de"), ("B", None)])
+
+        assert len(storage) == 0
+
+    # -------------------------------------------
+
+    # -----unittests for the persistence-----
+    @staticmethod
+    def test_connects_lazily(tmp_path):
+        path = tmp_path / "users.db"
+        storage = SQLiteUserStorage(path=str(path))
+
+        assert not path.exists()
+
+        storage["A"] = "a@test.de"
+        storage.close()
+
+        assert path.exists()
+
+    @staticmethod
+    def test_persists_across_instances(tmp_path):
+        path = str(tmp_path / "users.db")
+        with SQLiteUserStorage(path=path) as storage:
+            storage["A"] = "a@test.de"
+
+        with SQLiteUserStorage(path=path) as storage:
+            assert storage["A"] == "a@test.de"
+
+    @staticmethod
+    def test_reconnects_after_close(storage: SQLiteUserStorage):
+        storage["A"] = "a@test.de"
+        storage.close()
+        storage.close()  # closing again does nothing
+
+        assert storage["A"] == "a@test.de"
+
+    @staticmethod
+    def test_uses_memory_mapping(storage: SQLiteUserStorage):
+        storage["A"] = "a@test.de"
+
+        assert storage._connection.execute("PRAGMA mmap_size").fetchone()[0] > 0
+
+    @staticmethod
+    def test_open_failure(tmp_path):
+        # a directory cannot be opened as database
+        storage = SQLiteUserStorage(path=str(tmp_path))
+
+        with pytest.raises(StorageError) as exc_info:
+            len(storage)
+
+        assert isinstance(exc_info.value.__cause__, sqlite3.Error)
+
+    @staticmethod
+    @pytest.mark.parametrize("mmap_size", [-1, 1.5, "0"])
+    def test_invalid_mmap_size(tmp_path, mmap_size):
+        with pytest.raises(ValueError):
+            SQLiteUserStorage(path=str(tmp_path / "users.db"), mmap_size=mmap_size)
+
+    # -------------------------------------------
+
+
+class TestUserManagerStorage:
+    # -----unittests for UserManager with a storage-----
+    @staticmethod
+    def test_users_persist(tmp_path):
+        path = str(tmp_path / "users.db")
+        with SQLiteUserStorage(path=path) as storage:
+            user_manager = UserManager(storage=storage)
+            user_manager.addUser(username="Max Mustermann", email="max@test.de")
+            user_manager.addUsers([("Test Person", "test@test.de")])
+
+        with SQLiteUserStorage(path=path) as storage:
+            user_manager = UserManager(storage=storage)
+
+            assert user_manager.getUserEmail(username="Test Person") == "test@test.de"
+            assert user_manager.getUserByEmail(email="MAX@test.de") == "Max Mustermann"
+            with pytest.raises(MissingUserError):
+                user_manager.getUserEmail(username="Another User")
+
+    @staticmethod
+    def test_email_index_is_built_lazily(mocker):
+        storage = {"Max Mustermann": "max@test.de"}
+        build_index = mocker.spy(UserManager, "_getEmailIndex")
+
+        user_manager = UserManager(storage=storage)
+        user_manager.addUser(username="Test Person", email="test@test.de")
+        user_manager.getUserEmail(username="Max Mustermann")
+
+        # neither adding nor looking up by username needs the index
+        assert user_manager._usernames_by_email is None
+        build_index.assert_not_called()
+
+        assert user_manager.getUserByEmail(email="test@test.de") == "Test Person"
+        assert user_manager.getUserByEmail(email="max@test.de") == "Max Mustermann"
+
+    @staticmethod
+    def test_add_users_to_prefilled_storage(tmp_path, mocker):
+        with SQLiteUserStorage(path=str(tmp_path / "users.db")) as storage:
+            storage.update((f"User {i}", f"user{i}@test.de") for i in range(1000))
+            spy_contains = mocker.spy(SQLiteUserStorage, "__contains__")
+            user_manager = UserManager(storage=storage)
+
+            errors = user_manager.addUsers(
+                [("User 3", "other@test.de"), ("Test Person", "test@test.de")],
+                all_or_nothing=False,
+            )
+
+            assert [type(error) for _, error in errors] == [DuplicateUserError]
+            assert storage["Test Person"] == "test@test.de"
+            assert storage["User 3"] == "user3@test.de"
+            # the batch is looked up at once, and the index is not built
+            spy_contains.assert_not_called()
+            assert user_manager._usernames_by_email is None
+
+    @staticmethod
+    def test_unique_emails_with_prefilled_storage():
+        user_manager = UserManager(
+            unique_emails=True, storage={"Max Mustermann": "max@test.de"}
+        )
+
+        with pytest.raises(DuplicateEmailError):
+            user_manager.addUser(username="Test Person", email="Max@test.de")
+
+    # -------------------------------------------
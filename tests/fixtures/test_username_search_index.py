@@ -0,0 +1,339 @@
+import threading
+
+import pytest
+
+from unittest_training.fixtures.concurrent_user_manager import ConcurrentUserManager
+from unittest_training.fixtures.user_manager_fixtures import (
+    InvalidInputError,
+    UserManager,
+)
+from unittest_training.fixtures.username_search_index import (
+    UsernameSearchIndex,
+    _prefix_upper_bound,
+)
+
+USERNAMES = [
+    "anna",
+    "anne",
+    "annette",
+    "anton",
+    "ben",
+    "benedikt",
+    "berta",
+    "Max Mustermann",
+    "Maxi Muster",
+    "Jürgen Müller",
+]
+
+
+def _levenshtein(a: str, b: str) -> int:
+    previous_row = list(range(len(b) + 1))
+    for i, character in enumerate(a, start=1):
+        row = [i]
+        for j, other_character in enumerate(b, start=1):
+            row.append(
+                min(
+                    previous_row[j] + 1,
+                    row[j - 1] + 1,
+                    previous_row[j - 1] + (character != other_character),
+                )
+            )
+        previous_row = row
+    return previous_row[-1]
+
+
+class TestUsernameSearchIndex:
+    @staticmethod
+    @pytest.fixture
+    def search_index() -> UsernameSearchIndex:
+        """
+        Creates a new instance of 'UsernameSearchIndex', half of the
+        usernames being added after its creation.
+
+        Returns:
+            UsernameSearchIndex: The new instance of UsernameSearchIndex.
+        """
+        search_index = UsernameSearchIndex(usernames=USERNAMES[::2])
+        for username in USERNAMES[1::2]:
+            search_index.add(username)
+        return search_index
+
+    # -----unittests for prefix_search-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "prefix, expected_usernames",
+        [
+            ("ann", ["anna", "anne", "annette"]),
+            ("anne", ["anne", "annette"]),
+            ("Max", ["Max Mustermann", "Maxi Muster"]),
+            ("Jü", ["Jürgen Müller"]),  # non-ASCII characters
+            ("max", []),  # case-sensitive
+            ("x", []),  # no match
+            ("", sorted(USERNAMES)),  # all usernames
+        ],
+    )
+    def test_prefix_search(
+        search_index: UsernameSearchIndex, prefix, expected_usernames
+    ):
+        assert search_index.prefix_search(prefix=prefix) == expected_usernames
+
+    @staticmethod
+    def test_prefix_search_pagination(search_index: UsernameSearchIndex):
+        pages = []
+        after = None
+        while True:
+            page = search_index.prefix_search(prefix="", limit=3, after=after)
+            if not page:
+                break
+            assert len(page) <= 3
+            pages.append(page)
+            after = page[-1]
+
+        assert len(pages) == 4
+        assert sum(pages, []) == sorted(USERNAMES)
+
+    @staticmethod
+    def test_prefix_search_after_before_prefix(search_index: UsernameSearchIndex):
+        # 'after' sorts before all usernames with the prefix
+        assert search_index.prefix_search(prefix="b", after="a") == [
+            "ben",
+            "benedikt",
+            "berta",
+        ]
+
+    # -------------------------------------------
+
+    # -----unittests for fuzzy_search-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "query, max_distance, expected_matches",
+        [
+            ("anna", 0, [("anna", 0)]),  # exact match only
+            ("anna", 1, [("anna", 0), ("anne", 1)]),
+            ("anto", 1, [("anton", 1)]),  # one character missing
+            ("bne", 1, []),  # transpositions count as two edits
+            ("bne", 2, [("anne", 2), ("ben", 2)]),
+            ("Max Musterman", 1, [("Max Mustermann", 1)]),
+            ("Jurgen Müller", 1, [("Jürgen Müller", 1)]),  # non-ASCII characters
+        ],
+    )
+    def test_fuzzy_search(
+        search_index: UsernameSearchIndex, query, max_distance, expected_matches
+    ):
+        assert (
+            search_index.fuzzy_search(
+                query=query, max_distance=max_distance, prefix_length=0
+            )
+            == expected_matches
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "query, max_distance", [("anne", 2), ("ben", 3), ("ax", 4), ("", 5)]
+    )
+    def test_fuzzy_search_matches_brute_force(
+        search_index: UsernameSearchIndex, query, max_distance
+    ):
+        expected_matches = [
+            (username, _levenshtein(username, query))
+            for username in sorted(USERNAMES)
+            if _levenshtein(username, query) <= max_distance
+        ]
+
+        assert (
+            search_index.fuzzy_search(
+                query=query,
+                max_distance=max_distance,
+                limit=len(USERNAMES),
+                prefix_length=0,
+            )
+            == expected_matches
+        )
+
+    @staticmethod
+    def test_fuzzy_search_prefix_length(search_index: UsernameSearchIndex):
+        # "bnna" is one edit away from "anna" and "anne", but
+        # the first character has to match exactly
+        assert search_index.fuzzy_search(
+            query="bnna", max_distance=2, prefix_length=0
+        ) == [
+            ("anna", 1),
+            ("anne", 2),
+            ("ben", 2),
+        ]
+        assert search_index.fuzzy_search(
+            query="bnna", max_distance=2, prefix_length=1
+        ) == [("ben", 2)]
+        # by default, the first two characters have to match exactly
+        assert search_index.fuzzy_search(query="annx", max_distance=2) == [
+            ("anna", 1),
+            ("anne", 1),
+        ]
+        assert search_index.fuzzy_search(query="bnna", max_distance=2) == []
+
+    @staticmethod
+    def test_fuzzy_search_pagination(search_index: UsernameSearchIndex):
+        all_matches = search_index.fuzzy_search(query="anne", max_distance=3)
+
+        first_page = search_index.fuzzy_search(query="anne", max_distance=3, limit=2)
+        second_page = search_index.fuzzy_search(
+            query="anne", max_distance=3, limit=2, after=first_page[-1][0]
+        )
+
+        assert first_page + second_page == all_matches[:4]
+
+    # -------------------------------------------
+
+    # -----unittests for adding usernames-----
+    @staticmethod
+    def test_add_merges_pending_usernames():
+        usernames = [f"user {i}" for i in range(5000)]
+        search_index = UsernameSearchIndex()
+        for username in reversed(usernames):
+            search_index.add(username)
+
+        assert len(search_index) == 5000
+        assert search_index.prefix_search(prefix="", limit=5000) == sorted(usernames)
+        assert search_index.prefix_search(prefix="user 4999") == ["user 4999"]
+
+    @staticmethod
+    def test_add_many(search_index: UsernameSearchIndex):
+        search_index.add_many(["zoe", "annika"])
+
+        assert search_index.prefix_search(prefix="anni") == ["annika"]
+        assert search_index.prefix_search(prefix="z") == ["zoe"]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "prefix, expected_upper_bound",
+        [
+            ("abc", "abd"),
+            ("a" + chr(0x10FFFF), "b"),  # the last character can not be increased
+            (chr(0x10FFFF), None),  # every greater string starts with the prefix
+            ("", None),
+        ],
+    )
+    def test_prefix_upper_bound(prefix, expected_upper_bound):
+        assert _prefix_upper_bound(prefix) == expected_upper_bound
+
+    # -------------------------------------------
+
+
+class TestUserManagerSearch:
+    @staticmethod
+    @pytest.fixture
+    def user_manager() -> UserManager:
+        """
+        Creates a new instance of 'UserManager' containing 'USERNAMES'.
+
+        Returns:
+            UserManager: The new instance of UserManager.
+        """
+        user_manager = UserManager()
+        user_manager.addUsers(
+            (username, f"{i}@test.de") for i, username in enumerate(USERNAMES)
+        )
+        return user_manager
+
+    # -----unittests for the search of UserManager-----
+    @staticmethod
+    def test_searchUsersByPrefix(user_manager: UserManager):
+        assert user_manager.searchUsersByPrefix(prefix="be") == [
+            "ben",
+            "benedikt",
+            "berta",
+        ]
+        assert user_manager.searchUsersByPrefix(prefix="be", limit=1, after="ben") == [
+            "benedikt"
+        ]
+
+    @staticmethod
+    def test_searchUsersFuzzy(user_manager: UserManager):
+        assert user_manager.searchUsersFuzzy(query="berte") == [("berta", 1)]
+
+    @staticmethod
+    def test_search_index_is_built_lazily(user_manager: UserManager):
+        assert user_manager._search_index is None
+
+        user_manager.searchUsersByPrefix(prefix="a")
+
+        assert user_manager._search_index is not None
+
+    @staticmethod
+    def test_search_index_is_kept_up_to_date(user_manager: UserManager):
+        user_manager.searchUsersByPrefix(prefix="a")
+
+        user_manager.addUser(username="annika", email="annika@test.de")
+        user_manager.addUsers([("benno", "benno@test.de")])
+        user_manager.addUsers(
+            [("bert", "bert@test.de"), ("ben", "duplicate@test.de")],
+            all_or_nothing=False,
+        )
+
+        assert user_manager.searchUsersByPrefix(prefix="anni") == ["annika"]
+        assert user_manager.searchUsersByPrefix(prefix="ben") == [
+            "ben",
+            "benedikt",
+            "benno",
+        ]
+        assert user_manager.searchUsersFuzzy(query="berd") == [("bert", 1)]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"prefix": 3},  # invalid prefix
+            {"prefix": "a", "after": 3},  # invalid after
+            {"prefix": "a", "limit": -1},  # negative limit
+            {"prefix": "a", "limit": "10"},  # invalid limit
+        ],
+    )
+    def test_searchUsersByPrefix_invalid_inputs(user_manager: UserManager, kwargs):
+        with pytest.raises(InvalidInputError):
+            user_manager.searchUsersByPrefix(**kwargs)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"query": None},  # invalid query
+            {"query": "a", "max_distance": -1},  # negative max_distance
+            {"query": "a", "prefix_length": 1.5},  # invalid prefix_length
+        ],
+    )
+    def test_searchUsersFuzzy_invalid_inputs(user_manager: UserManager, kwargs):
+        with pytest.raises(InvalidInputError):
+            user_manager.searchUsersFuzzy(**kwargs)
+
+    @staticmethod
+    def test_concurrent_user_manager_search_while_adding():
+        user_manager = ConcurrentUserManager()
+        barrier = threading.Barrier(5)
+
+        def add_users(thread_index: int):
+            barrier.wait()
+            for i in range(500):
+                user_manager.addUser(
+                    username=f"thread {thread_index} user {i}",
+                    email=f"thread{thread_index}.user{i}@test.de",
+                )
+
+        def search_users():
+            barrier.wait()
+            for _ in range(50):
+                user_manager.searchUsersByPrefix(prefix="thread")
+
+        threads = [threading.Thread(target=add_users, args=(i,)) for i in range(4)] + [
+            threading.Thread(target=search_users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # no user got lost, regardless of when the index was built
+        assert user_manager.searchUsersByPrefix(prefix="", limit=3000) == sorted(
+            user_manager.users
+        )
+
+    # -------------------------------------------
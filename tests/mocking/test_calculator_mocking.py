@@ -20,6 +20,52 @@ class TestCalculatorMocking:
         with pytest.raises(InvalidInputError, match="Operands must be int or float."):
             CalculatorMocking.multiply(a=a, b=b)
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (3, 4, 12),  # two positive ints
+            (3, -4, -12),  # negative multiplier
+            (2.5, 0.5, 1.25),  # two floats
+            (-1.5, 4, -6.0),  # negative float multiplicand
+            (3, 10**7, 3 * 10**7),  # huge multiplier
+            (7, 0, 0),  # zero
+        ],
+    )
+    def test_multiply_valid_inputs(a, b, expected):
+        assert CalculatorMocking.multiply(a=a, b=b) == expected
+
+    @staticmethod
+    def test_multiply_does_not_call_add(mocker, capsys):
+        spy_add = mocker.spy(CalculatorMocking, "add")
+
+        CalculatorMocking.multiply(3, 10**6)
+
+        # the default multiplication is neither a loop nor prints anything
+        spy_add.assert_not_called()
+        assert capsys.readouterr().out == ""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (3, 4, 12),
+            (3, -4, -12),
+            (2.5, 2, 5.0),
+            (3, 0, 0),
+        ],
+    )
+    def test_multiply_traced(capsys, a, b, expected):
+        assert CalculatorMocking.multiply(a=a, b=b, traced=True) == expected
+
+        # one printed line per iteration
+        assert len(capsys.readouterr().out.splitlines()) == abs(b)
+
+    @staticmethod
+    def test_multiply_traced_invalid_input():
+        with pytest.raises(InvalidInputError):
+            CalculatorMocking.multiply(a=3, b=2.5, traced=True)
+
     @staticmethod
     def test_multiply_valid_inputs_with_mock(mocker):
         fake_add = mocker.patch(
@@ -27,7 +73,7 @@ class TestCalculatorMocking:
             return_value=10,
         )
 
-        result = CalculatorMocking.multiply(3, 4)
+        result = CalculatorMocking.multiply(3, 4, traced=True)
 
         assert result == 10
 
@@ -54,7 +100,7 @@ class TestCalculatorMocking:
         # each time it is called (when an iterable is assigned as the side_effect)
         fake_add.side_effect = [1, 2, 3]
 
-        result = CalculatorMocking.multiply(3, 3)
+        result = CalculatorMocking.multiply(3, 3, traced=True)
 
         assert (
             result == 3
@@ -68,7 +114,7 @@ class TestCalculatorMocking:
         # can be simulated.
         fake_add.side_effect = ValueError("Error!")
         try:
-            CalculatorMocking.multiply(3, 3)
+            CalculatorMocking.multiply(3, 3, traced=True)
         except:
             pass
         # ------------
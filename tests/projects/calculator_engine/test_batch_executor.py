@@ -0,0 +1,135 @@
+import pytest
+
+from unittest_training.basics.calculator_basics import (
+    DivisionByZeroError,
+    InvalidInputError,
+)
+from unittest_training.mocking.calculator_mocking import (
+    InvalidInputError as MockingInvalidInputError,
+)
+from unittest_training.projects.calculator_engine.batch_executor import (
+    BatchExecutor,
+    BatchResult,
+)
+
+
+class TestBatchExecutor:
+    # -----unittests for run-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "max_workers, chunk_size",
+        [
+            (1, 3),  # executed in the calling process (single worker)
+            (2, 100),  # executed in the calling process (single chunk)
+            (2, 3),  # executed in the worker processes
+        ],
+    )
+    def test_run_preserves_order(max_workers, chunk_size):
+        operations = [("add", i, 1) for i in range(20)]
+
+        with BatchExecutor(max_workers=max_workers, chunk_size=chunk_size) as executor:
+            results = executor.run(operations)
+
+        assert results == [BatchResult(i + 1, None) for i in range(20)]
+
+    @staticmethod
+    def test_run_mixed_operations():
+        operations = [("divide", 1, 2), ("add", 1, 2.5), ("multiply", 3, 4)]
+
+        with BatchExecutor(max_workers=2, chunk_size=1) as executor:
+            results = executor.run(operations)
+
+        assert [result.value for result in results] == [0.5, 3.5, 12]
+
+    @staticmethod
+    def test_run_domain_errors_are_reported_per_operation():
+        # the failing operations do not abort the batch
+        operations = [
+            ("divide", 1, 0),
+            ("divide", 4, 2),
+            ("add", "1", 2),
+            ("divide", "1", 2),
+            ("multiply", 2, 3),
+        ]
+
+        with BatchExecutor(max_workers=2, chunk_size=2) as executor:
+            results = executor.run(operations)
+
+        assert [result.value for result in results] == [None, 2.0, None, None, 6]
+        assert isinstance(results[0].error, DivisionByZeroError)
+        assert results[1].error is None
+        assert isinstance(results[2].error, MockingInvalidInputError)
+        assert isinstance(results[3].error, InvalidInputError)
+        assert results[4].error is None
+
+    @staticmethod
+    def test_run_reuses_the_worker_processes():
+        with BatchExecutor(max_workers=2, chunk_size=1) as executor:
+            executor.run([("add", 1, 1), ("add", 2, 2)])
+            pool = executor._executor
+            executor.run([("add", 1, 1), ("add", 2, 2)])
+
+            assert executor._executor is pool
+
+    @staticmethod
+    def test_run_small_batch_does_not_start_workers():
+        with BatchExecutor(max_workers=2, chunk_size=10) as executor:
+            executor.run([("add", 1, 1)])
+
+            assert executor._executor is None
+
+    @staticmethod
+    def test_run_empty_batch():
+        with BatchExecutor(max_workers=2) as executor:
+            assert executor.run([]) == []
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            ("subtract", 1, 2),  # unknown operation
+            ("add", 1),  # too few elements
+            ["add", 1, 2],  # not a tuple
+        ],
+    )
+    def test_run_invalid_operation(operation):
+        with BatchExecutor(max_workers=1) as executor:
+            with pytest.raises(InvalidInputError):
+                executor.run([("add", 1, 2), operation])
+
+    @staticmethod
+    def test_run_after_close():
+        executor = BatchExecutor(max_workers=2, chunk_size=1)
+        executor.close()
+
+        with pytest.raises(ValueError):
+            executor.run([("add", 1, 1)])
+
+        # closing again does nothing
+        executor.close()
+
+    # -------------------------------------------
+
+    # -----unittests for __init__-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "max_workers, chunk_size",
+        [
+            (0, 10),
+            (-1, 10),
+            (1.5, 10),
+            (2, 0),
+            (2, "10"),
+        ],
+    )
+    def test_invalid_arguments(max_workers, chunk_size):
+        with pytest.raises(ValueError):
+            BatchExecutor(max_workers=max_workers, chunk_size=chunk_size)
+
+    @staticmethod
+    def test_default_max_workers(mocker):
+        mocker.patch("os.cpu_count", return_value=None)
+
+        assert BatchExecutor().max_workers == 1
+
+    # -------------------------------------------
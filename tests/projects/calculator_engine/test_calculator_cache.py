@@ -0,0 +1,200 @@
+import math
+import pytest
+
+from unittest_training.basics.calculator_basics import (
+    Calculator,
+    DivisionByZeroError,
+    InvalidInputError,
+)
+from unittest_training.mocking.calculator_mocking import (
+    CalculatorMocking,
+    InvalidInputError as MockingInvalidInputError,
+)
+from unittest_training.projects.calculator_engine.calculator_cache import (
+    CacheInfo,
+    CachedCalculator,
+    LRUCache,
+)
+
+
+class TestLRUCache:
+    # -----unittests for LRUCache-----
+    @staticmethod
+    def test_get_and_put():
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b", "default") == "default"
+        assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    @staticmethod
+    def test_evicts_least_recently_used():
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # 'b' is now the least recently used entry
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.info().currsize == 2
+
+    @staticmethod
+    def test_clear():
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+    @staticmethod
+    @pytest.mark.parametrize("maxsize", [0, -1, 1.5, True, None])
+    def test_invalid_maxsize(maxsize):
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=maxsize)
+
+    # -------------------------------------------
+
+
+class TestCachedCalculator:
+    # -----unittests for the cached operations-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "operation, function, a, b",
+        [
+            ("divide", Calculator.divide, 1, 3),
+            ("divide", Calculator.divide, -2.5, 0.5),
+            ("add", CalculatorMocking.add, 1, 2),
+            ("add", CalculatorMocking.add, 1, 2.5),
+            ("multiply", CalculatorMocking.multiply, 3, 4),
+            ("multiply", CalculatorMocking.multiply, 3, 0.5),
+        ],
+    )
+    def test_same_result_as_uncached(operation, function, a, b):
+        calculator = CachedCalculator()
+        expected = function(a, b)
+
+        # the first call computes, the second call is served by the cache
+        for _ in range(2):
+            result = getattr(calculator, operation)(a, b)
+            assert result == expected
+            assert type(result) is type(expected)
+
+        assert calculator.cache_info().hits == 1
+        assert calculator.cache_info().misses == 1
+
+    @staticmethod
+    def test_int_and_float_keys_are_distinct():
+        # 1 == 1.0 (with the same hash), but the results differ in their type
+        calculator = CachedCalculator()
+
+        assert type(calculator.add(1, 1)) is int
+        assert type(calculator.add(1.0, 1)) is float
+        assert type(calculator.add(True, 1)) is int
+        assert calculator.cache_info().misses == 3
+
+    @staticmethod
+    def test_signed_zeros_are_distinct():
+        calculator = CachedCalculator()
+
+        assert math.copysign(1, calculator.add(-0.0, -0.0)) == -1
+        assert math.copysign(1, calculator.add(0.0, -0.0)) == 1
+
+    @staticmethod
+    def test_nan_operands_are_cached():
+        calculator = CachedCalculator()
+        calculator.add(float("nan"), 1)
+
+        assert math.isnan(calculator.add(float("nan"), 1))
+        assert calculator.cache_info().hits == 1
+
+    @staticmethod
+    def test_operations_do_not_share_entries():
+        calculator = CachedCalculator()
+
+        assert calculator.add(2, 3) == 5
+        assert calculator.multiply(2, 3) == 6
+
+    @staticmethod
+    def test_division_by_zero_is_cached():
+        calculator = CachedCalculator()
+
+        for _ in range(2):
+            with pytest.raises(DivisionByZeroError):
+                calculator.divide(1, 0)
+
+        assert calculator.cache_info().hits == 1
+
+    @staticmethod
+    def test_cached_exception_is_a_new_instance():
+        calculator = CachedCalculator()
+
+        with pytest.raises(DivisionByZeroError) as first:
+            calculator.divide(1, 0)
+        with pytest.raises(DivisionByZeroError) as second:
+            calculator.divide(1, 0)
+
+        assert first.value is not second.value
+        assert second.value.args == ("Denominator cannot be zero.",)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "operation, error",
+        [
+            ("divide", InvalidInputError),
+            ("add", MockingInvalidInputError),
+            ("multiply", MockingInvalidInputError),
+        ],
+    )
+    def test_invalid_inputs_raise_the_original_exception(operation, error):
+        calculator = CachedCalculator()
+
+        for _ in range(2):
+            with pytest.raises(error):
+                getattr(calculator, operation)("1", 2)
+
+        assert calculator.cache_info().hits == 1
+
+    @staticmethod
+    def test_unhashable_operands_are_not_cached():
+        calculator = CachedCalculator()
+
+        with pytest.raises(InvalidInputError):
+            calculator.divide([1], 2)
+
+        assert calculator.cache_info().currsize == 0
+
+    @staticmethod
+    def test_cache_is_bounded():
+        calculator = CachedCalculator(maxsize=10)
+        for i in range(100):
+            calculator.add(i, 1)
+
+        assert calculator.cache_info().currsize == 10
+
+    @staticmethod
+    def test_cache_clear():
+        calculator = CachedCalculator()
+        calculator.add(1, 2)
+        calculator.cache_clear()
+
+        assert calculator.cache_info() == CacheInfo(0, 0, 1024, 0)
+
+    @staticmethod
+    def test_uses_the_wrapped_operation(mocker):
+        # only the first call reaches 'Calculator.divide'
+        mocked_divide = mocker.patch(
+            "unittest_training.projects.calculator_engine.calculator_cache._OPERATIONS",
+            {"divide": mocker.Mock(return_value=0.5)},
+        )["divide"]
+        calculator = CachedCalculator()
+
+        calculator.divide(1, 2)
+        calculator.divide(1, 2)
+
+        mocked_divide.assert_called_once_with(1, 2)
+
+    # -------------------------------------------
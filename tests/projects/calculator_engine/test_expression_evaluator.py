@@ -0,0 +1,247 @@
+import array
+import math
+import pytest
+
+from unittest_training.basics.calculator_basics import (
+    BatchDivisionByZeroError,
+    DivisionByZeroError,
+    InvalidInputError,
+)
+from unittest_training.projects.calculator_engine.expression_evaluator import (
+    CompiledExpression,
+    compile_expression,
+)
+
+
+class TestCompileExpression:
+    # -----unittests for compile_expression-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "expression, bindings, expected",
+        [
+            ("a + b", {"a": 1, "b": 2}, 3),  # addition
+            ("a - b", {"a": 1, "b": 2.5}, -1.5),  # subtraction
+            ("a * b", {"a": -3, "b": 2}, -6),  # multiplication
+            ("a / b", {"a": 1, "b": 4}, 0.25),  # division
+            ("-(a + b) * +c", {"a": 1, "b": 2, "c": 3}, -9),  # unary operators
+            ("(a + b) * (a - b) / 2", {"a": 5, "b": 3}, 8.0),  # parentheses
+            ("  a + 1  ", {"a": 1}, 2),  # surrounding whitespace
+        ],
+    )
+    def test_evaluate_correct_result(expression, bindings, expected):
+        assert compile_expression(expression).evaluate(**bindings) == expected
+
+    @staticmethod
+    def test_division_returns_float_like_calculator():
+        # 'Calculator.divide' always returns a float; so does the engine
+        assert isinstance(compile_expression("a / b").evaluate(a=4, b=2), float)
+
+    @staticmethod
+    def test_constant_folding():
+        # '2 * 3 + 1' is computed at compile time, so only the variable,
+        # the folded constant 7 and the multiplication are left
+        compiled = compile_expression("x * (2 * 3 + 1)")
+
+        assert compiled.slots == [("var", "x"), ("const", 7), ("*", 0, 1)]
+        assert compiled.evaluate(x=2) == 14
+
+    @staticmethod
+    def test_common_subexpressions_are_shared():
+        # 'a + b' and 'b + a' are the same subexpression, so there
+        # is only one addition in the compiled form
+        compiled = compile_expression("(a + b) * (b + a)")
+
+        additions = [slot for slot in compiled.slots if slot[0] == "+"]
+        assert len(additions) == 1
+        assert compiled.evaluate(a=1, b=2) == 9
+
+    @staticmethod
+    def test_non_commutative_operands_are_not_swapped():
+        compiled = compile_expression("(a - b) + (b - a) * 2")
+
+        assert compiled.evaluate(a=5, b=3) == -2
+
+    @staticmethod
+    def test_constant_expression():
+        compiled = compile_expression("1e308 * 10")
+
+        assert compiled.variables == ()
+        assert compiled.evaluate() == math.inf
+
+    @staticmethod
+    def test_variables():
+        assert compile_expression("b * a + b").variables == ("a", "b")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "a +",  # syntax error
+            "a ** 2",  # unsupported operator
+            "a // 2",  # unsupported operator
+            "f(a)",  # function call
+            "a.b",  # attribute access
+            "'a' + 1",  # string literal
+            "True + 1",  # bool literal
+            "_a + 1",  # reserved variable name
+            5,  # not a str
+        ],
+    )
+    def test_invalid_expression(expression):
+        with pytest.raises(InvalidInputError):
+            compile_expression(expression)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "a / 0",  # constant zero denominator
+            "a / (1 - 1)",  # folded zero denominator
+            "1 / 0.0",  # constant expression
+        ],
+    )
+    def test_division_by_constant_zero(expression):
+        with pytest.raises(DivisionByZeroError):
+            compile_expression(expression)
+
+    # -------------------------------------------
+
+
+class TestCompiledExpression:
+    # -----unittests for evaluate and evaluate_many-----
+    @staticmethod
+    def test_evaluate_division_by_zero():
+        compiled = compile_expression("a / (b - 1)")
+
+        with pytest.raises(DivisionByZeroError):
+            compiled.evaluate(a=1, b=1)
+
+    @staticmethod
+    def test_evaluate_division_by_zero_variable_named_like_the_error():
+        # a variable must not shadow the exception raised by the generated code
+        compiled = compile_expression("a / DivisionByZeroError")
+
+        with pytest.raises(DivisionByZeroError):
+            compiled.evaluate(a=1, DivisionByZeroError=0)
+
+    @staticmethod
+    def test_evaluate_variable_named_self():
+        # the receiver of 'evaluate' is positional-only
+        assert compile_expression("self + 1").evaluate(self=2) == 3
+
+    @staticmethod
+    def test_evaluate_missing_variable():
+        with pytest.raises(InvalidInputError):
+            compile_expression("a + b").evaluate(a=1)
+
+    @staticmethod
+    @pytest.mark.parametrize("value", ["1", None, [1]])
+    def test_evaluate_invalid_value(value):
+        with pytest.raises(InvalidInputError):
+            compile_expression("a + 1").evaluate(a=value)
+
+    @staticmethod
+    def test_evaluate_ignores_unused_bindings():
+        assert compile_expression("a + 1").evaluate(a=1, b="unused") == 2
+
+    @staticmethod
+    def test_evaluate_many():
+        compiled = compile_expression("(price - cost) / price * 100")
+        rows = [{"price": 20, "cost": 15}, {"price": 8, "cost": 2}]
+
+        assert compiled.evaluate_many(rows) == [25.0, 75.0]
+
+    @staticmethod
+    def test_evaluate_many_accepts_a_generator():
+        compiled = compile_expression("a * 2")
+
+        assert compiled.evaluate_many({"a": i} for i in range(3)) == [0, 2, 4]
+
+    @staticmethod
+    def test_evaluate_many_division_by_zero():
+        compiled = compile_expression("1 / a")
+
+        with pytest.raises(DivisionByZeroError):
+            compiled.evaluate_many([{"a": 1}, {"a": 0}])
+
+    # -------------------------------------------
+
+    # -----unittests for evaluate_columns-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "columns",
+        [
+            {"a": [1, 2, 3], "b": [4, 5, 6]},  # lists
+            {"a": (1, 2, 3), "b": (4, 5, 6)},  # tuples
+            {"a": array.array("i", [1, 2, 3]), "b": array.array("d", [4, 5, 6])},
+        ],
+    )
+    def test_evaluate_columns_matches_evaluate(columns):
+        compiled = compile_expression("-(a + b) * (b + a) / 2 - a / b + 1")
+        expected = [
+            compiled.evaluate(a=a, b=b) for a, b in zip(columns["a"], columns["b"])
+        ]
+
+        assert compiled.evaluate_columns(columns) == expected
+
+    @staticmethod
+    def test_evaluate_columns_constant_expression():
+        # the number of rows is taken from the (unused) columns
+        assert compile_expression("2 * 3").evaluate_columns({"a": [1, 2]}) == [6, 6]
+
+    @staticmethod
+    def test_evaluate_columns_constant_expression_without_columns():
+        with pytest.raises(InvalidInputError):
+            compile_expression("2 * 3").evaluate_columns({})
+
+    @staticmethod
+    def test_evaluate_columns_division_by_zero_reports_all_rows():
+        compiled = compile_expression("a / (b - 1)")
+
+        with pytest.raises(BatchDivisionByZeroError) as exc_info:
+            compiled.evaluate_columns({"a": [1, 2, 3, 4], "b": [1, 2, 1, 3]})
+
+        assert exc_info.value.indices == [0, 2]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "columns",
+        [
+            {"a": [1, 2]},  # missing column
+            {"a": [1, 2], "b": [1]},  # different lengths
+            {"a": [1, "2"], "b": [1, 2]},  # invalid value
+            {"a": "12", "b": [1, 2]},  # not a sequence of numbers
+            {"a": 1, "b": [1, 2]},  # not a sequence
+        ],
+    )
+    def test_evaluate_columns_invalid_columns(columns):
+        with pytest.raises(InvalidInputError):
+            compile_expression("a + b").evaluate_columns(columns)
+
+    @staticmethod
+    def test_evaluate_columns_numpy():
+        np = pytest.importorskip("numpy")
+        compiled = compile_expression("(a + b) * (a + b) / c")
+
+        result = compiled.evaluate_columns(
+            {"a": np.array([1, 2]), "b": [3, 4], "c": np.array([2.0, 4.0])}
+        )
+
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [8.0, 9.0]
+
+    @staticmethod
+    def test_evaluate_columns_numpy_division_by_zero():
+        np = pytest.importorskip("numpy")
+        compiled = compile_expression("a / b")
+
+        with pytest.raises(BatchDivisionByZeroError) as exc_info:
+            compiled.evaluate_columns({"a": np.ones(3), "b": np.array([1, 0, 0])})
+
+        assert exc_info.value.indices == [1, 2]
+
+    # -------------------------------------------
+
+    @staticmethod
+    def test_compiled_expression_type():
+        assert isinstance(compile_expression("a"), CompiledExpression)
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import threading
+import time
+import pytest
+
+from unittest_training.projects.textfile_writer.async_textfile_writer import (
+    AsyncTextfileWriter,
+)
+from unittest_training.projects.textfile_writer.textfile_writer import (
+    TextfileWriter,
+    FileCreationError,
+)
+
+
+class TestAsyncTextfileWriter:
+    """
+    This class holds the Unittest-cases for the asyncio-wrapper
+    'unittest_training.projects.textfile_writer.async_textfile_writer.AsyncTextfileWriter'.
+
+    The event loop is driven via 'asyncio.run' inside every test.
+    """
+
+    @staticmethod
+    def test_process_textfile_valid_inputs(tmp_path):
+        file_paths = [tmp_path / f"file_{i}.txt" for i in range(10)]
+
+        async def write_all():
+            async with AsyncTextfileWriter(max_concurrency=3) as writer:
+                await asyncio.gather(
+                    *(
+                        writer.process_textfile(
+                            text_to_write=f"Text {i}", file_path=file_path
+                        )
+                        for i, file_path in enumerate(file_paths)
+                    )
+                )
+
+        asyncio.run(write_all())
+
+        for i, file_path in enumerate(file_paths):
+            with open(file_path, "r") as f:
+                assert f.read() == f"Text {i}"
+
+    @staticmethod
+    def test_process_textfiles_valid_inputs(tmp_path):
+        items = [(tmp_path / f"file_{i}.txt", f"Text {i}") for i in range(3)]
+
+        async def write_batch():
+            async with AsyncTextfileWriter() as writer:
+                await writer.process_textfiles(items=items)
+
+        asyncio.run(write_batch())
+
+        for file_path, text_to_write in items:
+            with open(file_path, "r") as f:
+                assert f.read() == text_to_write
+
+    @staticmethod
+    def test_process_textfile_concurrency_limit(mocker, tmp_path):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        # a fake 'process_textfile' which records how many calls run concurrently
+        def fake_process_textfile(**kwargs):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        mocker.patch.object(
+            TextfileWriter, "process_textfile", side_effect=fake_process_textfile
+        )
+
+        async def write_all():
+            async with AsyncTextfileWriter(max_concurrency=2) as writer:
+                await asyncio.gather(
+                    *(
+                        writer.process_textfile(
+                            text_to_write="Some text",
+                            file_path=tmp_path / f"file_{i}.txt",
+                        )
+                        for i in range(8)
+                    )
+                )
+
+        asyncio.run(write_all())
+
+        assert max_running == 2
+
+    @staticmethod
+    def test_process_textfile_file_cannot_be_created(mocker, tmp_path):
+        mocker.patch("builtins.open", side_effect=OSError("cannot create file"))
+
+        async def write():
+            async with AsyncTextfileWriter() as writer:
+                await writer.process_textfile(
+                    text_to_write="Some text", file_path=tmp_path / "testfile.txt"
+                )
+
+        # checking that the same custom exception reaches the caller
+        with pytest.raises(FileCreationError):
+            asyncio.run(write())
+
+    @staticmethod
+    def test_process_textfile_check_rollback_functionality(mocker, tmp_path):
+        file_path = tmp_path / "testfile.txt"
+
+        mocker.patch.object(
+            TextfileWriter, "_write_text", side_effect=OSError("write failed")
+        )
+
+        async def write():
+            async with AsyncTextfileWriter() as writer:
+                await writer.process_textfile(
+                    text_to_write="Some text", file_path=file_path
+                )
+
+        with pytest.raises(OSError, match="write failed"):
+            asyncio.run(write())
+
+        assert not os.path.exists(file_path)
+
+    @staticmethod
+    @pytest.mark.parametrize("max_concurrency", [0, -1, 2.5])
+    def test_init_invalid_max_concurrency(max_concurrency):
+        with pytest.raises(ValueError):
+            AsyncTextfileWriter(max_concurrency=max_concurrency)
@@ -0,0 +1,77 @@
+import json
+import pytest
+
+from unittest_training.projects.textfile_writer.instrumentation import (
+    PHASES,
+    Instrumentation,
+    MetricsInstrumentation,
+    measure,
+)
+
+
+class TestInstrumentation:
+    """
+    This class holds the Unittest-cases for the instrumentation
+    in 'unittest_training.projects.textfile_writer.instrumentation'.
+    """
+
+    @staticmethod
+    def test_record_counters_and_histogram():
+        metrics = MetricsInstrumentation(bucket_bounds=(0.001, 0.01))
+
+        metrics.record("write", duration=0.0005, size=10)
+        metrics.record("write", duration=0.005, size=20)
+        metrics.record("write", duration=5.0, size=30)
+        metrics.record_failure("write")
+
+        assert metrics.count("write") == 3
+        assert metrics.failures("write") == 1
+        assert metrics.total_size("write") == 60
+        assert metrics.total_duration("write") == pytest.approx(5.0055)
+        # an overflow-bucket is added automatically
+        assert metrics.histogram("write") == [(0.001, 1), (0.01, 1), (float("inf"), 1)]
+
+    @staticmethod
+    def test_snapshot_and_reset():
+        metrics = MetricsInstrumentation()
+        metrics.record("open", duration=0.001)
+
+        snapshot = metrics.snapshot()
+        assert set(snapshot) == set(PHASES)
+        assert snapshot["open"]["count"] == 1
+        # the snapshot can be serialized (e.g. for exporting the metrics)
+        json.dumps(snapshot)
+
+        metrics.reset()
+        assert metrics.count("open") == 0
+
+    @staticmethod
+    def test_measure():
+        metrics = MetricsInstrumentation()
+
+        with measure(metrics, "write") as timer:
+            timer.size = 5
+
+        with pytest.raises(OSError):
+            with measure(metrics, "fsync"):
+                raise OSError("fsync failed")
+
+        assert metrics.count("write") == 1
+        assert metrics.total_size("write") == 5
+        assert metrics.count("fsync") == 0
+        assert metrics.failures("fsync") == 1
+
+    @staticmethod
+    def test_measure_disabled_instrumentation(mocker):
+        instrumentation = Instrumentation()
+        spy_record = mocker.spy(instrumentation, "record")
+
+        with measure(instrumentation, "write") as timer:
+            timer.size = 5
+
+        spy_record.assert_not_called()
+
+    @staticmethod
+    def test_invalid_bucket_bounds():
+        with pytest.raises(ValueError):
+            MetricsInstrumentation(bucket_bounds=(0.1, 0.01))
@@ -0,0 +1,172 @@
+import os
+import pytest
+
+from unittest_training.projects.textfile_writer.textfile_appender import (
+    TextfileAppender,
+)
+from unittest_training.projects.textfile_writer.textfile_writer import (
+    Durability,
+    FileCreationError,
+    FileHandleCloseError,
+    TextfileWriter,
+)
+
+
+class TestTextfileAppender:
+    """
+    This class holds the Unittest-cases for the append-mode writer
+    'unittest_training.projects.textfile_writer.textfile_appender.TextfileAppender'.
+    """
+
+    @staticmethod
+    def test_append_valid_inputs(tmp_path):
+        file_path = tmp_path / "audit.log"
+        file_path.write_text("Existing record\n")
+
+        with TextfileAppender(file_path=file_path) as appender:
+            appender.append("First record")
+            appender.append("Second record")
+
+        # checking that the records were appended (and not overwritten)
+        assert file_path.read_text() == (
+            "Existing record\nFirst record\nSecond record\n"
+        )
+        assert appender.closed
+
+    @staticmethod
+    def test_append_size_threshold(tmp_path):
+        file_path = tmp_path / "audit.log"
+
+        appender = TextfileAppender(
+            file_path=file_path, max_buffer_size=10, flush_interval=None
+        )
+        appender.append("abc")
+        # still buffered in memory
+        assert file_path.read_text() == ""
+
+        appender.append("defghij")
+        # the threshold of 10 characters is reached
+        assert file_path.read_text() == "abc\ndefghij\n"
+
+        appender.close()
+
+    @staticmethod
+    def test_append_time_threshold(mocker, tmp_path):
+        file_path = tmp_path / "audit.log"
+
+        mock_monotonic = mocker.patch(
+            "unittest_training.projects.textfile_writer.textfile_appender.time.monotonic",
+            return_value=100.0,
+        )
+
+        appender = TextfileAppender(file_path=file_path, flush_interval=5.0)
+        appender.append("First record")
+        assert file_path.read_text() == ""
+
+        # simulating that the flush-interval has passed
+        mock_monotonic.return_value = 105.0
+        appender.append("Second record")
+        assert file_path.read_text() == "First record\nSecond record\n"
+
+        appender.close()
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "durability, sync_every, expected_sync_count",
+        [
+            # 4 flushes plus the forced sync on close
+            (Durability.FSYNC, 1, 5),
+            (Durability.FSYNC, 2, 3),
+            (Durability.FLUSH, 1, 0),
+        ],
+    )
+    def test_flush_sync_cadence(
+        mocker, tmp_path, durability, sync_every, expected_sync_count
+    ):
+        spy_sync_fd = mocker.spy(TextfileWriter, "_sync_fd")
+
+        appender = TextfileAppender(
+            file_path=tmp_path / "audit.log",
+            sync_every=sync_every,
+            durability=durability,
+        )
+        for i in range(4):
+            appender.append(f"Record {i}")
+            appender.flush()
+        appender.close()
+
+        assert spy_sync_fd.call_count == expected_sync_count
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "invalid_record",
+        [
+            b"Some record",  # bytes instead of str
+            3,  # int instead of str
+        ],
+    )
+    def test_append_invalid_record(tmp_path, invalid_record):
+        file_path = tmp_path / "audit.log"
+        appender = TextfileAppender(file_path=file_path)
+
+        with pytest.raises(TypeError):
+            appender.append(invalid_record)
+
+        # the rejected record must not break the following appends
+        appender.append("Valid record")
+        appender.close()
+
+        assert file_path.read_text() == "Valid record\n"
+
+    @staticmethod
+    def test_append_after_close(tmp_path):
+        appender = TextfileAppender(file_path=tmp_path / "audit.log")
+        appender.close()
+        # closing twice is fine
+        appender.close()
+
+        with pytest.raises(ValueError):
+            appender.append("Some record")
+
+    @staticmethod
+    def test_file_cannot_be_created(mocker, tmp_path):
+        mocker.patch("builtins.open", side_effect=OSError("cannot create file"))
+
+        with pytest.raises(FileCreationError):
+            TextfileAppender(file_path=tmp_path / "audit.log")
+
+    @staticmethod
+    def test_file_handle_cannot_be_closed(mocker, tmp_path):
+        file_path = tmp_path / "audit.log"
+
+        mock_file_handle = mocker.Mock()
+        mock_file_handle.closed = False
+        mock_file_handle.close.side_effect = OSError("File handle cannot be closed.")
+        mocker.patch.object(
+            TextfileWriter, "_create_file", return_value=mock_file_handle
+        )
+        mocker.patch.object(TextfileWriter, "_sync_fd")
+
+        appender = TextfileAppender(file_path=file_path)
+        appender.append("Some record")
+
+        with pytest.raises(FileHandleCloseError):
+            appender.close()
+
+        # checking that the buffered record was written before closing
+        mock_file_handle.write.assert_called_once_with("Some record\n")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            ({"max_buffer_size": 0}),
+            ({"sync_every": 0}),
+            ({"flush_interval": -1.0}),
+        ],
+    )
+    def test_init_invalid_inputs(tmp_path, kwargs):
+        with pytest.raises(ValueError):
+            TextfileAppender(file_path=tmp_path / "audit.log", **kwargs)
+
+        assert not os.path.exists(tmp_path / "audit.log")
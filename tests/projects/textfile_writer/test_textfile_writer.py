@@ -1,12 +1,19 @@
+import errno
+import io
 import os
 from io import TextIOWrapper
 import pytest
 
+from unittest_training.projects.textfile_writer.instrumentation import (
+    MetricsInstrumentation,
+)
 from unittest_training.projects.textfile_writer.textfile_writer import (
     TextfileWriter,
+    Durability,
     FileCreationError,
     FileDeletionError,
     FileHandleCloseError,
+    FileReplaceError,
     text_to_write,
     filename,
     current_dir_path,
@@ -278,3 +285,551 @@ class TestTextfileWriter:
         assert os.path.exists(file_path)
 
     # -------------------------------------------
+
+    # -----unittests for the batch-mode----------
+    @staticmethod
+    def test_process_textfiles_valid_inputs(mocker, tmp_path):
+        (tmp_path / "subdir").mkdir()
+        items = [
+            (tmp_path / "first.txt", "First text"),
+            (tmp_path / "second.txt", ""),
+            (tmp_path / "subdir" / "third.txt", "Third text"),
+        ]
+
+        # spying on "os.fsync" to check the group-commit
+        spy_fsync = mocker.spy(os, "fsync")
+
+        TextfileWriter.process_textfiles(items=items)
+
+        # checking if every file was written with its text
+        for file_path, text_to_write in items:
+            with open(file_path, "r") as f:
+                assert f.read() == text_to_write
+
+        # checking that every file (3) and every distinct parent directory (2)
+        # was fsynced exactly once (the directories only on POSIX-systems)
+        expected_fsync_count = 3 + (2 if os.name == "posix" else 0)
+        assert spy_fsync.call_count == expected_fsync_count
+
+    @staticmethod
+    def test_process_textfiles_check_rollback_functionality(mocker, tmp_path):
+        items = [
+            (tmp_path / "first.txt", "First text"),
+            (tmp_path / "second.txt", "Second text"),
+            (tmp_path / "third.txt", "Third text"),
+        ]
+
+        # simulating that writing the second file fails
+        mocker.patch.object(
+            TextfileWriter,
+            "_write_text",
+            side_effect=[None, OSError("write failed")],
+        )
+
+        with pytest.raises(OSError, match="write failed"):
+            TextfileWriter.process_textfiles(items=items)
+
+        # checking if the whole batch was rolled back, i.e. the already
+        # created files were deleted again and the third file was never created
+        for file_path, _ in items:
+            assert not os.path.exists(file_path)
+
+    @staticmethod
+    def test_process_textfiles_commit_fails(mocker, tmp_path):
+        items = [
+            (tmp_path / "first.txt", "First text"),
+            (tmp_path / "second.txt", "Second text"),
+        ]
+
+        # simulating that the group-commit fails
+        mocker.patch.object(
+            TextfileWriter, "_commit_files", side_effect=OSError("fsync failed")
+        )
+
+        with pytest.raises(OSError, match="fsync failed"):
+            TextfileWriter.process_textfiles(items=items)
+
+        # checking if all files were deleted again
+        assert os.listdir(tmp_path) == []
+
+    @staticmethod
+    def test_process_textfiles_files_cannot_be_deleted(mocker, tmp_path):
+        items = [
+            (tmp_path / "first.txt", "First text"),
+            (tmp_path / "second.txt", "Second text"),
+        ]
+
+        mocker.patch.object(
+            TextfileWriter, "_commit_files", side_effect=OSError("fsync failed")
+        )
+        mock_remove = mocker.patch(
+            "os.remove", side_effect=OSError("File cannot be deleted")
+        )
+
+        with pytest.raises(FileDeletionError):
+            TextfileWriter.process_textfiles(items=items)
+
+        # checking that the deletion was attempted for every file of the batch
+        assert mock_remove.call_count == 2
+
+    # -------------------------------------------
+
+    # -----unittests for the atomic-mode---------
+    @staticmethod
+    @pytest.mark.parametrize(
+        "text_to_write",
+        [
+            ("SomeString"),
+            (""),
+        ],
+    )
+    def test_process_textfile_atomic_valid_inputs(tmp_path, text_to_write: str):
+        file_path = tmp_path / filename
+
+        # an already existing file is expected to be replaced
+        file_path.write_text("Old text")
+
+        TextfileWriter.process_textfile(
+            text_to_write=text_to_write, file_path=file_path, atomic=True
+        )
+
+        with open(file_path, "r") as f:
+            assert f.read() == text_to_write
+
+        # checking that no temporary file was left behind
+        assert os.listdir(tmp_path) == [filename]
+
+    @staticmethod
+    def test_process_textfile_atomic_check_rollback_functionality(mocker, tmp_path):
+        file_path = tmp_path / filename
+        file_path.write_text("Old text")
+
+        # simulating a failing write (after the temporary file was created)
+        mocker.patch.object(
+            TextfileWriter, "_write_text", side_effect=OSError("write failed")
+        )
+
+        with pytest.raises(OSError, match="write failed"):
+            TextfileWriter.process_textfile(
+                text_to_write="New text", file_path=file_path, atomic=True
+            )
+
+        # checking that the original file was left untouched
+        # and that the temporary file was deleted again
+        with open(file_path, "r") as f:
+            assert f.read() == "Old text"
+        assert os.listdir(tmp_path) == [filename]
+
+    @staticmethod
+    def test_process_textfile_atomic_failed_fsync(mocker, tmp_path):
+        file_path = tmp_path / filename
+        file_path.write_text("Old text")
+
+        # simulating a failing fsync of the temporary file
+        mocker.patch("os.fsync", side_effect=OSError("fsync failed"))
+
+        with pytest.raises(OSError, match="fsync failed"):
+            TextfileWriter.process_textfile(
+                text_to_write="New text", file_path=file_path, atomic=True
+            )
+
+        # the un-synced temporary file did not replace the original file
+        with open(file_path, "r") as f:
+            assert f.read() == "Old text"
+        assert os.listdir(tmp_path) == [filename]
+
+    @staticmethod
+    def test_process_textfile_atomic_file_cannot_be_replaced(mocker, tmp_path):
+        file_path = tmp_path / filename
+
+        # mocking "os.replace" to fail
+        mocker.patch("os.replace", side_effect=OSError("cannot rename file"))
+
+        with pytest.raises(FileReplaceError):
+            TextfileWriter.process_textfile(
+                text_to_write="Some text", file_path=file_path, atomic=True
+            )
+
+        # checking that neither the target file nor the temporary file exist
+        assert os.listdir(tmp_path) == []
+
+    # -------------------------------------------
+
+    # -----unittests for the streaming-input-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "make_text_source",
+        [
+            (lambda: (chunk for chunk in ["Some", "Text", "In", "Chunks"])),
+            (lambda: ["Some", "Text", "In", "Chunks"]),
+            (lambda: io.StringIO("SomeTextInChunks")),
+        ],
+    )
+    def test_process_textfile_streaming_valid_inputs(tmp_path, make_text_source):
+        file_path = tmp_path / filename
+
+        TextfileWriter.process_textfile(
+            text_to_write=make_text_source(), file_path=file_path, chunk_size=3
+        )
+
+        with open(file_path, "r") as f:
+            assert f.read() == "SomeTextInChunks"
+
+    @staticmethod
+    def test_write_text_buffers_chunks(mocker):
+        mock_file_handle = mocker.Mock()
+
+        TextfileWriter._write_text(
+            file_handle=mock_file_handle,
+            text_to_write=iter(["ab", "cd", "ef", "g"]),
+            chunk_size=4,
+        )
+
+        # checking that the small chunks were combined into writes of
+        # (at least) 'chunk_size' characters, plus the remainder at the end
+        assert mock_file_handle.write.call_args_list == [
+            mocker.call("abcd"),
+            mocker.call("efg"),
+        ]
+        mock_file_handle.flush.assert_not_called()
+
+    @staticmethod
+    def test_process_textfile_streaming_check_rollback_functionality(tmp_path):
+        file_path = tmp_path / filename
+
+        # a generator which fails in the middle of the stream
+        def failing_text_source():
+            yield "Some text"
+            raise RuntimeError("stream failed")
+
+        with pytest.raises(RuntimeError, match="stream failed"):
+            TextfileWriter.process_textfile(
+                text_to_write=failing_text_source(), file_path=file_path, chunk_size=1
+            )
+
+        # checking if the rollback was conducted
+        assert not os.path.exists(file_path)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "make_text_source",
+        [
+            (lambda: io.BytesIO(b"Some text")),  # a binary file-like object
+            (lambda: ["Some", b"text"]),  # a chunk which is no str
+        ],
+    )
+    def test_process_textfile_streaming_invalid_chunks(tmp_path, make_text_source):
+        file_path = tmp_path / filename
+
+        with pytest.raises(TypeError):
+            TextfileWriter.process_textfile(
+                text_to_write=make_text_source(), file_path=file_path, chunk_size=3
+            )
+
+        # checking if the rollback was conducted
+        assert not os.path.exists(file_path)
+
+    @staticmethod
+    def test_process_textfile_streaming_invalid_chunk_size(tmp_path):
+        file_path = tmp_path / filename
+
+        with pytest.raises(ValueError):
+            TextfileWriter.process_textfile(
+                text_to_write=["Some text"], file_path=file_path, chunk_size=0
+            )
+
+        assert not os.path.exists(file_path)
+
+    # -------------------------------------------
+
+    # -----unittests for the durability-levels---
+    @staticmethod
+    @pytest.mark.parametrize(
+        "durability, expected_sync_count",
+        [
+            (Durability.NONE, 0),
+            (Durability.FLUSH, 0),
+            (Durability.FDATASYNC, 1),
+            (Durability.FSYNC, 1),
+            (Durability.FSYNC_DIR, 2 if os.name == "posix" else 1),
+        ],
+    )
+    def test_process_textfile_durability(
+        mocker, tmp_path, durability: Durability, expected_sync_count: int
+    ):
+        file_path = tmp_path / filename
+
+        spy_fsync = mocker.spy(os, "fsync")
+        spy_fdatasync = (
+            mocker.spy(os, "fdatasync") if hasattr(os, "fdatasync") else mocker.Mock()
+        )
+
+        TextfileWriter.process_textfile(
+            text_to_write="Some text", file_path=file_path, durability=durability
+        )
+
+        with open(file_path, "r") as f:
+            assert f.read() == "Some text"
+
+        # checking that exactly the requested syncs were conducted
+        assert spy_fsync.call_count + spy_fdatasync.call_count == expected_sync_count
+
+    @staticmethod
+    def test_process_textfile_durability_none_skips_flush(mocker, tmp_path):
+        file_path = tmp_path / filename
+
+        # a fake file-handle, which is marked as closed when "close" is called
+        mock_file_handle = mocker.Mock()
+        mock_file_handle.closed = False
+        mock_file_handle.close.side_effect = lambda: setattr(
+            mock_file_handle, "closed", True
+        )
+        mocker.patch.object(
+            TextfileWriter, "_create_file", return_value=mock_file_handle
+        )
+
+        TextfileWriter.process_textfile(
+            text_to_write="Some text", file_path=file_path, durability=Durability.NONE
+        )
+
+        mock_file_handle.write.assert_called_once_with("Some text")
+        mock_file_handle.flush.assert_not_called()
+        mock_file_handle.close.assert_called_once()
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "durability",
+        [
+            (Durability.NONE),
+            (Durability.FLUSH),
+        ],
+    )
+    def test_process_textfiles_durability_without_sync(
+        mocker, tmp_path, durability: Durability
+    ):
+        items = [
+            (tmp_path / "first.txt", "First text"),
+            (tmp_path / "second.txt", "Second text"),
+        ]
+
+        spy_fsync = mocker.spy(os, "fsync")
+
+        TextfileWriter.process_textfiles(items=items, durability=durability)
+
+        for file_path, text_to_write in items:
+            with open(file_path, "r") as f:
+                assert f.read() == text_to_write
+
+        # checking that the group-commit was skipped
+        spy_fsync.assert_not_called()
+
+    # -------------------------------------------
+
+    # -----unittests for the instrumentation----
+    @staticmethod
+    def test_process_textfile_is_silent(capsys, tmp_path):
+        TextfileWriter.process_textfile(
+            text_to_write="Some text", file_path=tmp_path / filename
+        )
+
+        # checking that nothing is printed on the hot path
+        assert capsys.readouterr().out == ""
+
+    @staticmethod
+    def test_process_textfile_instrumentation(monkeypatch, tmp_path):
+        metrics = MetricsInstrumentation()
+        # 'monkeypatch' restores the default instrumentation after the test
+        monkeypatch.setattr(TextfileWriter, "instrumentation", metrics)
+
+        TextfileWriter.process_textfile(
+            text_to_write="Some text", file_path=tmp_path / filename
+        )
+
+        for phase in ("open", "write", "flush", "fsync", "close"):
+            assert metrics.count(phase) == 1
+        assert metrics.count("rollback") == 0
+        assert metrics.total_size("write") == len("Some text")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "text_to_write",
+        [
+            "Jürgen Müller\n",  # a string
+            iter(["Jürgen ", "Müller\n"]),  # a stream of chunks
+        ],
+    )
+    def test_process_textfile_instrumentation_counts_bytes(
+        monkeypatch, tmp_path, text_to_write
+    ):
+        metrics = MetricsInstrumentation()
+        monkeypatch.setattr(TextfileWriter, "instrumentation", metrics)
+        file_path = tmp_path / filename
+
+        TextfileWriter.process_textfile(
+            text_to_write=text_to_write, file_path=file_path, chunk_size=1
+        )
+
+        # the non-ASCII characters take more than one byte each
+        assert metrics.total_size("write") == os.path.getsize(file_path)
+
+    @staticmethod
+    def test_process_textfile_instrumentation_rollback(mocker, monkeypatch, tmp_path):
+        metrics = MetricsInstrumentation()
+        monkeypatch.setattr(TextfileWriter, "instrumentation", metrics)
+
+        mocker.patch.object(
+            TextfileWriter, "_sync_file", side_effect=OSError("flush failed")
+        )
+
+        with pytest.raises(OSError):
+            TextfileWriter.process_textfile(
+                text_to_write="Some text", file_path=tmp_path / filename
+            )
+
+        assert metrics.count("write") == 1
+        assert metrics.count("rollback") == 1
+        assert not os.path.exists(tmp_path / filename)
+
+    @staticmethod
+    def test_process_textfile_instrumentation_failed_fsync(
+        mocker, monkeypatch, tmp_path
+    ):
+        metrics = MetricsInstrumentation()
+        monkeypatch.setattr(TextfileWriter, "instrumentation", metrics)
+
+        mocker.patch("os.fsync", side_effect=OSError("fsync failed"))
+
+        # a failed fsync is recorded as a failure and triggers the rollback
+        # (like in 'process_textfiles')
+        with pytest.raises(OSError, match="fsync failed"):
+            TextfileWriter.process_textfile(
+                text_to_write="Some text", file_path=tmp_path / filename
+            )
+
+        assert metrics.count("fsync") == 0
+        assert metrics.failures("fsync") == 1
+        assert metrics.count("rollback") == 1
+        assert not os.path.exists(tmp_path / filename)
+
+    # -------------------------------------------
+
+    # -----unittests for the binary-mode---------
+    @staticmethod
+    @pytest.mark.parametrize(
+        "make_data",
+        [
+            (lambda: b"Some\x00binary\xffdata"),
+            (lambda: bytearray(b"Some\x00binary\xffdata")),
+            (lambda: memoryview(b"xxSome\x00binary\xffdataxx")[2:-2]),
+            (lambda: (chunk for chunk in [b"Some\x00", b"binary\xff", b"data"])),
+            (lambda: io.BytesIO(b"Some\x00binary\xffdata")),
+        ],
+    )
+    @pytest.mark.parametrize("atomic", [False, True])
+    def test_process_binaryfile_valid_inputs(tmp_path, make_data, atomic: bool):
+        file_path = tmp_path / "data.bin"
+
+        TextfileWriter.process_binaryfile(
+            data=make_data(), file_path=file_path, atomic=atomic, chunk_size=4
+        )
+
+        with open(file_path, "rb") as f:
+            assert f.read() == b"Some\x00binary\xffdata"
+        assert os.listdir(tmp_path) == ["data.bin"]
+
+    @staticmethod
+    @pytest.mark.parametrize("data", [b"Some\x00binary\xffdata" * 1000, b""])
+    def test_process_binaryfile_preallocate(tmp_path, data: bytes):
+        file_path = tmp_path / "data.bin"
+
+        TextfileWriter.process_binaryfile(
+            data=data, file_path=file_path, preallocate=True
+        )
+
+        with open(file_path, "rb") as f:
+            assert f.read() == data
+
+    @staticmethod
+    def test_process_binaryfile_preallocate_invalid_data(tmp_path):
+        with pytest.raises(ValueError):
+            TextfileWriter.process_binaryfile(
+                data=[b"chunk"], file_path=tmp_path / "data.bin", preallocate=True
+            )
+
+    @staticmethod
+    def test_process_binaryfile_from_file(mocker, tmp_path):
+        source_path = tmp_path / "source.bin"
+        source_path.write_bytes(b"Header" + bytes(range(256)) * 100)
+        file_path = tmp_path / "data.bin"
+
+        spy_copy_fd_range = mocker.spy(TextfileWriter, "_copy_fd_range")
+
+        with open(source_path, "rb") as source:
+            # only the remaining content (after the header) is copied
+            source.read(6)
+            TextfileWriter.process_binaryfile(data=source, file_path=file_path)
+
+            # checking that the source was advanced to its end
+            assert source.read() == b""
+
+        with open(file_path, "rb") as f:
+            assert f.read() == bytes(range(256)) * 100
+        spy_copy_fd_range.assert_called_once()
+
+    @staticmethod
+    def test_process_binaryfile_from_file_without_kernel_copy(mocker, tmp_path):
+        source_path = tmp_path / "source.bin"
+        source_path.write_bytes(bytes(range(256)) * 100)
+        file_path = tmp_path / "data.bin"
+
+        # simulating that no kernel copy is supported for these files
+        mocker.patch.object(TextfileWriter, "_copy_fd_range", return_value=None)
+
+        with open(source_path, "rb") as source:
+            TextfileWriter.process_binaryfile(
+                data=source, file_path=file_path, chunk_size=1000
+            )
+
+        with open(file_path, "rb") as f:
+            assert f.read() == bytes(range(256)) * 100
+
+    @staticmethod
+    def test_copy_fd_range_falls_back_to_sendfile(mocker, tmp_path):
+        if not hasattr(os, "copy_file_range") or not hasattr(os, "sendfile"):
+            pytest.skip("requires 'os.copy_file_range' and 'os.sendfile'")
+
+        source_path = tmp_path / "source.bin"
+        source_path.write_bytes(b"Some binary data")
+        file_path = tmp_path / "data.bin"
+
+        # simulating a kernel without support for 'copy_file_range'
+        mocker.patch(
+            "os.copy_file_range",
+            side_effect=OSError(errno.ENOSYS, "not supported"),
+        )
+        spy_sendfile = mocker.spy(os, "sendfile")
+
+        with open(source_path, "rb") as source, open(file_path, "wb") as target:
+            copied_size = TextfileWriter._copy_fd_range(
+                source_fd=source.fileno(), target_fd=target.fileno(), offset=5
+            )
+
+        assert copied_size == len(b"binary data")
+        assert file_path.read_bytes() == b"binary data"
+        assert spy_sendfile.called
+
+    @staticmethod
+    def test_process_binaryfile_check_rollback_functionality(tmp_path):
+        file_path = tmp_path / "data.bin"
+
+        # a generator which fails in the middle of the stream
+        def failing_data():
+            yield b"Some data"
+            raise RuntimeError("stream failed")
+
+        with pytest.raises(RuntimeError, match="stream failed"):
+            TextfileWriter.process_binaryfile(data=failing_data(), file_path=file_path)
+
+        assert not os.path.exists(file_path)
+
+    # -------------------------------------------
@@ -0,0 +1,122 @@
+import json
+import pytest
+
+from unittest_training.projects.textfile_writer.textfile_writer import Durability
+from unittest_training.projects.textfile_writer.textfile_writer_benchmark import (
+    SCENARIOS,
+    compare_results,
+    main,
+    percentile,
+    run_benchmark,
+)
+
+# A configuration which keeps the benchmark-runs in the unittests fast
+TINY_CONFIG = {
+    "small_file_count": 3,
+    "small_file_size": 16,
+    "large_file_count": 1,
+    "large_file_size": 4096,
+    "large_file_chunk_size": 1024,
+    "many_file_batch_count": 2,
+    "many_file_batch_size": 3,
+}
+
+
+class TestTextfileWriterBenchmark:
+    """
+    This class holds the Unittest-cases for the benchmark suite
+    in 'unittest_training.projects.textfile_writer.textfile_writer_benchmark'.
+    """
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "values, q, expected",
+        [
+            ([3.0, 1.0, 2.0], 50, 2.0),
+            ([1.0, 2.0, 3.0, 4.0], 50, 2.0),
+            ([float(i) for i in range(1, 101)], 99, 99.0),
+            ([5.0], 99, 5.0),
+        ],
+    )
+    def test_percentile(values, q, expected):
+        assert percentile(values, q) == expected
+
+    @staticmethod
+    def test_run_benchmark(tmp_path):
+        results = run_benchmark(
+            directory=str(tmp_path),
+            durabilities=[Durability.NONE],
+            config=TINY_CONFIG,
+        )
+
+        assert [result["scenario"] for result in results["results"]] == list(SCENARIOS)
+        for result in results["results"]:
+            assert result["ops_per_sec"] > 0
+            assert result["p50_ms"] <= result["p99_ms"]
+        assert results["results"][1]["bytes"] == 4096
+
+        # checking that the results are machine-readable and nothing is left behind
+        json.dumps(results)
+        assert list(tmp_path.iterdir()) == []
+
+    @staticmethod
+    def test_compare_results():
+        baseline = {
+            "results": [
+                {
+                    "scenario": "small-file",
+                    "durability": "none",
+                    "ops_per_sec": 100.0,
+                    "mb_per_sec": 1.0,
+                    "p50_ms": 1.0,
+                    "p99_ms": 2.0,
+                }
+            ]
+        }
+        current = {
+            "results": [
+                {
+                    "scenario": "small-file",
+                    "durability": "none",
+                    "ops_per_sec": 80.0,  # 20% fewer operations: a regression
+                    "mb_per_sec": 1.05,  # 5% more throughput
+                    "p50_ms": 1.05,  # 5% slower: within the threshold
+                    "p99_ms": 1.0,  # 50% faster
+                }
+            ]
+        }
+
+        comparisons = {
+            comparison["metric"]: comparison
+            for comparison in compare_results(baseline, current, threshold=0.1)
+        }
+
+        assert comparisons["ops_per_sec"]["regression"]
+        assert comparisons["ops_per_sec"]["change"] == pytest.approx(-0.2)
+        assert not comparisons["mb_per_sec"]["regression"]
+        assert not comparisons["p50_ms"]["regression"]
+        assert comparisons["p99_ms"]["change"] == pytest.approx(0.5)
+
+    @staticmethod
+    def test_main_output_and_compare(tmp_path):
+        output_path = tmp_path / "results.json"
+        args = [
+            "--scenario",
+            "small-file",
+            "--durability",
+            "none",
+            "--scale",
+            "0.01",
+            "--directory",
+            str(tmp_path),
+        ]
+
+        assert main([*args, "--output", str(output_path)]) == 0
+
+        results = json.loads(output_path.read_text())
+        assert results["results"][0]["scenario"] == "small-file"
+
+        # comparing against an impossibly fast baseline is a regression
+        results["results"][0]["ops_per_sec"] *= 1000
+        output_path.write_text(json.dumps(results))
+        assert main([*args, "--compare", str(output_path)]) == 1
@@ -0,0 +1,219 @@
+import io
+import json
+import os
+import pytest
+
+from unittest_training.projects.textfile_writer.textfile_writer_cli import main
+
+
+class TestTextfileWriterCli:
+    """
+    This class holds the Unittest-cases for the command-line interface
+    in 'unittest_training.projects.textfile_writer.textfile_writer_cli'.
+    """
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "extra_args",
+        [
+            ([]),
+            (["--atomic"]),
+            (["--durability", "none"]),
+            (["--atomic", "--durability", "fsync+dir"]),
+        ],
+    )
+    def test_main_valid_inputs(tmp_path, extra_args):
+        file_path = tmp_path / "output.txt"
+
+        main(["--text", "Some text", "--filename", str(file_path), *extra_args])
+
+        with open(file_path, "r") as f:
+            assert f.read() == "Some text"
+        assert os.listdir(tmp_path) == ["output.txt"]
+
+    @staticmethod
+    def test_main_missing_arguments():
+        # argparse exits the program if required arguments are missing
+        with pytest.raises(SystemExit):
+            main(["--text", "Some text"])
+
+    @staticmethod
+    def test_main_invalid_durability(tmp_path):
+        file_path = tmp_path / "output.txt"
+
+        with pytest.raises(SystemExit):
+            main(
+                [
+                    "--text",
+                    "Some text",
+                    "--filename",
+                    str(file_path),
+                    "--durability",
+                    "sometimes",
+                ]
+            )
+
+        assert not os.path.exists(file_path)
+
+    # -----unittests for the bulk-mode-----------
+    @staticmethod
+    def test_main_manifest_jsonl(tmp_path, capsys):
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("Text from a source file")
+
+        manifest_path = tmp_path / "manifest.jsonl"
+        manifest_path.write_text(
+            "\n".join(
+                [
+                    json.dumps({"filename": str(tmp_path / "a.txt"), "text": "A"}),
+                    json.dumps({"filename": str(tmp_path / "b.txt"), "text": ""}),
+                    json.dumps(
+                        {
+                            "filename": str(tmp_path / "c.txt"),
+                            "source": str(source_path),
+                        }
+                    ),
+                ]
+            )
+        )
+
+        exit_code = main(["--manifest", str(manifest_path), "--workers", "2"])
+
+        assert exit_code == 0
+        assert (tmp_path / "a.txt").read_text() == "A"
+        assert (tmp_path / "b.txt").read_text() == ""
+        assert (tmp_path / "c.txt").read_text() == "Text from a source file"
+        assert "3 of 3 entries written successfully" in capsys.readouterr().out
+
+    @staticmethod
+    def test_main_manifest_source_is_copied_as_bytes(tmp_path):
+        source_path = tmp_path / "source.txt"
+        # not valid UTF-8, and with Windows line endings
+        source_content = "Grüße\r\nzwei Zeilen\r\n".encode("latin-1")
+        source_path.write_bytes(source_content)
+
+        manifest_path = tmp_path / "manifest.jsonl"
+        manifest_path.write_text(
+            json.dumps(
+                {"filename": str(tmp_path / "copy.txt"), "source": str(source_path)}
+            )
+        )
+
+        exit_code = main(["--manifest", str(manifest_path), "--atomic"])
+
+        assert exit_code == 0
+        assert (tmp_path / "copy.txt").read_bytes() == source_content
+
+    @staticmethod
+    def test_main_manifest_duplicate_destinations(tmp_path, capsys):
+        manifest_path = tmp_path / "manifest.jsonl"
+        manifest_path.write_text(
+            "\n".join(
+                [
+                    json.dumps({"filename": str(tmp_path / "a.txt"), "text": "A"}),
+                    json.dumps({"filename": str(tmp_path / "b.txt"), "text": "B"}),
+                    # the same file as the first entry, via another path
+                    json.dumps(
+                        {"filename": str(tmp_path / "." / "a.txt"), "text": "C"}
+                    ),
+                ]
+            )
+        )
+
+        exit_code = main(["--manifest", str(manifest_path), "--workers", "3"])
+
+        # checking that only the first entry of a file is written
+        assert exit_code == 1
+        assert (tmp_path / "a.txt").read_text() == "A"
+        assert (tmp_path / "b.txt").read_text() == "B"
+        output = capsys.readouterr().out
+        assert "FAILED  #3" in output and "already written by entry #1" in output
+        assert "2 of 3 entries written successfully, 1 failed." in output
+
+    @staticmethod
+    def test_main_manifest_csv_from_stdin(monkeypatch, tmp_path):
+        manifest = io.StringIO(
+            "filename,text\n"
+            f"{tmp_path / 'a.txt'},First text\n"
+            f'{tmp_path / "b.txt"},"Second, quoted text"\n'
+        )
+        monkeypatch.setattr("sys.stdin", manifest)
+
+        exit_code = main(["--manifest", "-", "--manifest-format", "csv", "--atomic"])
+
+        assert exit_code == 0
+        assert (tmp_path / "a.txt").read_text() == "First text"
+        assert (tmp_path / "b.txt").read_text() == "Second, quoted text"
+
+    @staticmethod
+    def test_main_manifest_failing_entries(tmp_path, capsys):
+        manifest_path = tmp_path / "manifest.jsonl"
+        manifest_path.write_text(
+            "\n".join(
+                [
+                    json.dumps({"filename": str(tmp_path / "a.txt"), "text": "A"}),
+                    # the directory does not exist, so the file cannot be created
+                    json.dumps(
+                        {"filename": str(tmp_path / "missing" / "b.txt"), "text": "B"}
+                    ),
+                    "this is not JSON",
+                    json.dumps({"filename": str(tmp_path / "d.txt")}),
+                ]
+            )
+        )
+
+        exit_code = main(["--manifest", str(manifest_path)])
+
+        # checking that the failures do not abort the remaining entries
+        assert exit_code == 1
+        assert (tmp_path / "a.txt").read_text() == "A"
+
+        output = capsys.readouterr().out
+        report_lines = [
+            line for line in output.splitlines() if line.startswith(("OK", "FAILED"))
+        ]
+        assert report_lines[0].startswith("OK")
+        assert report_lines[1].startswith("FAILED") and "FileCreationError" in (
+            report_lines[1]
+        )
+        assert report_lines[2].startswith("FAILED  #3")
+        assert report_lines[3].startswith("FAILED") and "ValueError" in report_lines[3]
+        assert "1 of 4 entries written successfully, 3 failed." in output
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            {"source": 1},  # a file descriptor (stdout) instead of a path
+            {"source": ["a.txt"]},  # invalid source
+            {"text": 5},  # invalid text
+            {"text": "A", "source": "a.txt"},  # both text and source
+        ],
+    )
+    def test_main_manifest_invalid_entry(tmp_path, capsys, entry):
+        manifest_path = tmp_path / "manifest.jsonl"
+        manifest_path.write_text(
+            json.dumps({"filename": str(tmp_path / "a.txt"), **entry})
+        )
+
+        exit_code = main(["--manifest", str(manifest_path)])
+
+        assert exit_code == 1
+        assert not (tmp_path / "a.txt").exists()
+        output = capsys.readouterr().out
+        assert "FAILED" in output and "ValueError" in output
+        assert "0 of 1 entries written successfully, 1 failed." in output
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "args",
+        [
+            (["--manifest", "manifest.jsonl", "--text", "Some text"]),
+            (["--manifest", "manifest.jsonl", "--workers", "0"]),
+        ],
+    )
+    def test_main_manifest_invalid_arguments(args):
+        with pytest.raises(SystemExit):
+            main(args)
+
+    # -------------------------------------------
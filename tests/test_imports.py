@@ -0,0 +1,133 @@
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+import pytest
+
+
+def _import_in_new_process(statement: str) -> Tuple[str, Dict[str, int]]:
+    """
+    Executes 'statement' in a new Python process with '-X importtime',
+    which reports every imported module and its import time.
+
+    Returns:
+        Tuple[str, Dict[str, int]]: The stdout of the process, and the
+                                    cumulative import time (in microseconds)
+                                    per imported module.
+    """
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in completed_process.stderr.splitlines():
+        # e.g. "import time:       252 |      11591 |   concurrent.futures"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        import_times[module.strip()] = int(cumulative)
+
+    return completed_process.stdout, import_times
+
+
+class TestImports:
+    # -----unittests for side-effect-free imports-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "unittest_training",
+            "unittest_training.fixtures.user_manager_fixtures",
+            "unittest_training.projects.textfile_writer.textfile_writer",
+            "unittest_training.projects.textfile_writer.textfile_writer_cli",
+        ],
+    )
+    def test_import_prints_nothing(module):
+        stdout, _ = _import_in_new_process(f"import {module}")
+
+        assert stdout == ""
+
+    @staticmethod
+    def test_import_textfile_writer_computes_no_paths():
+        # the example paths are computed with their first access
+        stdout, _ = _import_in_new_process(
+            "import os\n"
+            "calls = []\n"
+            "original_realpath = os.path.realpath\n"
+            "os.path.realpath = lambda *args, **kwargs: "
+            "calls.append(args) or original_realpath(*args, **kwargs)\n"
+            "from unittest_training.projects.textfile_writer import textfile_writer\n"
+            "print(len(calls))\n"
+            "textfile_writer.file_path\n"
+            "print(len(calls))"
+        )
+
+        assert stdout.split() == ["0", "1"]
+
+    @staticmethod
+    def test_import_package_is_lazy():
+        _, import_times = _import_in_new_process("import unittest_training")
+
+        assert not any(
+            module.startswith("unittest_training.") for module in import_times
+        )
+
+    @staticmethod
+    def test_package_attributes_are_loaded_on_access():
+        stdout, _ = _import_in_new_process(
+            "import unittest_training\n"
+            "from unittest_training.projects.textfile_writer.textfile_writer import "
+            "TextfileWriter\n"
+            "print(unittest_training.TextfileWriter is TextfileWriter)\n"
+            "print('TextfileWriter' in dir(unittest_training))"
+        )
+
+        assert stdout.split() == ["True", "True"]
+
+    @staticmethod
+    def test_package_unknown_attribute():
+        import unittest_training
+
+        with pytest.raises(AttributeError):
+            unittest_training.Unknown
+
+    # -------------------------------------------
+
+    # -----unittests for the import-time of the CLI-----
+    @staticmethod
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "json",  # only needed for manifests
+            "csv",  # only needed for manifests
+            "concurrent.futures",  # only needed for manifests
+            "uuid",  # not needed at all
+            "sqlite3",  # belongs to another sub-project
+            "numpy",  # belongs to another sub-project
+        ],
+    )
+    def test_cli_startup_does_not_import(module):
+        _, import_times = _import_in_new_process(
+            "import unittest_training.projects.textfile_writer.textfile_writer_cli"
+        )
+
+        total_import_time = import_times[
+            "unittest_training.projects.textfile_writer.textfile_writer_cli"
+        ]
+        assert module not in import_times, (
+            f"'{module}' is imported at CLI startup "
+            f"(total import-time: {total_import_time / 1000:.1f} ms)"
+        )
+
+    @staticmethod
+    def test_user_manager_does_not_import_sqlite():
+        _, import_times = _import_in_new_process(
+            "import unittest_training.fixtures.concurrent_user_manager"
+        )
+
+        assert "sqlite3" not in import_times
+
+    # -------------------------------------------